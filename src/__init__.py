@@ -6,6 +6,7 @@ remplace l'ancien workflow en 3 phases pour une génération de grilles plus eff
 """
 from .models.board import Board
 from .models.gaddag import GADDAG
+from .models.flat_gaddag import FlatGADDAG
 from .models.types import Direction, Move
 from .models.graph import ScrabbleGraph, Connection, WordNode
 
@@ -23,6 +24,7 @@ from .services.word_validator import WordValidator
 __all__ = [
     'Board',
     'GADDAG',
+    'FlatGADDAG',
     'Direction',
     'Move',
     'ScrabbleGraph',
@@ -1,8 +1,11 @@
 from typing import Set, Dict
+import os
 import random
 
 from src.models.board import Board
 from src.models.gaddag import GADDAG
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.lexicon_cache import LexiconCache
 from src.models.graph import ScrabbleGraph
 from src.models.types import Direction
 from src.modules.cbic import CBIC_generer_grille
@@ -22,6 +25,19 @@ def charger_dictionnaire(chemin_fichier: str) -> Set[str]:
                 "ARBRE", "FLEUR", "SOLEIL", "LUNE", "ETOILE", "NUAGE"}
 
 
+def charger_gaddag(chemin_fichier: str) -> GADDAG:
+    """
+    Charge le GADDAG de data/<chemin_fichier> depuis le cache des lexiques.
+
+    Le lexique n'est reconstruit que si la liste de mots, les règles de
+    normalisation ou les paramètres de construction ont changé.
+    """
+    source = f"data/{chemin_fichier}"
+    if not os.path.exists(source):
+        return FlatGADDAG.from_word_list(charger_dictionnaire(chemin_fichier))
+    return LexiconCache().get_or_build(source)
+
+
 def initialiser_sac_lettres() -> Dict[str, int]:
     """Initialises le sac de lettres avec la distribution du Scrabble français."""
     return {
@@ -89,15 +105,10 @@ def generer_situation_entrainement(mots_a_reviser: Set[str], dico: Set[str],
 
 def main():
     """Point d'entrée du programme."""
-    # 1. Charger le dictionnaire - Modifier le chemin
-    dico = charger_dictionnaire("ods8.txt")  # Changement ici
-    print(f"\nDictionnaire chargé avec {len(dico)} mots")
-    
-    # 2. Créer le GADDAG
-    gaddag = GADDAG()
-    for mot in dico:
-        gaddag.add_word(mot)
-    print(f"GADDAG créé avec {gaddag.word_count} mots")
+    # 1-2. Charger le GADDAG compilé (compilé au premier lancement)
+    gaddag = charger_gaddag("ods8.txt")
+    print(f"\nGADDAG chargé avec {gaddag.word_count} mots")
+    dico: Set[str] = set()  # Non utilisé par CBIC : la validation passe par le GADDAG
     
     # 3. Définir les mots à réviser et leurs lettres d'appui
     mots_a_reviser = {"CACABERA", "BACCARAS", "BACCARAT"}
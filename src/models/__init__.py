@@ -1,11 +1,32 @@
 from .board import Board
-from .gaddag import GADDAG
+from .gaddag import GADDAG, ReadOnlyGADDAG, ReadOnlyLexiconError
+from .flat_gaddag import FlatGADDAG
+from .dawg import DAWG
+from .radix_gaddag import RadixGADDAG
+from .alphagram_index import AlphagramIndex, DrawResult
+from .draw_catalogue import DrawCatalogue
+from .lexicon_cache import LexiconCache
+from .pattern_query import PatternQuery
+from .query_cache import QueryCache
+from .lexicon_view import LexiconView
 from .types import Direction, Move
 from .graph import ScrabbleGraph, Connection, WordNode
 
 __all__ = [
     'Board',
     'GADDAG',
+    'ReadOnlyGADDAG',
+    'ReadOnlyLexiconError',
+    'FlatGADDAG',
+    'DAWG',
+    'RadixGADDAG',
+    'AlphagramIndex',
+    'DrawResult',
+    'DrawCatalogue',
+    'LexiconCache',
+    'PatternQuery',
+    'QueryCache',
+    'LexiconView',
     'ScrabbleGraph',
     'Connection',
     'WordNode',
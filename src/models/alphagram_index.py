@@ -0,0 +1,97 @@
+"""
+Index des anagrammes par alphagramme (lettres du mot triées).
+
+Répond à la question centrale de l'entraînement : pour un tirage de 7 lettres
+comme AAABCCR, quels sont les mots de 7 lettres (anagrammes) et, pour chaque
+lettre d'appui possible, les mots de 8 lettres obtenus (+E CACABERA,
++S BACCARAS, ...). Chaque réponse coûte une recherche dans un dictionnaire
+pour les anagrammes et au plus 26 pour les appuis.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import string
+from typing import Dict, Iterable, List, Optional
+
+from .gaddag import GADDAG
+
+
+@dataclass
+class DrawResult:
+    """Anagrammes d'un tirage et mots obtenus avec chaque lettre d'appui."""
+    draw: str
+    anagrams: List[str] = field(default_factory=list)
+    extensions: Dict[str, List[str]] = field(default_factory=dict)
+
+    def lines(self) -> List[str]:
+        """Présentation du README : '- MOT' pour les anagrammes, '+ L MOT' pour les appuis."""
+        result = [f"- {word}" for word in self.anagrams]
+        for letter, words in self.extensions.items():
+            result.extend(f"+ {letter} {word}" for word in words)
+        return result
+
+    def __str__(self) -> str:
+        return "\n".join([self.draw] + self.lines())
+
+
+class AlphagramIndex:
+    """Associe chaque alphagramme à la liste triée des mots qui l'ont pour lettres."""
+
+    def __init__(self):
+        self._words: Dict[str, List[str]] = {}
+        self.word_count = 0
+
+    @staticmethod
+    def alphagram(letters: str) -> str:
+        return ''.join(sorted(GADDAG.normalize_word(letters)))
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> 'AlphagramIndex':
+        index = cls()
+        for word in words:
+            index.add_word(word)
+        return index
+
+    @classmethod
+    def from_gaddag(cls, gaddag: GADDAG) -> 'AlphagramIndex':
+        """Construit l'index à partir des mots d'un GADDAG (déjà normalisés)."""
+        return cls.from_words(gaddag.iter_words())
+
+    def add_word(self, word: str) -> None:
+        word = GADDAG.normalize_word(word)
+        if not GADDAG.is_valid_word(word):
+            return
+        words = self._words.setdefault(''.join(sorted(word)), [])
+        position = bisect_right(words, word)
+        if position and words[position - 1] == word:
+            return
+        words.insert(position, word)
+        self.word_count += 1
+
+    def anagrams(self, letters: str) -> List[str]:
+        return list(self._words.get(self.alphagram(letters), ()))
+
+    def extensions(self, letters: str) -> Dict[str, List[str]]:
+        """Mots formés avec une lettre de plus, par lettre d'appui (ordre alphabétique)."""
+        key = self.alphagram(letters)
+        result = {}
+        for letter in string.ascii_uppercase:
+            position = bisect_right(key, letter)
+            words = self._words.get(key[:position] + letter + key[position:])
+            if words:
+                result[letter] = list(words)
+        return result
+
+    def lookup(self, draw: str) -> DrawResult:
+        draw = GADDAG.normalize_word(draw)
+        return DrawResult(draw, self.anagrams(draw), self.extensions(draw))
+
+    def alphagrams(self, length: Optional[int] = None) -> Iterable[str]:
+        """Alphagrammes de l'index, éventuellement restreints à une longueur."""
+        return (key for key in self._words if length is None or len(key) == length)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, letters: str) -> bool:
+        return self.alphagram(letters) in self._words
@@ -1,4 +1,6 @@
+from collections import deque
 from enum import Enum
+from itertools import islice
 from typing import Dict, List, Optional, Tuple, Set
 import string
 import re
@@ -10,6 +12,9 @@ class Board:
     # Taille standard du plateau
     SIZE = 15
     
+    # Dernières modifications gardées en ordre (cf. changes_since)
+    CHANGE_LOG_LENGTH = SIZE * SIZE
+
     # Motif pour valider les coordonnées (ex: 'H8', 'A12')
     COORD_PATTERN = re.compile(r'^([A-O])(\d{1,2})$')
     
@@ -33,6 +38,15 @@ class Board:
         self.used_multipliers = set()
         self.total_score = 0
         self.move_history = []
+        # Cases vides voisines d'une lettre, tenues à jour à chaque pose ou retrait
+        self._anchors: Set[Tuple[int, int]] = set()
+        self._tile_count = 0
+        # Compteur des poses et retraits, cases des dernières modifications et
+        # révision de la dernière modification de chaque case (cf. changes_since) :
+        # taille fixe, quel que soit le nombre de coups
+        self.revision = 0
+        self._recent_changes: deque = deque(maxlen=self.CHANGE_LOG_LENGTH)
+        self._changed_at = [[0] * self.size for _ in range(self.size)]
     
     def debug_print(self, message: str = "") -> None:
         """Affiche l'état actuel de la grille avec un message."""
@@ -64,14 +78,54 @@ class Board:
         if 0 <= row < self.size and 0 <= col < self.size:
             # Ajouter un print de debug
             print(f"Placing {letter} at ({row}, {col})")
+            if not self.grid[row][col]:
+                self._tile_count += 1
             self.grid[row][col] = letter
+            self._square_changed(row, col)
         else:
             raise ValueError(f"Position invalide : ({row}, {col})")
 
     def clear_letter(self, row: int, col: int) -> None:
         """Efface une lettre de la grille."""
         if 0 <= row < self.size and 0 <= col < self.size:
+            if self.grid[row][col]:
+                self._tile_count -= 1
             self.grid[row][col] = None
+            self._square_changed(row, col)
+
+    def _square_changed(self, row: int, col: int) -> None:
+        """Met à jour les ancres autour de la case et note sa révision."""
+        for r, c in ((row, col), (row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < self.size and 0 <= c < self.size:
+                if not self.grid[r][c] and self.is_adjacent_to_letter(r, c):
+                    self._anchors.add((r, c))
+                else:
+                    self._anchors.discard((r, c))
+        self.revision += 1
+        self._recent_changes.append((row, col))
+        self._changed_at[row][col] = self.revision
+
+    @property
+    def anchors(self) -> Set[Tuple[int, int]]:
+        """
+        Cases d'ancrage : cases vides voisines d'une lettre, ou la case
+        centrale sur un plateau vide. Ensemble en lecture seule.
+        """
+        if not self._tile_count:
+            return {(self.center, self.center)}
+        return self._anchors
+
+    def changes_since(self, revision: int) -> Set[Tuple[int, int]]:
+        """
+        Cases posées ou effacées depuis la révision `revision` : lues dans
+        les dernières modifications, en un temps proportionnel à leur nombre,
+        ou par un parcours du plateau si elles remontent plus loin.
+        """
+        missed = self.revision - revision
+        if missed <= len(self._recent_changes):
+            return set(islice(reversed(self._recent_changes), max(0, missed)))
+        return {(row, col) for row, changed in enumerate(self._changed_at)
+                for col, changed_at in enumerate(changed) if changed_at > revision}
     
     def parse_coordinates(self, coord_str: str) -> Tuple[int, int]:
         """Convertit une chaîne de coordonnées (ex: 'H8') en indices (row, col)."""
@@ -212,7 +266,7 @@ class Board:
         for i, _ in enumerate(last_move.word):
             row = last_move.row + (i if last_move.direction == Direction.VERTICAL else 0)
             col = last_move.col + (i if last_move.direction == Direction.HORIZONTAL else 0)
-            self.grid[row][col] = None
+            self.clear_letter(row, col)
             
         return last_move, score
 
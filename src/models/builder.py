@@ -0,0 +1,175 @@
+"""
+Construction et mise à jour incrémentales d'un automate minimal.
+
+Implémente l'algorithme de Daciuk et al. (2000) pour des entrées triées : à
+chaque insertion, la partie du chemin précédent qui n'est plus partagée avec
+la nouvelle séquence ne changera plus ; elle est donc remplacée par un état
+équivalent déjà enregistré, ou enregistrée à son tour. L'automate non
+minimisé n'existe jamais en entier et aucune récursion n'est nécessaire.
+
+`CopyOnWriteUpdater` modifie ensuite un automate minimal déjà construit, où
+des états sont partagés entre plusieurs chemins : les états rencontrés sont
+copiés avant écriture (copie de chemin), puis les copies sont fusionnées
+avec les états équivalents du registre, des plus profondes à la racine.
+Les états enregistrés ne sont jamais modifiés ; une ancienne racine reste
+donc une version valide du lexique.
+"""
+
+from typing import Callable, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple
+
+from .node import Node
+
+
+class IncrementalBuilder:
+    """Construit un automate minimal en insérant des séquences triées."""
+
+    def __init__(self):
+        self.root = Node()
+        self.register: Dict[Tuple, Node] = {}
+        self.sequence_count = 0
+        self._path: List[Node] = [self.root]  # états du chemin de la séquence précédente
+        self._previous = ""
+
+    @staticmethod
+    def signature(node: Node) -> Tuple:
+        # Les cibles sont des états déjà enregistrés, donc canoniques : leur id suffit.
+        return (node.is_terminal,
+                tuple((char, id(target)) for char, target in node.transitions.items()))
+
+    def insert(self, sequence: str, terminal: int = True) -> None:
+        """
+        Ajoute une séquence, qui doit suivre la précédente dans l'ordre lexicographique.
+
+        `terminal` est la marque de fin de séquence : True, ou un masque de
+        lexiques (cf. `GADDAG.from_lexicons`) ; une séquence répétée cumule ses marques.
+        """
+        previous = self._previous
+        if sequence == previous and self.sequence_count:
+            self._path[-1].is_terminal |= terminal
+            return
+        if sequence < previous:
+            raise ValueError(f"Séquences non triées: '{sequence}' après '{previous}'")
+
+        common = 0
+        max_common = min(len(previous), len(sequence))
+        while common < max_common and previous[common] == sequence[common]:
+            common += 1
+
+        self._replace_or_register(common)
+
+        node = self._path[-1]
+        for char in sequence[common:]:
+            child = Node()
+            node.transitions[char] = child
+            self._path.append(child)
+            node = child
+        node.is_terminal = terminal
+
+        self._previous = sequence
+        self.sequence_count += 1
+
+    def insert_all(self, sequences: Iterable[str]) -> None:
+        for sequence in sequences:
+            self.insert(sequence)
+
+    def finish(self) -> Node:
+        """Minimise le dernier chemin ouvert et retourne la racine."""
+        self._replace_or_register(0)
+        return self.root
+
+    def _replace_or_register(self, depth: int) -> None:
+        # Fige les états du chemin précédent situés après `depth`, du plus profond au plus proche.
+        path = self._path
+        previous = self._previous
+        for i in range(len(path) - 1, depth, -1):
+            child = path[i]
+            signature = self.signature(child)
+            existing = self.register.get(signature)
+            if existing is not None:
+                path[i - 1].transitions[previous[i - 1]] = existing
+            else:
+                self.register[signature] = child
+        del path[depth + 1:]
+
+
+def canonical_signature(node: Node) -> Tuple:
+    """Signature indépendante de l'ordre d'insertion des transitions."""
+    return (node.is_terminal,
+            tuple(sorted((char, id(target)) for char, target in node.transitions.items())))
+
+
+class CopyOnWriteUpdater:
+    """
+    Ajoute et retire des séquences d'un automate minimal sans toucher aux états partagés.
+
+    `register` associe la signature canonique de chaque état enregistré à cet
+    état ; il est mis à jour par `finish`. Si `annotate` est fourni, il
+    calcule l'annotation d'un état (cf. `GADDAG.combine_annotations`) et
+    seules les copies sont réannotées.
+    """
+
+    def __init__(self, root: Node, register: MutableMapping[Tuple, Node],
+                 annotate: Optional[Callable[[Node], Tuple[int, int, int]]] = None):
+        self.register = register
+        self.annotate = annotate
+        self._private: Set[int] = set()  # ids des copies, modifiables jusqu'à `finish`
+        self.root = self._writable(root)
+
+    def _writable(self, node: Node) -> Node:
+        if id(node) in self._private:
+            return node
+        copy = Node()
+        copy.transitions = dict(node.transitions)
+        copy.is_terminal = node.is_terminal
+        self._private.add(id(copy))
+        return copy
+
+    def set_terminal(self, sequence: str, terminal: int) -> None:
+        """Donne la marque `terminal` (booléen ou masque de lexiques) à la fin d'une séquence."""
+        node = self.root
+        if not terminal:
+            # Retrait : rien à copier si la séquence est absente
+            for char in sequence:
+                node = node.transitions.get(char)
+                if node is None:
+                    return
+            node = self.root
+        for char in sequence:
+            child = node.transitions.get(char)
+            if child is None:
+                child = Node()
+                self._private.add(id(child))
+            else:
+                child = self._writable(child)
+            node.transitions[char] = child
+            node = child
+        node.is_terminal = terminal
+
+    def finish(self) -> Node:
+        """Supprime les états morts, fusionne les copies et retourne la nouvelle racine."""
+        private = self._private
+        order = []
+        stack = [(self.root, None, '')]
+        while stack:
+            node, parent, char = stack.pop()
+            order.append((node, parent, char))
+            for next_char, child in node.transitions.items():
+                if id(child) in private:
+                    stack.append((child, node, next_char))
+
+        # Ordre préfixe inversé : chaque copie est traitée après ses descendants
+        for node, parent, char in reversed(order):
+            if parent is not None:
+                if not node.transitions and not node.is_terminal:
+                    del parent.transitions[char]
+                    continue
+                signature = canonical_signature(node)
+                existing = self.register.get(signature)
+                if existing is not None:
+                    parent.transitions[char] = existing
+                    continue
+                self.register[signature] = node
+            if self.annotate is not None:
+                node.annotation = self.annotate(node)
+        private.clear()
+        return self.root
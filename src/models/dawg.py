@@ -0,0 +1,133 @@
+"""
+DAWG (automate minimal des mots lus de gauche à droite), pour la validation seule.
+
+Le générateur CBIC et `WordValidator` ne font que des tests d'appartenance
+(cf. `WordLexicon`) : ils n'ont pas besoin des L+1 rotations du GADDAG. Le
+DAWG ne contient qu'une séquence par mot ; un test d'appartenance est un
+unique parcours en O(L), et la structure occupe environ 1/L de la mémoire du
+GADDAG équivalent. Il réutilise le stockage en tableaux plats et le format
+binaire de `FlatGADDAG` (avec son propre marqueur de fichier), mais n'expose
+aucune recherche propre au GADDAG (contrôles croisés, squelettes, motifs,
+génération de coups) : sans rotations, elles donneraient de faux résultats.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .builder import IncrementalBuilder
+from .flat_gaddag import FlatGADDAG
+from .gaddag import GADDAG
+
+
+class _Automaton(FlatGADDAG):
+    """Tableaux plats d'un automate sans rotations : les mots partent du premier état."""
+
+    FILE_MAGIC = b'DAWG'
+
+    def forward_state(self) -> int:
+        return self.start_state()
+
+
+class DAWG:
+    """Lexique de validation : `contains` / `contains_normalized`, comme `GADDAG`."""
+
+    FILE_MAGIC = _Automaton.FILE_MAGIC
+
+    def __init__(self, automaton: _Automaton):
+        self._automaton = automaton
+
+    @classmethod
+    def from_sorted_words(cls, words: List[str],
+                          masks: Optional[Dict[str, int]] = None) -> 'DAWG':
+        builder = IncrementalBuilder()
+        if masks is None:
+            builder.insert_all(words)
+        else:
+            for word in words:
+                builder.insert(word, masks[word])
+        # Le DAWG à nœuds n'est qu'une étape : il est aussitôt compilé en tableaux.
+        automaton = GADDAG()
+        automaton.root = builder.finish()
+        automaton.word_count = len(words)
+        return cls(_Automaton.from_gaddag(automaton))
+
+    @classmethod
+    def from_word_list(cls, words: List[str]) -> 'DAWG':
+        return cls.from_sorted_words(GADDAG.prepare_words(words))
+
+    @classmethod
+    def from_lexicons(cls, lexicons: Dict[str, Iterable[str]]) -> 'DAWG':
+        """DAWG de plusieurs lexiques nommés (cf. `GADDAG.from_lexicons`)."""
+        return cls.from_gaddag(GADDAG.from_lexicons(lexicons))
+
+    @classmethod
+    def from_gaddag(cls, gaddag: GADDAG) -> 'DAWG':
+        """Extrait le DAWG compagnon d'un GADDAG (branche après le délimiteur)."""
+        words = list(gaddag.iter_words())
+        if not gaddag.lexicon_names:
+            return cls.from_sorted_words(words)
+        dawg = cls.from_sorted_words(words, {word: gaddag._word_terminal(word) for word in words})
+        dawg._automaton.lexicon_names = list(gaddag.lexicon_names)
+        return dawg
+
+    @property
+    def word_count(self) -> int:
+        return self._automaton.word_count
+
+    @property
+    def lexicon_names(self) -> List[str]:
+        return self._automaton.lexicon_names
+
+    def lexicon_mask(self, lexicon=None) -> int:
+        return self._automaton.lexicon_mask(lexicon)
+
+    def contains(self, word: str, lexicon=None) -> bool:
+        word = GADDAG.normalize_word(word)
+        if not GADDAG.is_valid_word(word):
+            return False
+        return self.contains_normalized(word, lexicon)
+
+    def contains_normalized(self, word: str, lexicon=None) -> bool:
+        """Appartenance d'un mot déjà normalisé (A-Z majuscules) : un seul parcours."""
+        state = self._automaton.walk(word)
+        return state is not None and bool(self._automaton.terminal_mask(state)
+                                          & self.lexicon_mask(lexicon))
+
+    def iter_words(self, lexicon=None) -> Iterator[str]:
+        """Énumère les mots du lexique dans l'ordre alphabétique."""
+        return self._automaton.iter_words(lexicon)
+
+    # Primitives de parcours (cf. `lexicon_stats`)
+
+    def start_state(self) -> int:
+        return self._automaton.start_state()
+
+    def step(self, state: int, char: str) -> Optional[int]:
+        return self._automaton.step(state, char)
+
+    def edges(self, state: int) -> List[Tuple[str, int]]:
+        return self._automaton.edges(state)
+
+    def terminal_mask(self, state: int) -> int:
+        return self._automaton.terminal_mask(state)
+
+    def walk_hops(self, sequence: str, state: Optional[int] = None) -> int:
+        return self._automaton.walk_hops(sequence, state)
+
+    def memory_usage(self) -> int:
+        return self._automaton.memory_usage()
+
+    def get_statistics(self) -> Dict[str, int]:
+        return self._automaton.get_statistics()
+
+    # Format binaire
+
+    def save(self, path: str) -> None:
+        self._automaton.save(path)
+
+    @classmethod
+    def open(cls, path: str) -> 'DAWG':
+        """Projette un DAWG compilé en mémoire (cf. `FlatGADDAG.open`)."""
+        return cls(_Automaton.open(path))
+
+    def close(self) -> None:
+        self._automaton.close()
@@ -0,0 +1,255 @@
+"""
+Catalogue « tirage + appui » précalculé pour tout un lexique.
+
+Pour chaque alphagramme de 7 lettres qui donne un mot de 7 lettres (anagramme)
+ou de 8 lettres (avec une lettre d'appui), le catalogue stocke la fiche du
+README (« - MOT », « + L MOT »). Les mots sont lus dans le GADDAG et le
+calcul est réparti sur un pool de processus par paquets d'alphagrammes de
+même début ; les fiches de chaque paquet sont écrites, dans l'ordre, en flux
+dans un fichier indexé :
+
+    en-tête | fiches UTF-8 | index trié (alphagramme, position, taille)
+
+`DrawCatalogue.open` projette le fichier en mémoire et retrouve une fiche par
+recherche dichotomique dans l'index, sans rien calculer à la demande.
+"""
+
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import contextlib
+import mmap
+import os
+import struct
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .alphagram_index import AlphagramIndex, DrawResult
+from .gaddag import GADDAG
+
+CATALOGUE_MAGIC = b'TIRA'
+CATALOGUE_VERSION = 1
+# magic, version, longueur des tirages, nombre de fiches, position de l'index
+CATALOGUE_HEADER = struct.Struct('<4sHHIQ')
+DEFAULT_DRAW_LENGTH = 7
+SHARD_SIZE = 5000
+# Les mots sont répartis en paquets selon les premières lettres des alphagrammes de tirage
+PREFIX_LENGTH = 2
+
+Extensions = Dict[str, Dict[str, List[str]]]
+# Paquet de calcul : (longueur des tirages, débuts d'alphagramme couverts, mots)
+Shard = Tuple[int, Tuple[str, ...], List[str]]
+
+
+def extensions_shard(words: List[str]) -> Extensions:
+    """Pour des mots de L+1 lettres : alphagramme de L lettres -> lettre d'appui -> mots."""
+    result: Extensions = defaultdict(lambda: defaultdict(list))
+    for word in words:
+        key = ''.join(sorted(word))
+        for i, letter in enumerate(key):
+            if i and key[i - 1] == letter:
+                continue  # même lettre retirée : même alphagramme
+            result[key[:i] + key[i + 1:]][letter].append(word)
+    return {draw: dict(letters) for draw, letters in result.items()}
+
+
+def draw_prefixes(word: str, draw_length: int) -> Set[str]:
+    """Débuts (`PREFIX_LENGTH` lettres) des alphagrammes de tirage auxquels contribue un mot."""
+    key = ''.join(sorted(word))
+    if len(key) == draw_length:
+        return {key[:PREFIX_LENGTH]}
+    return {(key[:i] + key[i + 1:])[:PREFIX_LENGTH] for i in range(len(key))}
+
+
+def catalogue_shard(shard: Shard) -> List[DrawResult]:
+    """Fiches, triées, des alphagrammes qui commencent par l'un des débuts du paquet."""
+    draw_length, prefixes, words = shard
+    wanted = set(prefixes)
+    results: Dict[str, DrawResult] = {}
+    for word in words:
+        key = ''.join(sorted(word))
+        if len(word) == draw_length and key[:PREFIX_LENGTH] in wanted:
+            results.setdefault(key, DrawResult(key)).anagrams.append(word)
+    longer = [word for word in words if len(word) == draw_length + 1]
+    for draw, letters in extensions_shard(longer).items():
+        if draw[:PREFIX_LENGTH] in wanted:
+            results.setdefault(draw, DrawResult(draw)).extensions = letters
+    for result in results.values():
+        result.anagrams.sort()
+        result.extensions = {letter: sorted(result.extensions[letter])
+                             for letter in sorted(result.extensions)}
+    return [results[draw] for draw in sorted(results)]
+
+
+def compute_catalogue(gaddag: GADDAG, draw_length: int = DEFAULT_DRAW_LENGTH,
+                      workers: Optional[int] = None, lexicon=None) -> Iterator[DrawResult]:
+    """
+    Fiches de tous les alphagrammes de `draw_length` lettres d'un lexique,
+    produites dans l'ordre des alphagrammes au fil du calcul.
+
+    Les mots de `draw_length` et `draw_length` + 1 lettres sont lus dans le
+    GADDAG et rangés selon le début des alphagrammes de tirage qu'ils
+    forment ; des débuts consécutifs sont regroupés en paquets d'au moins
+    `SHARD_SIZE` mots. Chaque paquet donne une suite triée de fiches et les
+    paquets se suivent dans l'ordre : les fiches sont produites dès qu'un
+    paquet est calculé, sans garder le catalogue en mémoire.
+    """
+    buckets: Dict[str, List[str]] = defaultdict(list)
+    for word in gaddag.iter_words_matching('*', draw_length, draw_length + 1, lexicon=lexicon):
+        for prefix in draw_prefixes(word, draw_length):
+            buckets[prefix].append(word)
+    shards: List[Shard] = []
+    prefixes: List[str] = []
+    words: Dict[str, None] = {}  # un mot peut relever de plusieurs débuts du même paquet
+    for prefix in sorted(buckets):
+        prefixes.append(prefix)
+        words.update(dict.fromkeys(buckets.pop(prefix)))
+        if len(words) >= SHARD_SIZE:
+            shards.append((draw_length, tuple(prefixes), list(words)))
+            prefixes, words = [], {}
+    if prefixes:
+        shards.append((draw_length, tuple(prefixes), list(words)))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(shards) <= 1:
+        for shard in shards:
+            yield from catalogue_shard(shard)
+        return
+    workers = min(workers, len(shards))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Au plus deux paquets d'avance par processus : les fiches calculées restent peu nombreuses
+        pending: Deque[Future] = deque()
+        for shard in shards:
+            pending.append(pool.submit(catalogue_shard, shard))
+            if len(pending) > 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def build_catalogue(gaddag: GADDAG, path: str, draw_length: int = DEFAULT_DRAW_LENGTH,
+                    workers: Optional[int] = None) -> int:
+    """Calcule le catalogue d'un lexique et l'écrit dans `path` ; retourne le nombre de fiches."""
+    return write_catalogue(path, compute_catalogue(gaddag, draw_length, workers), draw_length)
+
+
+def write_catalogue(path: str, results: Iterable[DrawResult],
+                    draw_length: int = DEFAULT_DRAW_LENGTH) -> int:
+    """Écrit en flux des fiches triées par alphagramme, puis leur index ; retourne leur nombre."""
+    entry = struct.Struct(f'<{draw_length}sQI')
+    index: List[Tuple[bytes, int, int]] = []
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(bytes(CATALOGUE_HEADER.size))
+            previous = None
+            for result in results:
+                key = result.draw.encode('ascii')
+                if len(key) != draw_length or (previous is not None and key <= previous):
+                    raise ValueError(f"Fiches non triées ou de longueur invalide: {result.draw}")
+                data = "\n".join(result.lines()).encode('utf-8')
+                index.append((key, f.tell(), len(data)))
+                f.write(data)
+                previous = key
+            index_offset = f.tell()
+            for key, offset, size in index:
+                f.write(entry.pack(key, offset, size))
+            f.seek(0)
+            f.write(CATALOGUE_HEADER.pack(CATALOGUE_MAGIC, CATALOGUE_VERSION, draw_length,
+                                          len(index), index_offset))
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):  # échec avant la création du fichier
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return len(index)
+
+
+class DrawCatalogue:
+    """Accès direct, par alphagramme, à un catalogue écrit par `write_catalogue`."""
+
+    def __init__(self, buffer: mmap.mmap, draw_length: int, count: int, index_offset: int):
+        self._buffer = buffer
+        self.draw_length = draw_length
+        self._count = count
+        self._index_offset = index_offset
+        self._entry = struct.Struct(f'<{draw_length}sQI')
+
+    @classmethod
+    def open(cls, path: str) -> 'DrawCatalogue':
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Catalogue non trouvé: {path}")
+        if len(buffer) < CATALOGUE_HEADER.size:
+            buffer.close()
+            raise ValueError(f"Catalogue tronqué: {path}")
+        magic, version, draw_length, count, index_offset = CATALOGUE_HEADER.unpack_from(buffer)
+        if magic != CATALOGUE_MAGIC or version != CATALOGUE_VERSION:
+            buffer.close()
+            raise ValueError(f"Format de catalogue non supporté: {path}")
+        catalogue = cls(buffer, draw_length, count, index_offset)
+        if index_offset + count * catalogue._entry.size != len(buffer):
+            buffer.close()
+            raise ValueError(f"Catalogue tronqué: {path}")
+        return catalogue
+
+    def _entry_at(self, position: int) -> Tuple[bytes, int, int]:
+        return self._entry.unpack_from(self._buffer, self._index_offset + position * self._entry.size)
+
+    def lookup(self, draw: str) -> Optional[DrawResult]:
+        """Fiche d'un tirage (dans n'importe quel ordre), ou None s'il ne donne aucun mot."""
+        key = AlphagramIndex.alphagram(draw)
+        if len(key) != self.draw_length:
+            return None
+        target = key.encode('ascii')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry_key, offset, size = self._entry_at(middle)
+            if entry_key < target:
+                low = middle + 1
+            elif entry_key > target:
+                high = middle
+            else:
+                return self._parse(key, self._buffer[offset:offset + size].decode('utf-8'))
+        return None
+
+    @staticmethod
+    def _parse(draw: str, text: str) -> DrawResult:
+        result = DrawResult(draw)
+        for line in text.splitlines():
+            if line.startswith("- "):
+                result.anagrams.append(line[2:])
+            else:
+                _, letter, word = line.split(" ")
+                result.extensions.setdefault(letter, []).append(word)
+        return result
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._entry_at(position)[0].decode('ascii')
+
+    def __contains__(self, draw: str) -> bool:
+        return self.lookup(draw) is not None
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from .lexicon_cache import LexiconCache
+
+    parser = argparse.ArgumentParser(description="Précalcule le catalogue tirage + appui d'un lexique.")
+    parser.add_argument("source", help="Fichier texte, un mot par ligne")
+    parser.add_argument("target", help="Catalogue indexé à produire")
+    parser.add_argument("--longueur", type=int, default=DEFAULT_DRAW_LENGTH)
+    parser.add_argument("--processus", type=int, default=None)
+    args = parser.parse_args()
+    lexicon = LexiconCache(workers=args.processus).get_or_build(args.source)
+    count = build_catalogue(lexicon, args.target, args.longueur, args.processus)
+    print(f"{count} tirages de {args.longueur} lettres -> {args.target}")
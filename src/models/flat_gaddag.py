@@ -0,0 +1,326 @@
+"""
+GADDAG compilé dans des tableaux plats d'entiers.
+
+Chaque état est un indice entier. Les transitions sortantes d'un état sont
+stockées de façon contiguë, triées par code de lettre, dans `_edge_letters` /
+`_edge_targets` ; `_first_edge[i]` donne la position de la première transition
+de l'état i (avec une sentinelle en fin de tableau). `_masks[i]` est le masque
+des codes de lettres sortants : le rang d'une transition s'obtient par un
+simple popcount, sans dictionnaire ni objet Python par nœud.
+
+`_terminals[i]` est le jeu de bits des lexiques qui acceptent l'état
+(cf. `GADDAG.from_lexicons`), 0 pour un état non terminal.
+
+Format binaire (`save` / `open`) : un en-tête fixe suivi des tableaux bruts,
+d'abord ceux en uint32 puis ceux en uint8, pour que chaque section reste
+alignée, et enfin des noms des lexiques (UTF-8, un par ligne). `open`
+projette le fichier en mémoire (mmap) et parcourt les tableaux en place :
+aucune désérialisation, et plusieurs processus partagent la même copie dans
+le cache de pages.
+"""
+
+from array import array
+from collections import deque
+import mmap
+import os
+import string
+import struct
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .gaddag import GADDAG, ReadOnlyGADDAG
+from .node import Node
+
+# Codes des symboles : A-Z -> 0..25, délimiteur -> 26
+LETTERS = string.ascii_uppercase + GADDAG.DELIMITER
+LETTER_CODES: Dict[str, int] = {char: code for code, char in enumerate(LETTERS)}
+
+# En-tête du fichier : magic, version, ordre des octets, nb états, nb transitions, nb mots,
+# taille du bloc des noms de lexiques
+FILE_MAGIC = b'GDAG'
+FILE_VERSION = 3
+HEADER = struct.Struct('<4sHHIIII')
+# Sections du fichier, dans l'ordre : (attribut, type, taille en états 'n' ou transitions 'e')
+SECTIONS = (
+    ('_masks', 'I', 'n'), ('_first_edge', 'I', 'n+1'), ('_edge_targets', 'I', 'e'),
+    ('_reach', 'I', 'n'), ('_terminals', 'B', 'n'), ('_edge_letters', 'B', 'e'),
+    ('_min_remaining', 'B', 'n'), ('_max_remaining', 'B', 'n'),
+)
+
+
+class FlatNode:
+    """Vue en lecture seule d'un état, compatible avec l'interface de `Node`."""
+
+    __slots__ = ('_gaddag', 'index')
+
+    def __init__(self, gaddag: 'FlatGADDAG', index: int):
+        self._gaddag = gaddag
+        self.index = index
+
+    @property
+    def is_terminal(self) -> bool:
+        return self._gaddag.is_terminal_state(self.index)
+
+    @property
+    def transitions(self) -> Dict[str, 'FlatNode']:
+        return {char: FlatNode(self._gaddag, target)
+                for char, target in self._gaddag.edges(self.index)}
+
+    def get_transition(self, char: str) -> Optional['FlatNode']:
+        target = self._gaddag.step(self.index, char)
+        return None if target is None else FlatNode(self._gaddag, target)
+
+    def has_transition(self, char: str) -> bool:
+        return self._gaddag.step(self.index, char) is not None
+
+    def add_transition(self, char: str, node: Optional[Node] = None) -> Node:
+        raise self._gaddag._read_only()
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, FlatNode) and other._gaddag is self._gaddag
+                and other.index == self.index)
+
+    def __hash__(self) -> int:
+        return hash(self.index)
+
+
+class FlatGADDAG(ReadOnlyGADDAG):
+    """
+    Backend GADDAG en lecture seule, stocké dans des tableaux d'entiers.
+
+    Expose la même API que `GADDAG` (`contains`, `get_possible_letters`,
+    `find_words_with_skeleton`, primitives de parcours). Se construit à partir
+    d'un `GADDAG` existant, de préférence minimisé.
+    """
+
+    FILE_MAGIC = FILE_MAGIC
+
+    def __init__(self):
+        super().__init__()  # aucun nœud Python n'est alloué
+        self.word_count = 0
+        self.version = 0
+        self._masks = array('I')          # masque des codes sortants, par état
+        self._terminals = array('B')      # lexiques qui acceptent l'état (0 : non terminal)
+        self._first_edge = array('I', [0])  # début des transitions (+ sentinelle)
+        self._edge_letters = array('B')   # code de lettre de chaque transition
+        self._edge_targets = array('I')   # état cible de chaque transition
+        self._reach = array('I')          # annotations (cf. GADDAG.annotate)
+        self._min_remaining = array('B')
+        self._max_remaining = array('B')
+        self.annotated = False
+        self.lexicon_names: List[str] = []
+        self._mmap = None                 # projection mémoire (cf. `open`)
+        self._view = None
+        self.path: Optional[str] = None   # fichier projeté par `open`
+
+    @classmethod
+    def from_gaddag(cls, gaddag: GADDAG) -> 'FlatGADDAG':
+        """Compile un GADDAG à nœuds en tableaux plats (parcours en largeur)."""
+        flat = cls()
+        flat.word_count = gaddag.word_count
+        flat.lexicon_names = list(gaddag.lexicon_names)
+
+        # États indexés par eux-mêmes (nœuds, indices des tableaux ou positions radix)
+        root = gaddag.start_state()
+        index_of = {root: 0}
+        order: List = [root]
+        queue = deque([root])
+        while queue:
+            state = queue.popleft()
+            for _, target in gaddag.edges(state):
+                if target not in index_of:
+                    index_of[target] = len(order)
+                    order.append(target)
+                    queue.append(target)
+
+        for state in order:
+            mask = 0
+            for code, target in sorted((LETTER_CODES[char], target)
+                                       for char, target in gaddag.edges(state)):
+                mask |= 1 << code
+                flat._edge_letters.append(code)
+                flat._edge_targets.append(index_of[target])
+            flat._masks.append(mask)
+            flat._terminals.append(int(gaddag.terminal_mask(state)))
+            flat._first_edge.append(len(flat._edge_targets))
+        flat.annotate()
+        return flat
+
+    @classmethod
+    def from_word_list(cls, words: List[str], incremental: bool = True) -> 'FlatGADDAG':
+        gaddag = GADDAG.from_word_list(words, incremental=incremental)
+        if not incremental:
+            gaddag.semi_minimize()
+        return cls.from_gaddag(gaddag)
+
+    @classmethod
+    def from_sorted_words(cls, words: List[str],
+                          masks: Optional[Dict[str, int]] = None) -> 'FlatGADDAG':
+        return cls.from_gaddag(GADDAG.from_sorted_words(words, masks))
+
+    @classmethod
+    def from_lexicons(cls, lexicons: Dict[str, Iterable[str]]) -> 'FlatGADDAG':
+        return cls.from_gaddag(GADDAG.from_lexicons(lexicons))
+
+    def save(self, path: str) -> None:
+        """Écrit la structure au format binaire (écriture atomique)."""
+        byteorder = 0 if sys.byteorder == 'little' else 1
+        names = "\n".join(self.lexicon_names).encode('utf-8')
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(self.FILE_MAGIC, FILE_VERSION, byteorder,
+                                len(self._masks), len(self._edge_targets), self.word_count,
+                                len(names)))
+            for name, _, _ in SECTIONS:
+                f.write(getattr(self, name))
+            f.write(names)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: str) -> 'FlatGADDAG':
+        """Projette un fichier compilé en mémoire, sans le désérialiser."""
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"GADDAG compilé non trouvé: {path}")
+
+        if len(buffer) < HEADER.size:
+            buffer.close()
+            raise ValueError(f"Fichier GADDAG tronqué: {path}")
+        magic, version, byteorder, node_count, edge_count, word_count, names_size = \
+            HEADER.unpack_from(buffer)
+        if magic != cls.FILE_MAGIC or version != FILE_VERSION:
+            buffer.close()
+            raise ValueError(f"Format de GADDAG non supporté: {path} "
+                             f"(magic={magic!r}, version={version})")
+        if byteorder != (0 if sys.byteorder == 'little' else 1):
+            buffer.close()
+            raise ValueError(f"Ordre des octets incompatible: {path}")
+
+        sizes = {'n': node_count, 'n+1': node_count + 1, 'e': edge_count}
+        sections = [(name, code, sizes[size]) for name, code, size in SECTIONS]
+        names_offset = HEADER.size + sum(array(code).itemsize * n for _, code, n in sections)
+        if len(buffer) != names_offset + names_size:
+            buffer.close()
+            raise ValueError(f"Fichier GADDAG tronqué: {path}")
+
+        flat = cls()
+        flat.word_count = word_count
+        flat._mmap = buffer
+        flat._view = view = memoryview(buffer)
+        offset = HEADER.size
+        for name, code, n in sections:
+            size = array(code).itemsize * n
+            setattr(flat, name, view[offset:offset + size].cast(code))
+            offset += size
+        names = buffer[names_offset:names_offset + names_size].decode('utf-8')
+        flat.lexicon_names = names.split("\n") if names else []
+        flat.annotated = True
+        flat.path = path
+        return flat
+
+    def close(self) -> None:
+        """Libère la projection mémoire d'une structure ouverte avec `open`."""
+        buffer = self._mmap
+        if buffer is None:
+            return
+        for name, code, _ in SECTIONS:
+            getattr(self, name).release()
+            setattr(self, name, array(code))
+        self._view.release()
+        buffer.close()
+        self._mmap = self._view = self.path = None
+
+    @property
+    def root(self) -> FlatNode:
+        return FlatNode(self, 0)
+
+    def start_state(self) -> int:
+        return 0
+
+    def step(self, state: int, char: str) -> Optional[int]:
+        code = LETTER_CODES.get(char)
+        if code is None:
+            return None
+        bit = 1 << code
+        mask = self._masks[state]
+        if not mask & bit:
+            return None
+        return self._edge_targets[self._first_edge[state] + (mask & (bit - 1)).bit_count()]
+
+    def edges(self, state: int):
+        letters = self._edge_letters
+        targets = self._edge_targets
+        return [(LETTERS[letters[i]], targets[i])
+                for i in range(self._first_edge[state], self._first_edge[state + 1])]
+
+    def is_terminal_state(self, state: int) -> bool:
+        return self._terminals[state] != 0
+
+    def terminal_mask(self, state: int) -> int:
+        return self._terminals[state]
+
+    def annotation(self, state: int) -> Tuple[int, int, int]:
+        return self._reach[state], self._min_remaining[state], self._max_remaining[state]
+
+    def _store_annotations(self, annotations: Dict[int, Tuple[int, int, int]]) -> None:
+        count = len(self._masks)
+        self._reach = array('I', [0]) * count
+        self._min_remaining = array('B', [0]) * count
+        self._max_remaining = array('B', [0]) * count
+        for state, (reach, low, high) in annotations.items():
+            self._reach[state] = reach
+            self._min_remaining[state] = low
+            self._max_remaining[state] = high
+
+    def walk(self, sequence: str, state: Optional[int] = None) -> Optional[int]:
+        # Version déroulée de GADDAG.walk : c'est la boucle la plus chaude.
+        if state is None:
+            state = 0
+        masks = self._masks
+        first_edge = self._first_edge
+        targets = self._edge_targets
+        for char in sequence:
+            code = LETTER_CODES.get(char)
+            if code is None:
+                return None
+            bit = 1 << code
+            mask = masks[state]
+            if not mask & bit:
+                return None
+            state = targets[first_edge[state] + (mask & (bit - 1)).bit_count()]
+        return state
+
+    def memory_usage(self) -> int:
+        """Taille en octets des tableaux de la structure."""
+        return sum(len(table) * table.itemsize
+                   for table in (getattr(self, name) for name, _, _ in SECTIONS))
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            'word_count': self.word_count,
+            'node_count': len(self._masks),
+            'transition_count': len(self._edge_targets),
+            'memory_bytes': self.memory_usage()
+        }
+
+
+def compile_lexicon(source_path: str, target_path: str) -> FlatGADDAG:
+    """Construit le GADDAG minimal d'une liste de mots et le compile vers un fichier binaire."""
+    flat = FlatGADDAG.from_word_list(GADDAG.read_word_list(source_path))
+    flat.save(target_path)
+    return flat
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile une liste de mots en GADDAG binaire.")
+    parser.add_argument("source", help="Fichier texte, un mot par ligne")
+    parser.add_argument("target", help="Fichier binaire à produire")
+    args = parser.parse_args()
+    compiled = compile_lexicon(args.source, args.target)
+    stats = compiled.get_statistics()
+    print(f"{stats['word_count']} mots, {stats['node_count']} nœuds, "
+          f"{stats['transition_count']} transitions -> {args.target}")
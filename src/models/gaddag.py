@@ -1,9 +1,91 @@
-from typing import Dict, Set, List, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, MutableMapping, Optional, Protocol, Set, List, Tuple
 import re
+import string
+import sys
 import unicodedata
+from weakref import WeakValueDictionary
 
 
 from .node import Node  # Corrected relative import
+from .builder import CopyOnWriteUpdater, IncrementalBuilder, canonical_signature
+from .pattern_query import PatternQuery
+
+# Ligatures remplacées après décomposition NFKD
+LIGATURES = {'Œ': 'OE', 'Æ': 'AE'}
+# Lettres accentuées et ligatures du français, traduites en un seul appel à str.translate
+FRENCH_LETTERS = "àâäáãåçéèêëíìîïñóòôöõúùûüýÿœæ"
+NORMALIZATION_MEMO_SIZE = 8192
+# Longueur restante minimale d'un état qui ne mène à aucun mot
+DEAD_LENGTH = 255
+# Case des jokers dans les tableaux de comptage du chevalet (après A-Z)
+BLANK_SLOT = 26
+# Marques terminales : bit i <-> lexique i (cf. `GADDAG.from_lexicons`)
+MAX_LEXICONS = 8
+ALL_LEXICONS = (1 << MAX_LEXICONS) - 1
+# Masques de lettres des contrôles croisés : bit i <-> lettre chr(65 + i)
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(string.ascii_uppercase)}
+ALL_LETTERS_MASK = (1 << 26) - 1
+
+
+class ReadOnlyLexiconError(TypeError):
+    """
+    Modification d'un lexique en lecture seule (`ReadOnlyGADDAG`) : modifier
+    le GADDAG à nœuds d'origine, puis le recompiler.
+    """
+
+
+class WordLexicon(Protocol):
+    """
+    Lexique de validation : tests d'appartenance seuls (`GADDAG` et ses
+    backends, `DAWG`). Suffit à `WordValidator` et au générateur CBIC.
+    """
+
+    def contains(self, word: str, lexicon=None) -> bool: ...
+
+    def contains_normalized(self, word: str, lexicon=None) -> bool: ...
+
+
+def letter_bit(letter: str) -> int:
+    """Bit d'une lettre (majuscule ou joker en minuscule), 0 si ce n'est pas une lettre."""
+    return LETTER_BITS.get(letter.upper(), 0)
+
+
+def mask_letters(mask: int) -> Set[str]:
+    return {letter for letter, bit in LETTER_BITS.items() if mask & bit}
+
+
+def _normalize_slow(word: str) -> str:
+    """Normalisation complète : majuscules, décomposition NFKD, ligatures, lettres seules."""
+    word = word.upper()
+    word = unicodedata.normalize('NFKD', word)
+    word = ''.join(c for c in word if not unicodedata.combining(c))
+    for old, new in LIGATURES.items():
+        word = word.replace(old, new)
+    return ''.join(c for c in word if c.isalpha())
+
+
+# Construite à partir de la normalisation complète pour lui rester équivalente
+TRANSLATION_TABLE = str.maketrans({
+    char: _normalize_slow(char)
+    for letter in FRENCH_LETTERS for char in (letter, letter.upper())
+})
+TRANSLATION_TABLE[ord('’')] = None
+
+
+def _normalize_ascii(word: str) -> str:
+    word = word.upper()
+    return word if word.isalpha() else ''.join(c for c in word if c.isalpha())
+
+
+@lru_cache(maxsize=NORMALIZATION_MEMO_SIZE)
+def _normalize_non_ascii(word: str) -> str:
+    translated = word.translate(TRANSLATION_TABLE)
+    if translated.isascii():
+        return _normalize_ascii(translated)
+    return _normalize_slow(word)
+
 
 class GADDAG:
     """Structure de données GADDAG pour le Scrabble."""
@@ -12,54 +94,312 @@ class GADDAG:
     MIN_WORD_LENGTH = 2
     MAX_WORD_LENGTH = 15
     VALID_WORD_PATTERN = re.compile(r'^[A-Z]+$')
+    # À incrémenter à chaque changement des règles de `normalize_word`
+    NORMALIZATION_VERSION = 2
+    NORMALIZATION_PROBE = "àâäçéèêëîïôöùûüÿœæ l'été-ŒUF Ça"
+    BLANK_TILES = frozenset('_?*')
+    CROSS_CHECK_CACHE_SIZE = 65536
 
     @staticmethod
     def normalize_word(word: str) -> str:
         if not word:
             return ""
-        word = word.upper()
-        word = unicodedata.normalize('NFKD', word)
-        word = ''.join(c for c in word if not unicodedata.combining(c))
-        replacements = {
-            'Œ': 'OE',
-            'œ': 'OE'
+        # Chemin rapide pour l'ASCII pur (cas de toutes les lettres du plateau)
+        if word.isascii():
+            return _normalize_ascii(word)
+        return _normalize_non_ascii(word)
+
+    @classmethod
+    def build_parameters(cls) -> Dict[str, object]:
+        """Paramètres qui déterminent le contenu d'un lexique construit."""
+        return {
+            'normalization_version': cls.NORMALIZATION_VERSION,
+            'normalization_probe': cls.normalize_word(cls.NORMALIZATION_PROBE),
+            'delimiter': cls.DELIMITER,
+            'min_word_length': cls.MIN_WORD_LENGTH,
+            'max_word_length': cls.MAX_WORD_LENGTH,
+            'valid_word_pattern': cls.VALID_WORD_PATTERN.pattern,
         }
-        for old, new in replacements.items():
-            word = word.replace(old, new)
-        word = ''.join(c for c in word if c.isalpha())
-        return word
 
     @classmethod
-    def from_word_list(cls, words: List[str]) -> 'GADDAG':
-        gaddag = cls()
+    def from_word_list(cls, words: List[str], incremental: bool = False) -> 'GADDAG':
+        """
+        Construit un GADDAG à partir d'une liste de mots.
+
+        Avec `incremental=True`, le GADDAG minimal est construit directement à
+        partir des séquences triées (cf. `IncrementalBuilder`) : le trie non
+        minimisé n'est jamais alloué et le résultat ne dépend pas de l'ordre
+        des mots en entrée.
+        """
+        if not incremental:
+            gaddag = cls()
+            for word in words:
+                gaddag.add_word(word)
+            gaddag.annotate()
+            return gaddag
+
+        return cls.from_sorted_words(cls.prepare_words(words))
+
+    @classmethod
+    def prepare_words(cls, words: Iterable[str]) -> List[str]:
+        """Normalise, filtre et dédoublonne des mots ; les retourne triés."""
+        unique_words = set()
         for word in words:
-            gaddag.add_word(word)
+            word = cls.normalize_word(word)
+            if word and cls.DELIMITER not in word and cls.is_valid_word(word):
+                unique_words.add(word)
+        return sorted(unique_words)
+
+    @classmethod
+    def from_sorted_words(cls, words: List[str],
+                          masks: Optional[Dict[str, int]] = None) -> 'GADDAG':
+        """
+        GADDAG minimal à partir de mots déjà normalisés, valides, triés et uniques.
+
+        `masks` donne, pour un GADDAG multi-lexiques, le masque des lexiques de chaque mot.
+        """
+        gaddag = cls()
+        builder = IncrementalBuilder()
+        for sequence, terminal in cls._sorted_sequences(words, masks):
+            builder.insert(sequence, terminal)
+        gaddag.root = builder.finish()
+        gaddag.word_count = len(words)
+        gaddag.minimized = True
+        # Transitions insérées dans l'ordre : les signatures du constructeur sont canoniques
+        gaddag._register = WeakValueDictionary(builder.register)
+        gaddag.annotate()
         return gaddag
 
+    @classmethod
+    def from_lexicons(cls, lexicons: Dict[str, Iterable[str]]) -> 'GADDAG':
+        """
+        Un seul automate pour plusieurs lexiques (au plus `MAX_LEXICONS`).
+
+        La marque terminale de chaque séquence est le masque des lexiques qui
+        contiennent le mot (bit i pour le i-ème lexique) : les séquences
+        communes ne sont stockées qu'une fois, et les lexiques se
+        sélectionnent par nom ou numéro (cf. `lexicon_mask`).
+        """
+        if len(lexicons) > MAX_LEXICONS:
+            raise ValueError(f"Au plus {MAX_LEXICONS} lexiques par GADDAG ({len(lexicons)} fournis)")
+        masks: Dict[str, int] = {}
+        for bit, words in enumerate(lexicons.values()):
+            for word in cls.prepare_words(words):
+                masks[word] = masks.get(word, 0) | (1 << bit)
+        gaddag = cls.from_sorted_words(sorted(masks), masks)
+        gaddag.lexicon_names = list(lexicons)
+        return gaddag
+
+    def lexicon_mask(self, lexicon=None) -> int:
+        """
+        Masque d'un sélecteur de lexiques : None (tous), un numéro, un nom ou
+        une liste de numéros et de noms.
+        """
+        if lexicon is None:
+            return ALL_LEXICONS
+        if isinstance(lexicon, int):
+            if not 0 <= lexicon < MAX_LEXICONS:
+                raise ValueError(f"Lexique inconnu: {lexicon}")
+            return 1 << lexicon
+        if isinstance(lexicon, str):
+            if lexicon not in self.lexicon_names:
+                raise ValueError(f"Lexique inconnu: {lexicon}")
+            return 1 << self.lexicon_names.index(lexicon)
+        mask = 0
+        for selector in lexicon:
+            mask |= self.lexicon_mask(selector)
+        return mask
+
+    @classmethod
+    def _word_sequences(cls, word: str) -> Iterator[str]:
+        """Les L+1 séquences d'un mot : DELIMITER+mot puis rev(mot[:i+1])+DELIMITER+mot[i+1:]."""
+        yield cls.DELIMITER + word
+        for i in range(len(word)):
+            yield word[i::-1] + cls.DELIMITER + word[i+1:]
+
+    @classmethod
+    def _sorted_sequences(cls, words: Iterable[str],
+                          masks: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, int]]:
+        # Trie par paquets de premier symbole pour limiter le pic mémoire :
+        # l'ordre global est celui du premier symbole puis du reste.
+        # Produit les couples (séquence, marque terminale).
+        words = list(words)
+        for first in sorted(set(''.join(words)) | {cls.DELIMITER}):
+            bucket = []
+            for word in words:
+                if first == cls.DELIMITER:
+                    bucket.append(cls.DELIMITER + word)
+                    continue
+                start = word.find(first)
+                while start != -1:
+                    bucket.append(word[start::-1] + cls.DELIMITER + word[start+1:])
+                    start = word.find(first, start + 1)
+            bucket.sort()
+            if masks is None:
+                for sequence in bucket:
+                    yield sequence, True
+                continue
+            for sequence in bucket:
+                # Le mot se relit en retournant la partie avant le délimiteur
+                head, _, tail = sequence.partition(cls.DELIMITER)
+                yield sequence, masks[head[::-1] + tail]
+
     def __init__(self):
         self.root = Node()
         self.word_count = 0
+        self.version = 0  # incrémenté à chaque modification du lexique
+        self.annotated = False
+        self.lexicon_names: List[str] = []  # noms des lexiques, par numéro de bit
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        """Caches et état de minimisation, communs à tous les backends."""
         self.minimization_cache = {}
+        self._cross_checks: 'OrderedDict[Tuple[str, str], int]' = OrderedDict()
+        self._cross_checks_version = 0
+        # États partagés (minimisation) : les mises à jour passent par la copie sur écriture
+        self.minimized = False
+        self._register: Optional[MutableMapping[Tuple, Node]] = None
 
-    def contains(self, word: str) -> bool:
+    def contains(self, word: str, lexicon=None) -> bool:
         word = self.normalize_word(word)
         if not self.is_valid_word(word):
             return False
+        return self.contains_normalized(word, lexicon)
+
+    def contains_normalized(self, word: str, lexicon=None) -> bool:
+        """
+        Appartenance d'un mot déjà normalisé (A-Z majuscules), sans
+        re-normalisation, à l'un des lexiques sélectionnés (tous par défaut).
+        """
+        # Toute séquence contient le délimiteur : seul le chemin DELIMITER + mot
+        # peut mener à un état terminal, un seul parcours suffit.
+        state = self.forward_state()
+        if state is not None:
+            state = self.walk(word, state)
+        if state is None:
+            return False
+        if lexicon is None:
+            return self.is_terminal_state(state)
+        return bool(self.terminal_mask(state) & self.lexicon_mask(lexicon))
+
+    # Primitives de parcours : les algorithmes de recherche ne manipulent que
+    # des "états" opaques, ce qui permet de changer de représentation interne
+    # (nœuds Python, tableaux plats...) sans les réécrire.
+
+    def start_state(self):
+        """Retourne l'état initial (racine) de l'automate."""
+        return self.root
+
+    def step(self, state, char: str):
+        """Suit la transition étiquetée `char`, ou retourne None si absente."""
+        return state.transitions.get(char)
+
+    def edges(self, state):
+        """Retourne les couples (lettre, état cible) sortant d'un état."""
+        return state.transitions.items()
+
+    def is_terminal_state(self, state) -> bool:
+        return state.is_terminal
+
+    def terminal_mask(self, state) -> int:
+        """Masque des lexiques dont un mot se termine sur cet état (True vaut le lexique 0)."""
+        return state.is_terminal
+
+    def forward_state(self):
+        """État à partir duquel les mots se lisent de gauche à droite (après le délimiteur)."""
+        return self.step(self.start_state(), self.DELIMITER)
+
+    def annotation(self, state) -> Tuple[int, int, int]:
+        """(masque des lettres vers un mot, longueur restante min, max) d'un état annoté."""
+        return state.annotation
+
+    def annotate(self) -> None:
+        """
+        Calcule pour chaque état le masque (26 bits) des lettres présentes sur un
+        chemin menant à un état terminal, et le nombre minimal et maximal de
+        lettres restant à lire (délimiteur exclu). Les recherches s'en servent
+        pour abandonner les branches qui ne peuvent plus aboutir.
+        """
+        start = self.start_state()
+        memo = {}
+        stack = [start]
+        while stack:
+            state = stack[-1]
+            if state in memo:
+                stack.pop()
+                continue
+            edges = list(self.edges(state))
+            pending = [target for _, target in edges if target not in memo]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            memo[state] = self.combine_annotations(
+                self.is_terminal_state(state), ((char, memo[target]) for char, target in edges))
+        self._store_annotations(memo)
+        self.annotated = True
 
-        node = self.root
-        for char in word:
-            node = node.get_transition(char)
-            if not node:
+    @classmethod
+    def combine_annotations(cls, is_terminal: bool,
+                            children: Iterable[Tuple[str, Tuple[int, int, int]]]
+                            ) -> Tuple[int, int, int]:
+        """Annotation d'un état à partir de celles de ses cibles (lettre, annotation)."""
+        reach = 0
+        low = 0 if is_terminal else DEAD_LENGTH
+        high = 0
+        for char, (target_reach, target_low, target_high) in children:
+            if target_low == DEAD_LENGTH:
+                continue
+            if char == cls.DELIMITER:
+                reach |= target_reach
+                low = min(low, target_low)
+                high = max(high, target_high)
+            else:
+                reach |= target_reach | (1 << (ord(char) - 65))
+                low = min(low, target_low + 1)
+                high = max(high, target_high + 1)
+        return reach, low, high
+
+    def _store_annotations(self, annotations: Dict) -> None:
+        for node, annotation in annotations.items():
+            node.annotation = annotation
+
+    def iter_words(self, lexicon=None) -> Iterator[str]:
+        """Énumère les mots du lexique dans l'ordre alphabétique (parcours itératif)."""
+        start = self.forward_state()
+        if start is None:
+            return
+        mask = self.lexicon_mask(lexicon)
+        stack = [(start, "")]
+        while stack:
+            state, word = stack.pop()
+            if word and self.terminal_mask(state) & mask:
+                yield word
+            for char, target in sorted(self.edges(state), key=lambda edge: edge[0], reverse=True):
+                stack.append((target, word + char))
+
+    def walk(self, sequence: str, state=None):
+        """Suit une séquence de transitions depuis `state` (la racine par défaut)."""
+        if state is None:
+            state = self.start_state()
+        for char in sequence:
+            state = self.step(state, char)
+            if state is None:
+                return None
+        return state
+
+    def walk_hops(self, sequence: str, state=None) -> int:
+        """Nombre de transitions stockées suivies pour lire `sequence` (jusqu'à l'échec)."""
+        if state is None:
+            state = self.start_state()
+        hops = 0
+        for char in sequence:
+            hops += 1
+            state = self.step(state, char)
+            if state is None:
                 break
-        if node and node.is_terminal:
-            return True
-
-        node = self.root
-        for char in self.DELIMITER + word:
-            node = node.get_transition(char)
-            if not node:
-                return False
-        return node.is_terminal
+        return hops
 
     def _add_word_sequence(self, sequence: str) -> None:
         node = self.root
@@ -68,45 +408,170 @@ class GADDAG:
         node.is_terminal = True
 
     def add_word(self, word: str) -> None:
+        if self.minimized or self._register is not None:
+            self.update(add=[word])
+            return
         word = self.normalize_word(word)
         if not word or self.DELIMITER in word or not self.is_valid_word(word):
             return
 
-        sequence = self.DELIMITER + word
-        self._add_word_sequence(sequence)
-
-        for i in range(len(word)):
-            reversed_part = word[i::-1]
-            remaining_part = word[i+1:]
-            sequence = reversed_part + self.DELIMITER + remaining_part
+        for sequence in self._word_sequences(word):
             self._add_word_sequence(sequence)
 
         self.word_count += 1
+        self.version += 1
+        self.annotated = False
+
+    def remove_word(self, word: str, lexicon=None) -> bool:
+        """Retire un mot du lexique ; retourne False s'il n'y figurait pas."""
+        return self.update(remove=[word], lexicon=lexicon)[1] == 1
+
+    def update(self, add: Iterable[str] = (), remove: Iterable[str] = (),
+               lexicon=None) -> Tuple[int, int]:
+        """
+        Retire puis ajoute des mots par lot, y compris sur un GADDAG minimisé.
+
+        Seuls les chemins des séquences touchées sont copiés puis refusionnés
+        avec le registre des états existants (cf. `CopyOnWriteUpdater`) : le
+        coût dépend du nombre de mots modifiés, pas de la taille du lexique, et
+        le résultat reste minimal. Les annotations sont recalculées sur les
+        copies seulement. Les lexiques sélectionnés (tous par défaut) sont
+        modifiés. Retourne (mots ajoutés, mots retirés).
+        """
+        existing = (1 << max(1, len(self.lexicon_names))) - 1
+        mask = self.lexicon_mask(lexicon)
+        if lexicon is None:
+            mask &= existing
+        elif mask & ~existing:
+            raise ValueError(f"Lexique inconnu: {lexicon}")
+        changes: Dict[str, List[int]] = {}  # mot -> [marque initiale, nouvelle marque]
+        removed = added = 0
+        for word in self.prepare_words(remove):
+            old = self._word_terminal(word)
+            if old & mask:
+                changes[word] = [old, old & ~mask]
+                removed += 1
+        for word in self.prepare_words(add):
+            old, current = changes.get(word) or (self._word_terminal(word),) * 2
+            if current & mask != mask:
+                changes[word] = [old, current | mask]
+                added += 1
+        changes = {word: new for word, (old, new) in changes.items() if new != old}
+        if not changes:
+            return added, removed
+
+        annotate = None
+        if self.annotated:
+            def annotate(node: Node) -> Tuple[int, int, int]:
+                return self.combine_annotations(
+                    node.is_terminal,
+                    ((char, target.annotation) for char, target in node.transitions.items()))
+        updater = CopyOnWriteUpdater(self.root, self._ensure_register(), annotate)
+        for word, terminal in changes.items():
+            was_present = bool(self._word_terminal(word))
+            for sequence in self._word_sequences(word):
+                updater.set_terminal(sequence, terminal)
+            self.word_count += bool(terminal) - was_present
+        self.root = updater.finish()
+        self.version += 1
+        return added, removed
+
+    def _word_terminal(self, word: str) -> int:
+        state = self.forward_state()
+        if state is not None:
+            state = self.walk(word, state)
+        return 0 if state is None else int(self.terminal_mask(state))
+
+    def _ensure_register(self) -> MutableMapping[Tuple, Node]:
+        """Registre des états par signature, reconstruit après une modification en place."""
+        if self._register is None:
+            register = WeakValueDictionary()
+            seen = {id(self.root)}
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                for target in node.transitions.values():
+                    if id(target) not in seen:
+                        seen.add(id(target))
+                        stack.append(target)
+                        register.setdefault(canonical_signature(target), target)
+            self._register = register
+        return self._register
+
+    def cross_check(self, prefix: str, suffix: str, lexicon=None) -> int:
+        """
+        Masque des lettres X (cf. `LETTER_BITS`) telles que prefix + X + suffix
+        soit un mot des lexiques sélectionnés. Sans voisin (préfixe et suffixe
+        vides), toute lettre convient. Les résultats sont mémorisés par
+        (prefix, suffix, lexiques) dans un cache LRU commun à tous les
+        utilisateurs du lexique.
+        """
+        # Blanks du plateau en minuscules
+        key = (prefix.upper(), suffix.upper(), self.lexicon_mask(lexicon))
+        cache = self._cross_checks
+        if self._cross_checks_version != self.version:
+            cache.clear()
+            self._cross_checks_version = self.version
+        mask = cache.get(key)
+        if mask is not None:
+            cache.move_to_end(key)
+            return mask
+        mask = self._compute_cross_check(*key)
+        cache[key] = mask
+        if len(cache) > self.CROSS_CHECK_CACHE_SIZE:
+            cache.popitem(last=False)
+        return mask
+
+    def _compute_cross_check(self, prefix: str, suffix: str, lexicons: int) -> int:
+        if not prefix and not suffix:
+            return ALL_LETTERS_MASK
+        # Un seul parcours du préfixe, puis un parcours du suffixe par lettre candidate
+        state = self.forward_state()
+        if state is not None:
+            state = self.walk(prefix, state)
+        if state is None:
+            return 0
+        mask = 0
+        for char, target in self.edges(state):
+            bit = LETTER_BITS.get(char)
+            if bit is None:
+                continue
+            if suffix:
+                target = self.walk(suffix, target)
+            if target is not None and self.terminal_mask(target) & lexicons:
+                mask |= bit
+        return mask
 
     def get_possible_letters(self, prefix: str) -> Set[str]:
-        node = self.root
-        for char in prefix:
-            node = node.get_transition(char)
-            if not node:
-                return set()
-        return set(node.transitions.keys())
+        state = self.walk(prefix)
+        if state is None:
+            return set()
+        return {char for char, _ in self.edges(state)}
 
     def load_dictionary(self, filepath: str) -> int:
         words_loaded = 0
+        for word in self.read_word_list(filepath):
+            self.add_word(word)
+            words_loaded += 1
+        self.annotate()
+        return words_loaded
+
+    @classmethod
+    def read_word_list(cls, filepath: str) -> Iterator[str]:
+        """Lit un fichier (un mot par ligne) et produit les mots normalisés valides."""
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 for line in f:
-                    word = self.normalize_word(line.strip())
-                    if self.is_valid_word(word):
-                        self.add_word(word)
-                        words_loaded += 1
+                    word = cls.normalize_word(line.strip())
+                    if cls.is_valid_word(word):
+                        yield word
         except FileNotFoundError:
             raise FileNotFoundError(f"Dictionnaire non trouvé: {filepath}")
-        return words_loaded
 
-    def is_valid_word(self, word: str) -> bool:
-        return (self.MIN_WORD_LENGTH <= len(word) <= self.MAX_WORD_LENGTH and
-                bool(self.VALID_WORD_PATTERN.match(word)))
+    @classmethod
+    def is_valid_word(cls, word: str) -> bool:
+        return (cls.MIN_WORD_LENGTH <= len(word) <= cls.MAX_WORD_LENGTH and
+                bool(cls.VALID_WORD_PATTERN.match(word)))
 
     def _get_node_signature(self, node: Node) -> str:
         transitions = sorted((char, id(target)) for char, target in node.transitions.items())
@@ -134,6 +599,9 @@ class GADDAG:
             return node
         self.root = minimize_node(self.root)
         self.minimization_cache.clear()
+        self.minimized = True
+        self._register = None
+        self.annotate()
 
     def get_statistics(self) -> Dict[str, int]:
         stats = {
@@ -141,93 +609,260 @@ class GADDAG:
             'node_count': 0,
             'transition_count': 0
         }
-        visited = set()
-        def count_nodes(node: Node) -> None:
-            if id(node) in visited:
-                return
-            visited.add(id(node))
+        for node in self._iter_nodes():
             stats['node_count'] += 1
             stats['transition_count'] += len(node.transitions)
-            for target in node.transitions.values():
-                count_nodes(target)
-        count_nodes(self.root)
         return stats
 
-    def _validate_word(self, word: str, skeleton: Dict[int, str], available: Set[str]) -> bool:
-        word_len = len(word)
-        max_skel_pos = max(skeleton.keys(), default=-1)
-        if word_len <= max_skel_pos:
-            return False
+    def _iter_nodes(self) -> Iterator[Node]:
+        """Chaque nœud atteignable une seule fois (parcours itératif, sans récursion)."""
+        seen = {id(self.root)}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            for target in node.transitions.values():
+                if id(target) not in seen:
+                    seen.add(id(target))
+                    stack.append(target)
+
+    def memory_usage(self) -> int:
+        """Taille en octets des nœuds : objet, attributs, transitions et annotation."""
+        total = 0
+        for node in self._iter_nodes():
+            total += (sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+                      + sys.getsizeof(node.transitions))
+            if node.annotation is not None:
+                total += sys.getsizeof(node.annotation)
+        return total
+
+    def _skeleton_table(self, skeleton: Dict[int, str]) -> Tuple[List[str], int]:
+        """Table position -> lettre imposée ('' si libre) et position la plus à droite (-1 si vide)."""
+        table = [''] * self.MAX_WORD_LENGTH
+        anchor = -1
+        for pos, letter in skeleton.items():
+            letter = self.normalize_word(letter)
+            if not 0 <= pos < self.MAX_WORD_LENGTH or len(letter) != 1:
+                return table, -1
+            table[pos] = letter
+            anchor = max(anchor, pos)
+        return table, anchor
 
-        all_allowed_letters = available | set(skeleton.values())
-
-        for i, letter in enumerate(word):
-            if i in skeleton:
-                if skeleton[i] != letter:
-                    return False
-            elif letter not in all_allowed_letters:
-                return False
-        return True
-
-    def _validate_partial_word(self, word: str, word_start: int, skeleton: Dict[int, str]) -> bool:
-        word_len = len(word)
-        for pos, required in skeleton.items():
-            rel_pos = pos - word_start
-            if 0 <= rel_pos < word_len:
-                if word[rel_pos] != required:
-                    return False
-        return True
-
-    def _search_forward(self, node: Node, word: str, word_start: int,
-                       skeleton: Dict[int, str], all_available: Set[str],
-                       words: Set[str], word_length:int, max_len: int = 15 ) -> None:
-
-        if word_length > max_len:
+    @classmethod
+    def rack_counts(cls, available_letters: Iterable[str]) -> List[int]:
+        """Compte les jetons du chevalet : 26 lettres puis les jokers ('_', '?', '*') en dernière case."""
+        counts = [0] * 27
+        for tile in available_letters:
+            if tile in cls.BLANK_TILES:
+                counts[BLANK_SLOT] += 1
+                continue
+            for letter in cls.normalize_word(tile):
+                counts[ord(letter) - 65] += 1
+        return counts
+
+    def iter_words_with_skeleton(self, skeleton: Dict[int, str],
+                                 available_letters: Iterable[str], lexicon=None) -> Iterator[str]:
+        """
+        Produit, sans ordre garanti, les mots dont les lettres aux positions du
+        squelette (0 = première lettre) sont imposées et dont les autres lettres
+        sont prises dans le chevalet, en respectant le nombre d'exemplaires de
+        chaque lettre (un joker remplace n'importe quelle lettre).
+
+        Le parcours part de la position imposée la plus à droite : il lit le
+        préfixe à l'envers jusqu'à la position 0, franchit le délimiteur puis
+        prolonge le mot avec les lettres restantes. Il est itératif et chaque
+        mot est produit une seule fois.
+        """
+        table, anchor = self._skeleton_table(skeleton)
+        if anchor >= 0:
+            yield from self._iter_skeleton(table, anchor, self.rack_counts(available_letters),
+                                           self.lexicon_mask(lexicon))
+
+    def _iter_skeleton(self, table: List[str], anchor: int, counts: List[int],
+                       lexicons: int = ALL_LEXICONS) -> Iterator[str]:
+        state = self.step(self.start_state(), table[anchor])
+        if state is None:
             return
 
-        if not self._validate_partial_word(word, word_start, skeleton):
+        delimiter = self.DELIMITER
+        max_length = self.MAX_WORD_LENGTH
+        terminal_mask = self.terminal_mask
+        word = [''] * max_length
+        word[anchor] = table[anchor]
+        # Élagage par les annotations (cf. `annotate`) : un état est abandonné
+        # si ses mots demandent plus de lettres que les jetons restants et la
+        # place disponible, trop peu pour atteindre la position 0, ou des
+        # lettres imposées qu'il ne peut plus atteindre.
+        annotation = self.annotation if self.annotated else None
+        tiles = sum(counts)
+        rack_mask = sum(1 << slot for slot in range(BLANK_SLOT) if counts[slot])
+        fixed_before = [0] * (max_length + 1)
+        fixed_mask_before = [0] * (max_length + 1)
+        for pos, letter in enumerate(table):
+            fixed_before[pos + 1] = fixed_before[pos] + (1 if letter else 0)
+            fixed_mask_before[pos + 1] = fixed_mask_before[pos] | (
+                1 << (ord(letter) - 65) if letter else 0)
+
+        def hopeless(target, need: int, budget: int, fixed_mask: int) -> bool:
+            """Aucun mot ne peut être complété depuis `target` avec `need` à `budget` lettres."""
+            reach, low, high = annotation(target)
+            if high < need or max(low, need) > budget or reach & fixed_mask != fixed_mask:
+                return True
+            return low > 0 and not fixed_mask and not counts[BLANK_SLOT] and not reach & rack_mask
+
+        def release(slot: int) -> None:
+            nonlocal tiles, rack_mask
+            counts[slot] += 1
+            tiles += 1
+            if slot < BLANK_SLOT:
+                rack_mask |= 1 << slot
+
+        if annotation and hopeless(state, anchor, min(tiles + fixed_before[anchor], max_length - 1),
+                                   fixed_mask_before[anchor]):
             return
 
-        if node.is_terminal and word_length >= self.MIN_WORD_LENGTH:
-            if self._validate_word(word, skeleton, all_available):
-                words.add(word)
+        # Pile de (transitions restantes, position suivante, sens avant ?, case consommée)
+        stack = [(iter(self.edges(state)), anchor - 1, False, -1)]
+        while stack:
+            transitions, pos, forward, _ = stack[-1]
+            for char, target in transitions:
+                if char == delimiter:
+                    # Le délimiteur n'est franchi qu'une fois le préfixe complet
+                    if forward or pos >= 0:
+                        continue
+                    if anchor + 1 >= self.MIN_WORD_LENGTH and terminal_mask(target) & lexicons:
+                        yield ''.join(word[:anchor + 1])
+                    if annotation and hopeless(target, 1, min(tiles, max_length - anchor - 1), 0):
+                        continue
+                    stack.append((iter(self.edges(target)), anchor + 1, True, -1))
+                    break
+                if pos < 0 or pos >= max_length:
+                    continue
+                slot = -1
+                if table[pos]:
+                    if char != table[pos]:
+                        continue
+                else:
+                    slot = ord(char) - 65
+                    if not counts[slot]:
+                        slot = BLANK_SLOT
+                        if not counts[slot]:
+                            continue
+                    counts[slot] -= 1
+                    tiles -= 1
+                    if slot < BLANK_SLOT and not counts[slot]:
+                        rack_mask &= ~(1 << slot)
+                word[pos] = char
+                if forward:
+                    if terminal_mask(target) & lexicons:
+                        yield ''.join(word[:pos + 1])
+                    pruned = annotation and hopeless(target, 1, min(tiles, max_length - pos - 1), 0)
+                else:
+                    pruned = annotation and hopeless(
+                        target, pos, min(tiles + fixed_before[pos], pos + max_length - anchor - 1),
+                        fixed_mask_before[pos])
+                if pruned:
+                    if slot >= 0:
+                        release(slot)
+                    continue
+                stack.append((iter(self.edges(target)), pos + 1 if forward else pos - 1, forward, slot))
+                break
+            else:
+                slot = stack.pop()[3]
+                if slot >= 0:
+                    release(slot)
+
+    def find_words_with_skeleton(self, skeleton: Dict[int, str],
+                                 available_letters: Iterable[str], lexicon=None) -> List[str]:
+        """Liste triée des mots de `iter_words_with_skeleton`."""
+        return sorted(self.iter_words_with_skeleton(skeleton, available_letters, lexicon))
+
+    def iter_words_matching(self, pattern: str, min_length: Optional[int] = None,
+                            max_length: Optional[int] = None, excluded: str = '',
+                            required: str = '', lexicon=None) -> Iterator[str]:
+        """
+        Mots qui correspondent à un motif (`?`, `*`, classes `[AEI]`, cf.
+        `PatternQuery`), produits au fil du parcours, sans ordre particulier.
+        """
+        query = PatternQuery(pattern, min_length, max_length, excluded, required)
+        return query.iter_words(self, self.lexicon_mask(lexicon))
+
+    def find_words_matching(self, pattern: str, min_length: Optional[int] = None,
+                            max_length: Optional[int] = None, excluded: str = '',
+                            required: str = '', lexicon=None) -> List[str]:
+        """Liste triée des mots de `iter_words_matching`."""
+        return sorted(self.iter_words_matching(pattern, min_length, max_length,
+                                               excluded, required, lexicon))
+
+    def find_words_with_skeletons(self, queries: Iterable[Tuple[Dict[int, str], Iterable[str]]],
+                                  lexicon=None) -> Dict[int, List[str]]:
+        """
+        Répond à plusieurs requêtes (squelette, lettres disponibles) à la fois.
+
+        Les requêtes de même squelette sont regroupées et résolues par un seul
+        parcours avec le chevalet « union » (maximum de chaque lettre et des
+        jokers) ; chaque mot trouvé est ensuite attribué aux requêtes dont le
+        chevalet suffit. Retourne les listes triées indexées par rang de requête.
+        """
+        lexicons = self.lexicon_mask(lexicon)
+        results: Dict[int, List[str]] = {}
+        groups: Dict[Tuple[str, ...], List[Tuple[int, List[int]]]] = {}
+        for index, (skeleton, available_letters) in enumerate(queries):
+            results[index] = []
+            table, anchor = self._skeleton_table(skeleton)
+            if anchor >= 0:
+                groups.setdefault(tuple(table), []).append(
+                    (index, self.rack_counts(available_letters)))
+
+        for table, members in groups.items():
+            anchor = max(pos for pos, letter in enumerate(table) if letter)
+            union = [max(slot) for slot in zip(*(counts for _, counts in members))]
+            for word in self._iter_skeleton(list(table), anchor, union, lexicons):
+                if len(members) == 1:
+                    results[members[0][0]].append(word)
+                    continue
+                needed = [0] * 26
+                for pos, letter in enumerate(word):
+                    if not table[pos]:
+                        needed[ord(letter) - 65] += 1
+                for index, counts in members:
+                    missing = sum(need - have for need, have in zip(needed, counts) if need > have)
+                    if missing <= counts[BLANK_SLOT]:
+                        results[index].append(word)
+
+        for words in results.values():
+            words.sort()
+        return results
+    
+    
+
 
-        current_pos = word_start + len(word) - 1
-        for letter, next_node in node.transitions.items():
-            next_pos = current_pos + 1
+class ReadOnlyGADDAG(GADDAG):
+    """
+    Base des lexiques en lecture seule (compilé, compressé, vue) : même API de
+    lecture que `GADDAG`, toute modification lève `ReadOnlyLexiconError`.
 
-            if next_pos in skeleton:
-                if letter == skeleton[next_pos]:
-                    self._search_forward(next_node, word + letter, word_start, skeleton, all_available, words, word_length + 1, max_len)
-            elif letter in all_available:
-                self._search_forward(next_node, word + letter, word_start, skeleton, all_available, words, word_length + 1, max_len)
+    Les sous-classes fournissent le parcours (`start_state`, `step`, `edges`,
+    ...) et le contenu (`word_count`, `version`, `annotated`,
+    `lexicon_names`) ; cet initialiseur ne crée que les caches communs.
+    """
 
-    def _search_backward(self, node: Node, word: str, pos: int,
-                        skeleton: Dict[int, str], all_available: Set[str],
-                        words: Set[str], word_length: int = 0) -> None:
+    def __init__(self):
+        self._init_caches()
 
-        if node.is_terminal:
-            if self._validate_word(word, skeleton, all_available):
-                words.add(word)
+    def _read_only(self) -> ReadOnlyLexiconError:
+        return ReadOnlyLexiconError(f"{type(self).__name__} est en lecture seule")
 
-        for letter, next_node in node.transitions.items():
-            if letter == self.DELIMITER:
-                self._search_forward(next_node, word, pos + 1, skeleton, all_available, words, word_length, self.MAX_WORD_LENGTH)
-            else:
-                if pos in skeleton:
-                    if letter == skeleton[pos]:
-                        self._search_backward(next_node, letter + word, pos - 1, skeleton, all_available, words, word_length + 1)
-                elif letter in all_available:
-                    self._search_backward(next_node, letter + word, pos - 1, skeleton, all_available, words, word_length + 1)
-
-    def find_words_with_skeleton(self, skeleton: Dict[int, str], available_letters: Set[str]) -> List[str]:
-        norm_skeleton = {pos: self.normalize_word(letter) for pos, letter in skeleton.items()}
-        norm_available = set(self.normalize_word(letter) for letter in available_letters)
-        all_available = norm_available | set(norm_skeleton.values())
-        words = set()
-
-        max_skeleton_pos = max(norm_skeleton.keys(), default=-1)
-        self._search_backward(self.root, "", max_skeleton_pos + 1, norm_skeleton, all_available, words)
-        return sorted(words)
-    
-    
\ No newline at end of file
+    def add_word(self, word: str) -> None:
+        raise self._read_only()
+
+    def update(self, add: Iterable[str] = (), remove: Iterable[str] = (),
+               lexicon=None) -> Tuple[int, int]:
+        raise self._read_only()
+
+    def load_dictionary(self, filepath: str) -> int:
+        raise self._read_only()
+
+    def semi_minimize(self) -> None:
+        # Construit depuis un GADDAG déjà (semi-)minimisé
+        return None
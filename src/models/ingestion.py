@@ -0,0 +1,169 @@
+"""
+Chargement parallèle de grandes listes de mots.
+
+Le fichier est projeté en mémoire et découpé en blocs alignés sur des fins de
+ligne. Chaque bloc est décodé, normalisé (`GADDAG.normalize_word`) et validé
+dans un pool de processus, qui retourne une liste triée et dédoublonnée. Les
+listes sont ensuite fusionnées (fusion k-voies) puis passées au constructeur
+incrémental du GADDAG. Chaque étape est chronométrée dans un
+`IngestionReport`.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import heapq
+import mmap
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .gaddag import GADDAG
+from .flat_gaddag import FlatGADDAG
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+@dataclass
+class StageReport:
+    """Durée et volume traités par une étape du chargement."""
+    name: str
+    seconds: float
+    items: int
+    bytes: int = 0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds > 0 else float('inf')
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds > 0 else float('inf')
+
+
+@dataclass
+class IngestionReport:
+    """Rapport de débit d'un chargement, étape par étape."""
+    workers: int
+    chunks: int = 0
+    stages: List[StageReport] = field(default_factory=list)
+
+    def add(self, name: str, started: float, items: int, size: int = 0) -> None:
+        self.stages.append(StageReport(name, time.perf_counter() - started, items, size))
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stage.seconds for stage in self.stages)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {stage.name: {'seconds': stage.seconds, 'items': stage.items,
+                             'items_per_second': stage.items_per_second}
+                for stage in self.stages}
+
+    def __str__(self) -> str:
+        lines = [f"Chargement ({self.workers} processus, {self.chunks} blocs) "
+                 f"en {self.total_seconds:.3f} s"]
+        for stage in self.stages:
+            line = (f"  {stage.name:<14} {stage.seconds:8.3f} s  {stage.items:>9} éléments"
+                    f"  {stage.items_per_second:>12.0f} /s")
+            if stage.bytes:
+                line += f"  {stage.megabytes_per_second:8.1f} Mo/s"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def split_chunks(buffer, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Découpe un tampon en intervalles [début, fin) terminés par une fin de ligne."""
+    chunks = []
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline = buffer.find(b'\n', end)
+            end = size if newline == -1 else newline + 1
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def normalize_chunk(path: str, start: int, end: int) -> List[str]:
+    """Normalise et valide les mots d'un bloc ; retourne une liste triée sans doublons."""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            text = buffer[start:end].decode('utf-8')
+    words = set()
+    for line in text.splitlines():
+        word = GADDAG.normalize_word(line.strip())
+        if word and GADDAG.is_valid_word(word):
+            words.add(word)
+    return sorted(words)
+
+
+def merge_sorted(runs: Iterable[List[str]]) -> List[str]:
+    """Fusionne des listes triées en une liste triée sans doublons."""
+    merged: List[str] = []
+    previous = None
+    for word in heapq.merge(*runs):
+        if word != previous:
+            merged.append(word)
+            previous = word
+    return merged
+
+
+def ingest_word_lists(paths: Sequence[str], workers: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE
+                      ) -> Tuple[List[List[str]], IngestionReport]:
+    """
+    Normalise plusieurs listes de mots en partageant un même pool de processus.
+
+    Retourne, pour chaque fichier, ses mots valides triés et dédoublonnés, et
+    le rapport de débit. Sans parallélisme utile (un seul bloc ou
+    `workers=1`), tout est exécuté dans le processus courant.
+    """
+    workers = workers or os.cpu_count() or 1
+    report = IngestionReport(workers=workers)
+
+    started = time.perf_counter()
+    tasks = []
+    total_bytes = 0
+    for index, path in enumerate(paths):
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    tasks.extend((index, path, start, end)
+                                 for start, end in split_chunks(buffer, chunk_size))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Dictionnaire non trouvé: {path}")
+        total_bytes += size
+    report.chunks = len(tasks)
+    report.add("découpage", started, len(tasks), total_bytes)
+
+    started = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        report.workers = 1
+        runs = [normalize_chunk(path, start, end) for _, path, start, end in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            runs = list(pool.map(normalize_chunk, *zip(*[task[1:] for task in tasks])))
+    report.add("normalisation", started, sum(len(run) for run in runs), total_bytes)
+
+    started = time.perf_counter()
+    per_file: List[List[List[str]]] = [[] for _ in paths]
+    for (index, _, _, _), run in zip(tasks, runs):
+        per_file[index].append(run)
+    results = [merge_sorted(file_runs) for file_runs in per_file]
+    report.add("fusion", started, sum(len(words) for words in results))
+    return results, report
+
+
+def build_lexicon(path: str, workers: Optional[int] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[FlatGADDAG, IngestionReport]:
+    """Charge une liste de mots en parallèle et construit son GADDAG compilé."""
+    (words,), report = ingest_word_lists([path], workers, chunk_size)
+    started = time.perf_counter()
+    gaddag = FlatGADDAG.from_sorted_words(words)
+    report.add("construction", started, len(words))
+    return gaddag, report
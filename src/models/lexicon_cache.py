@@ -0,0 +1,123 @@
+"""
+Cache disque des lexiques compilés.
+
+Chaque entrée est un fichier GADDAG binaire (cf. `FlatGADDAG.save`) nommé par
+une empreinte SHA-256 de la liste de mots source, des règles de normalisation
+et des paramètres de construction (`GADDAG.build_parameters`). Une liste de
+mots inchangée est donc rechargée par projection mémoire au lieu d'être
+reconstruite ; toute modification de la source ou des règles produit une
+nouvelle clé. Les entrées les moins récemment utilisées sont supprimées
+lorsque le répertoire dépasse la taille maximale.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+from typing import Iterable, List, Optional
+
+from .gaddag import GADDAG
+from .flat_gaddag import FILE_VERSION, FlatGADDAG
+from .ingestion import IngestionReport, build_lexicon
+
+
+class LexiconCache:
+    """Cache de GADDAG compilés indexé par empreinte de contenu."""
+
+    DEFAULT_DIRECTORY = os.path.join("data", "cache")
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    EXTENSION = ".gdg"
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY,
+                 max_bytes: int = DEFAULT_MAX_BYTES, workers: Optional[int] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.workers = workers  # processus utilisés pour (re)construire un lexique
+        self.hits = 0
+        self.misses = 0
+        self.last_report: Optional[IngestionReport] = None
+
+    def key_for(self, source_path: str) -> str:
+        """Empreinte de la source et des paramètres de construction."""
+        digest = hashlib.sha256()
+        try:
+            with open(source_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Dictionnaire non trouvé: {source_path}")
+        parameters = dict(GADDAG.build_parameters(), file_version=FILE_VERSION)
+        digest.update(json.dumps(parameters, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.EXTENSION)
+
+    def get(self, source_path: str) -> Optional[FlatGADDAG]:
+        """Retourne le lexique compilé s'il est en cache, None sinon."""
+        return self._open(self.path_for(self.key_for(source_path)))
+
+    def get_or_build(self, source_path: str) -> FlatGADDAG:
+        """Retourne le lexique compilé, en le construisant au premier appel."""
+        path = self.path_for(self.key_for(source_path))
+        gaddag = self._open(path)
+        if gaddag is not None:
+            self.hits += 1
+            return gaddag
+
+        self.misses += 1
+        os.makedirs(self.directory, exist_ok=True)
+        built, self.last_report = build_lexicon(source_path, self.workers)
+        built.save(path)
+        self.evict(keep=(path,))
+        return FlatGADDAG.open(path)
+
+    def _open(self, path: str) -> Optional[FlatGADDAG]:
+        try:
+            gaddag = FlatGADDAG.open(path)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Entrée corrompue ou d'un format obsolète : elle sera reconstruite
+            self._remove(path)
+            return None
+        os.utime(path)  # marque l'entrée comme récemment utilisée
+        return gaddag
+
+    def entries(self) -> List[str]:
+        """Fichiers du cache, du moins au plus récemment utilisé."""
+        if not os.path.isdir(self.directory):
+            return []
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.endswith(self.EXTENSION)]
+        return sorted(paths, key=os.path.getmtime)
+
+    def size(self) -> int:
+        return sum(os.path.getsize(path) for path in self.entries())
+
+    def evict(self, keep: Iterable[str] = ()) -> List[str]:
+        """Supprime les entrées les plus anciennes jusqu'à respecter `max_bytes`."""
+        keep = set(keep)
+        entries = self.entries()
+        total = sum(os.path.getsize(path) for path in entries)
+        removed = []
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            if path in keep:
+                continue
+            total -= os.path.getsize(path)
+            self._remove(path)
+            removed.append(path)
+        return removed
+
+    def clear(self) -> None:
+        for path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        # Un autre processus a pu supprimer ou remplacer l'entrée entre-temps
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
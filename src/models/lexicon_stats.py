@@ -0,0 +1,166 @@
+"""
+Statistiques et bilan mémoire d'un lexique, quel que soit son backend.
+
+Le parcours est itératif et n'utilise que les primitives communes
+(`start_state`, `edges`, `terminal_mask`) : les chiffres sont comparables
+entre `GADDAG`, `FlatGADDAG`, `RadixGADDAG` et `DAWG`, et aucune profondeur
+ne fait déborder la pile. Les états sont comptés lettre à lettre ; la taille
+mémoire et le nombre d'états réellement stockés viennent du backend
+(`memory_usage`, `get_statistics`), tout comme le nombre moyen de
+transitions stockées suivies par un test d'appartenance (`walk_hops`) :
+une arête compressée du `RadixGADDAG` compte pour un seul saut.
+
+Le rapport est un dictionnaire sérialisable en JSON, pour suivre l'empreinte
+de chaque lexique d'une version à l'autre :
+
+    python -m src.models.lexicon_stats mots.txt --backend gaddag flat radix dawg
+"""
+
+from collections import Counter
+import json
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+from .dawg import DAWG
+from .flat_gaddag import FlatGADDAG
+from .gaddag import GADDAG
+from .radix_gaddag import RadixGADDAG
+
+REPORT_VERSION = 2
+
+# Lexique parcouru : un GADDAG (quel que soit son backend) ou un DAWG de validation
+Lexicon = Union[GADDAG, DAWG]
+
+# Backend -> construction à partir du GADDAG minimal de référence
+BACKENDS: Dict[str, Callable[[GADDAG], Lexicon]] = {
+    'gaddag': lambda gaddag: gaddag,
+    'flat': FlatGADDAG.from_gaddag,
+    'radix': RadixGADDAG.from_gaddag,
+    'dawg': DAWG.from_gaddag,
+}
+
+
+def collect_statistics(gaddag: Lexicon) -> Dict[str, object]:
+    """
+    Compte les états, transitions et états terminaux, et calcule les
+    histogrammes du nombre de transitions sortantes et de la profondeur
+    (distance minimale depuis la racine) des états.
+    """
+    start = gaddag.start_state()
+    depth = {start: 0}
+    order = [start]  # ordre du parcours en largeur, sert de file
+    fan_out: Counter = Counter()
+    depths: Counter = Counter()
+    edge_count = terminal_count = 0
+    for state in order:
+        edges = list(gaddag.edges(state))
+        fan_out[len(edges)] += 1
+        depths[depth[state]] += 1
+        edge_count += len(edges)
+        if gaddag.terminal_mask(state):
+            terminal_count += 1
+        next_depth = depth[state] + 1
+        for _, target in edges:
+            if target not in depth:
+                depth[target] = next_depth
+                order.append(target)
+
+    trie_count = trie_size(gaddag)
+    return {
+        'node_count': len(order),
+        'edge_count': edge_count,
+        'terminal_count': terminal_count,
+        'fan_out': dict(sorted(fan_out.items())),
+        'depth': dict(sorted(depths.items())),
+        'max_depth': max(depths),
+        'trie_node_count': trie_count,
+        # États du GADDAG / états de l'arbre des préfixes équivalent
+        'minimization_ratio': len(order) / trie_count,
+    }
+
+
+def trie_size(gaddag: Lexicon) -> int:
+    """Nombre d'états de l'arbre des préfixes non minimisé (dépliage du graphe)."""
+    start = gaddag.start_state()
+    sizes: Dict = {}
+    stack = [start]
+    while stack:
+        state = stack[-1]
+        if state in sizes:
+            stack.pop()
+            continue
+        targets = [target for _, target in gaddag.edges(state)]
+        pending = [target for target in targets if target not in sizes]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        sizes[state] = 1 + sum(sizes[target] for target in targets)
+    return sizes[start]
+
+
+def contains_hops(gaddag: Lexicon) -> float:
+    """Transitions stockées suivies en moyenne pour reconnaître un mot du lexique."""
+    # Le DAWG lit les mots tels quels, le GADDAG après le délimiteur
+    prefix = '' if isinstance(gaddag, DAWG) else GADDAG.DELIMITER
+    total = count = 0
+    for word in gaddag.iter_words():
+        total += gaddag.walk_hops(prefix + word)
+        count += 1
+    return total / max(1, count)
+
+
+def statistics_report(gaddag: Lexicon, build_seconds: Optional[float] = None) -> Dict[str, object]:
+    """Rapport complet d'un lexique : structure, mémoire et temps de construction."""
+    stored = gaddag.get_statistics()
+    memory = gaddag.memory_usage()
+    report = {
+        'report_version': REPORT_VERSION,
+        'backend': type(gaddag).__name__,
+        'word_count': gaddag.word_count,
+        'lexicons': list(gaddag.lexicon_names),
+    }
+    report.update(collect_statistics(gaddag))
+    report.update({
+        'stored_node_count': stored['node_count'],
+        'memory_bytes': memory,
+        'bytes_per_node': memory / max(1, stored['node_count']),
+        'bytes_per_word': memory / max(1, gaddag.word_count),
+        'contains_hops': contains_hops(gaddag),
+        'build_seconds': build_seconds,
+    })
+    return report
+
+
+def build_reports(source_path: str, backends: List[str]) -> List[Dict[str, object]]:
+    """Construit un lexique avec chaque backend demandé et retourne leurs rapports."""
+    started = time.perf_counter()
+    words = GADDAG.prepare_words(GADDAG.read_word_list(source_path))
+    reference = GADDAG.from_sorted_words(words)
+    reference_seconds = time.perf_counter() - started
+
+    reports = []
+    for name in backends:
+        started = time.perf_counter()
+        lexicon = BACKENDS[name](reference)
+        build_seconds = reference_seconds + time.perf_counter() - started
+        report = statistics_report(lexicon, build_seconds)
+        report['source'] = source_path
+        reports.append(report)
+    return reports
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Statistiques et bilan mémoire d'un lexique (JSON).")
+    parser.add_argument("source", help="Fichier texte, un mot par ligne")
+    parser.add_argument("--backend", nargs="+", choices=sorted(BACKENDS), default=['gaddag'])
+    parser.add_argument("--output", help="Fichier JSON à produire (sortie standard sinon)")
+    args = parser.parse_args()
+    text = json.dumps(build_reports(args.source, args.backend), indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
@@ -0,0 +1,337 @@
+"""
+Vues filtrées d'un lexique, sans reconstruction de l'automate.
+
+Les mots d'un GADDAG sont numérotés dans l'ordre alphabétique par hachage
+parfait : chaque état de la branche avant (après le délimiteur) connaît le
+nombre de mots qui le prolongent, et le rang d'un mot s'obtient en un
+parcours en O(L). Une vue n'est alors qu'un jeu de bits indexé par rang
+(un bit par mot, soit ~50 Ko pour 400 000 mots) posé sur le GADDAG
+d'origine, dont elle réutilise les états, les annotations et le parcours.
+
+La numérotation est calculée une fois par lexique et partagée par toutes ses
+vues ; elle est recalculée, comme les vues, si le lexique est modifié. Elle
+porte aussi, calculés au premier besoin, un jeu de bits par longueur de mot
+et par lettre : les vues par longueur (`by_length`), par lettres exclues
+(`excluding_letters`) et leurs intersections se composent par opérations
+bit à bit, sans parcourir les mots. Seule `filter`, pour un prédicat
+quelconque, évalue le prédicat sur chaque mot du lexique.
+
+Les états du GADDAG étant partagés par des mots acceptés ou non par une vue,
+`LexiconView.terminal_mask` est un sur-ensemble : un parcours qui produit
+des mots doit confirmer chacun avec `LexiconView.accepts`.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from .gaddag import ALL_LEXICONS, GADDAG, LETTER_BITS, ReadOnlyGADDAG
+
+WordPredicate = Callable[[str], bool]
+WordSelection = Callable[['WordNumbering'], int]  # numérotation -> jeu de bits des mots retenus
+
+
+class WordNumbering:
+    """Rang alphabétique des mots d'un lexique (hachage parfait sur la branche avant)."""
+
+    def __init__(self, gaddag: GADDAG):
+        self.gaddag = gaddag
+        self.version = gaddag.version
+        self.start = gaddag.forward_state()
+        self._counts: Dict = {}  # état -> nombre de mots qui le prolongent
+        if self.start is not None:
+            self._count_words(self.start)
+        self.count = self._counts.get(self.start, 0)
+        self._length_bits: Optional[Dict[int, int]] = None  # longueur -> rangs
+        self._letter_bits: Optional[Dict[str, int]] = None  # lettre -> rangs des mots qui la contiennent
+
+    def _count_words(self, start) -> None:
+        # Parcours postfixe itératif : la branche avant est un DAWG partagé
+        gaddag, counts = self.gaddag, self._counts
+        stack = [(start, False)]
+        while stack:
+            state, expanded = stack.pop()
+            if state in counts:
+                continue
+            edges = gaddag.edges(state)
+            if expanded:
+                counts[state] = (1 if state != start and gaddag.terminal_mask(state) else 0) \
+                    + sum(counts[target] for _, target in edges)
+                continue
+            stack.append((state, True))
+            stack.extend((target, False) for _, target in edges if target not in counts)
+
+    def rank(self, word: str) -> Optional[int]:
+        """Rang d'un mot normalisé parmi les mots du lexique, ou None s'il n'y figure pas."""
+        gaddag, counts = self.gaddag, self._counts
+        state = self.start
+        if state is None or not word:
+            return None
+        rank = 0
+        for char in word:
+            if state != self.start and gaddag.terminal_mask(state):
+                rank += 1
+            for edge_char, target in gaddag.edges(state):
+                if edge_char < char:
+                    rank += counts[target]
+            state = gaddag.step(state, char)
+            if state is None:
+                return None
+        return rank if gaddag.terminal_mask(state) else None
+
+    @property
+    def all_bits(self) -> int:
+        """Jeu de bits de tous les mots."""
+        return (1 << self.count) - 1
+
+    def length_bits(self, min_length: int, max_length: int) -> int:
+        """Jeu de bits des mots de `min_length` à `max_length` lettres."""
+        self._index_words()
+        bits = 0
+        for length, length_bits in self._length_bits.items():
+            if min_length <= length <= max_length:
+                bits |= length_bits
+        return bits
+
+    def letter_bits(self, letter: str) -> int:
+        """Jeu de bits des mots qui contiennent `letter`."""
+        self._index_words()
+        return self._letter_bits.get(letter, 0)
+
+    def _index_words(self) -> None:
+        """Jeux de bits par longueur et par lettre, en un seul parcours des mots."""
+        if self._length_bits is not None:
+            return
+        size = (self.count + 7) // 8
+        lengths: Dict[int, bytearray] = {}
+        letters: Dict[str, bytearray] = {}
+        for rank, word in enumerate(self.gaddag.iter_words()):
+            byte, bit = rank >> 3, 1 << (rank & 7)
+            length = lengths.get(len(word))
+            if length is None:
+                length = lengths[len(word)] = bytearray(size)
+            length[byte] |= bit
+            for letter in set(word):
+                letter_bits = letters.get(letter)
+                if letter_bits is None:
+                    letter_bits = letters[letter] = bytearray(size)
+                letter_bits[byte] |= bit
+        self._length_bits = {length: int.from_bytes(bits, 'little') for length, bits in lengths.items()}
+        self._letter_bits = {letter: int.from_bytes(bits, 'little') for letter, bits in letters.items()}
+
+
+_numberings: 'WeakKeyDictionary[GADDAG, WordNumbering]' = WeakKeyDictionary()
+
+
+def word_numbering(gaddag: GADDAG) -> WordNumbering:
+    """Numérotation partagée d'un lexique, recalculée après une modification."""
+    numbering = _numberings.get(gaddag)
+    if numbering is None or numbering.version != gaddag.version:
+        numbering = _numberings[gaddag] = WordNumbering(gaddag)
+    return numbering
+
+
+class LexiconView(ReadOnlyGADDAG):
+    """
+    Sous-ensemble d'un lexique défini par un prédicat sur les mots.
+
+    S'utilise partout où un `GADDAG` est attendu (`WordValidator`,
+    `MoveGenerator`, CBIC) : le parcours est délégué au lexique d'origine et
+    seuls les tests d'appartenance, énumérations, recherches par squelette et
+    contrôles croisés consultent le jeu de bits de la vue. Le jeu de bits est
+    composé par `selection` à partir des jeux précalculés de la numérotation
+    ou, à défaut, obtenu en évaluant `predicate` sur chaque mot.
+    """
+
+    def __init__(self, base: GADDAG, predicate: WordPredicate,
+                 selection: Optional[WordSelection] = None):
+        super().__init__()  # le contenu et le parcours sont ceux de `base`
+        self.base = base
+        self.predicate = predicate
+        self.selection = selection
+        self._cross_checks_version = base.version
+        self._bits_version = base.version
+        self._bits = self._compute_bits()
+
+    @classmethod
+    def filter(cls, base: GADDAG, predicate: WordPredicate) -> 'LexiconView':
+        """Vue des mots de `base` qui vérifient `predicate` (mots en majuscules A-Z)."""
+        return cls(base, predicate)
+
+    @classmethod
+    def from_words(cls, base: GADDAG, words: Iterable[str]) -> 'LexiconView':
+        """Vue restreinte à une liste de mots (ex. la liste personnelle `M`), sans énumérer `base`."""
+        selected = frozenset(cls.prepare_words(words))
+
+        def selection(numbering: WordNumbering) -> int:
+            bits = bytearray((numbering.count + 7) // 8)
+            for word in selected:
+                rank = numbering.rank(word)
+                if rank is not None:
+                    bits[rank >> 3] |= 1 << (rank & 7)
+            return int.from_bytes(bits, 'little')
+        return cls(base, selected.__contains__, selection)
+
+    @classmethod
+    def by_length(cls, base: GADDAG, min_length: int = GADDAG.MIN_WORD_LENGTH,
+                  max_length: int = GADDAG.MAX_WORD_LENGTH) -> 'LexiconView':
+        """Vue des mots de `min_length` à `max_length` lettres."""
+        return cls(base, lambda word: min_length <= len(word) <= max_length,
+                   lambda numbering: numbering.length_bits(min_length, max_length))
+
+    @classmethod
+    def excluding_letters(cls, base: GADDAG, letters: Iterable[str]) -> 'LexiconView':
+        """Vue des mots qui ne contiennent aucune des lettres données (lettres rares)."""
+        excluded = frozenset(GADDAG.normalize_word(''.join(letters)))
+
+        def selection(numbering: WordNumbering) -> int:
+            bits = 0
+            for letter in excluded:
+                bits |= numbering.letter_bits(letter)
+            return numbering.all_bits & ~bits
+        return cls(base, lambda word: excluded.isdisjoint(word), selection)
+
+    def __and__(self, other: 'LexiconView') -> 'LexiconView':
+        """Intersection de deux vues d'un même lexique (ET bit à bit)."""
+        if not isinstance(other, LexiconView) or other.base is not self.base:
+            return NotImplemented
+        first, second = self, other
+
+        def selection(numbering: WordNumbering) -> int:
+            return (int.from_bytes(first._current_bits(), 'little')
+                    & int.from_bytes(second._current_bits(), 'little'))
+        return LexiconView(self.base, lambda word: first.predicate(word) and second.predicate(word),
+                           selection)
+
+    def _compute_bits(self) -> bytearray:
+        numbering = word_numbering(self.base)
+        size = (numbering.count + 7) // 8
+        if self.selection is not None:
+            return bytearray(self.selection(numbering).to_bytes(size, 'little'))
+        bits = bytearray(size)
+        predicate = self.predicate
+        for rank, word in enumerate(self.base.iter_words()):
+            if predicate(word):
+                bits[rank >> 3] |= 1 << (rank & 7)
+        return bits
+
+    def _current_bits(self) -> bytearray:
+        """Jeu de bits à jour : les rangs changent quand le lexique d'origine est modifié."""
+        if self._bits_version != self.base.version:
+            self._bits = self._compute_bits()
+            self._bits_version = self.base.version
+        return self._bits
+
+    def accepts(self, word: str) -> bool:
+        """Vrai si le mot normalisé figure dans le lexique d'origine et dans la vue."""
+        bits = self._current_bits()
+        rank = word_numbering(self.base).rank(word)
+        return rank is not None and bool(bits[rank >> 3] >> (rank & 7) & 1)
+
+    @property
+    def word_count(self) -> int:
+        return int.from_bytes(self._current_bits(), 'little').bit_count()
+
+    # Parcours : délégués au lexique d'origine
+
+    @property
+    def root(self):
+        return self.base.root
+
+    @property
+    def version(self) -> int:
+        return self.base.version
+
+    @property
+    def annotated(self) -> bool:
+        return self.base.annotated
+
+    @property
+    def lexicon_names(self) -> List[str]:
+        return self.base.lexicon_names
+
+    def start_state(self):
+        return self.base.start_state()
+
+    def step(self, state, char: str):
+        return self.base.step(state, char)
+
+    def edges(self, state):
+        return self.base.edges(state)
+
+    def walk(self, sequence: str, state=None):
+        return self.base.walk(sequence, state)
+
+    def walk_hops(self, sequence: str, state=None) -> int:
+        return self.base.walk_hops(sequence, state)
+
+    def forward_state(self):
+        return self.base.forward_state()
+
+    def is_terminal_state(self, state) -> bool:
+        return self.base.is_terminal_state(state)
+
+    def terminal_mask(self, state) -> int:
+        """
+        Masque du lexique d'origine : sur-ensemble de la vue, un état étant
+        partagé par des mots qu'elle accepte ou non. Un parcours qui produit
+        des mots doit confirmer chacun avec `accepts`.
+        """
+        return self.base.terminal_mask(state)
+
+    def annotation(self, state) -> Tuple[int, int, int]:
+        return self.base.annotation(state)
+
+    def lexicon_mask(self, lexicon=None) -> int:
+        return self.base.lexicon_mask(lexicon)
+
+    # Requêtes sur les mots : filtrées par la vue
+
+    def contains_normalized(self, word: str, lexicon=None) -> bool:
+        return self.base.contains_normalized(word, lexicon) and self.accepts(word)
+
+    def iter_words(self, lexicon=None) -> Iterator[str]:
+        bits = self._current_bits()
+        mask = self.lexicon_mask(lexicon)
+        for rank, word in enumerate(self.base.iter_words()):
+            if bits[rank >> 3] >> (rank & 7) & 1 and (
+                    mask == ALL_LEXICONS or self.base._word_terminal(word) & mask):
+                yield word
+
+    def iter_words_with_skeleton(self, skeleton: Dict[int, str],
+                                 available_letters: Iterable[str], lexicon=None) -> Iterator[str]:
+        for word in self.base.iter_words_with_skeleton(skeleton, available_letters, lexicon):
+            if self.accepts(word):
+                yield word
+
+    def iter_words_matching(self, pattern: str, min_length: Optional[int] = None,
+                            max_length: Optional[int] = None, excluded: str = '',
+                            required: str = '', lexicon=None) -> Iterator[str]:
+        for word in self.base.iter_words_matching(pattern, min_length, max_length,
+                                                  excluded, required, lexicon):
+            if self.accepts(word):
+                yield word
+
+    def find_words_with_skeletons(self, queries, lexicon=None) -> Dict[int, List[str]]:
+        results = self.base.find_words_with_skeletons(queries, lexicon)
+        return {index: [word for word in words if self.accepts(word)]
+                for index, words in results.items()}
+
+    def _compute_cross_check(self, prefix: str, suffix: str, lexicons: int) -> int:
+        mask = super()._compute_cross_check(prefix, suffix, lexicons)
+        if not prefix and not suffix:
+            return mask
+        for char, bit in LETTER_BITS.items():
+            if mask & bit and not self.accepts(prefix + char + suffix):
+                mask &= ~bit
+        return mask
+
+    def memory_usage(self) -> int:
+        """Taille en octets du jeu de bits propre à la vue."""
+        return len(self._bits)
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            'word_count': self.word_count,
+            'base_word_count': self.base.word_count,
+            'memory_bytes': self.memory_usage()
+        }
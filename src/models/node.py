@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 class Node:
     """Représente un nœud dans le GADDAG."""
@@ -6,6 +6,8 @@ class Node:
     def __init__(self):
         self.transitions: Dict[str, 'Node'] = {}  # transitions vers d'autres nœuds
         self.is_terminal: bool = False  # indique si le nœud est terminal
+        # (lettres atteignables, longueur restante min, max) calculé par GADDAG.annotate
+        self.annotation: Optional[Tuple[int, int, int]] = None
     
     def add_transition(self, char: str, node: Optional['Node'] = None) -> 'Node':
         """Ajoute une transition vers un nouveau nœud ou retourne le nœud existant."""
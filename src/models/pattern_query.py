@@ -0,0 +1,283 @@
+"""
+Recherche de mots par motif : jokers, classes de lettres et bornes de longueur.
+
+Syntaxe d'un motif :
+
+    A-Z      lettre imposée
+    ?        une lettre quelconque
+    *        une suite de lettres quelconques, éventuellement vide
+    [AEI]    une lettre de la classe ; [A-E] intervalle ; [^QU] complément
+
+Les lettres interdites (`excluded`) s'appliquent à tout le motif, les lettres
+exigées (`required`) doivent figurer quelque part dans le mot : « contient un
+Q sans U » s'écrit `*Q*` avec `excluded="U"`.
+
+Le motif est compilé en automate sur ses positions, déterminisé à la volée,
+puis parcouru en produit avec le lexique. Sur un GADDAG, le parcours part de
+la dernière lettre de la plus longue suite de lettres imposées : il lit à
+l'envers la partie du motif qui la précède, franchit le délimiteur, puis lit
+la suite. `*Q*` ne visite ainsi que les mots qui contiennent un Q, et `BA*T`
+que ceux qui commencent par BA. Les annotations du lexique (cf.
+`GADDAG.annotate`) élaguent les branches trop courtes, trop longues ou
+auxquelles manquent des lettres exigées. Les mots sont produits au fil du
+parcours, sans ordre particulier.
+"""
+
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+ALL_LETTERS = (1 << 26) - 1
+UNBOUNDED = 255  # longueur restante non bornée (motif avec `*`)
+
+Token = Tuple[int, bool]  # (masque des lettres admises, répétable ?)
+
+
+def letters_mask(letters: str) -> int:
+    """Masque 26 bits d'une suite de lettres A-Z (majuscules ou minuscules)."""
+    mask = 0
+    for char in letters.upper():
+        if not 'A' <= char <= 'Z':
+            raise ValueError(f"Lettre invalide: {char!r}")
+        mask |= 1 << (ord(char) - 65)
+    return mask
+
+
+def parse_pattern(pattern: str) -> List[Token]:
+    """Découpe un motif en jetons (masque, répétable)."""
+    tokens: List[Token] = []
+    text = pattern.upper()
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == '?':
+            tokens.append((ALL_LETTERS, False))
+        elif char == '*':
+            if not (tokens and tokens[-1] == (ALL_LETTERS, True)):  # ** équivaut à *
+                tokens.append((ALL_LETTERS, True))
+        elif char == '[':
+            end = text.find(']', i + 1)
+            if end < 0:
+                raise ValueError(f"Motif invalide: classe non fermée dans {pattern!r}")
+            tokens.append((class_mask(text[i + 1:end], pattern), False))
+            i = end
+        elif 'A' <= char <= 'Z':
+            tokens.append((1 << (ord(char) - 65), False))
+        else:
+            raise ValueError(f"Motif invalide: {char!r} dans {pattern!r}")
+        i += 1
+    if not tokens:
+        raise ValueError("Motif vide")
+    return tokens
+
+
+def class_mask(body: str, pattern: str) -> int:
+    """Masque d'une classe de lettres : `AEI`, `A-E`, `^QU`."""
+    negate = body.startswith('^')
+    if negate:
+        body = body[1:]
+    mask = 0
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == '-':
+            low, high = body[i], body[i + 2]
+            if not ('A' <= low <= high <= 'Z'):
+                raise ValueError(f"Motif invalide: intervalle {low}-{high} dans {pattern!r}")
+            for code in range(ord(low), ord(high) + 1):
+                mask |= 1 << (code - 65)
+            i += 3
+        else:
+            mask |= letters_mask(body[i])
+            i += 1
+    if not mask and not negate:
+        raise ValueError(f"Motif invalide: classe vide dans {pattern!r}")
+    return ALL_LETTERS & ~mask if negate else mask
+
+
+class PatternAutomaton:
+    """
+    Automate des positions d'une suite de jetons, déterminisé à la volée.
+
+    Un état est le masque des positions atteintes ; le bit `len(tokens)`
+    signale que tout le motif est lu.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        count = len(tokens)
+        self.final = 1 << count
+        # Par position : lettres encore à lire (min, max) et lettres imposées restantes
+        self._min = [0] * (count + 1)
+        self._max = [0] * (count + 1)
+        self._required = [0] * (count + 1)
+        for i in reversed(range(count)):
+            mask, repeat = tokens[i]
+            self._min[i] = self._min[i + 1] + (0 if repeat else 1)
+            self._max[i] = UNBOUNDED if repeat else min(UNBOUNDED, self._max[i + 1] + 1)
+            single = not repeat and mask and not mask & (mask - 1)
+            self._required[i] = self._required[i + 1] | (mask if single else 0)
+        self._transitions: Dict[Tuple[int, int], int] = {}
+        self._bounds: Dict[int, Tuple[int, int, int]] = {}
+        self.start = self.closure(1)
+        self.has_repeat = any(repeat for _, repeat in tokens)
+
+    def closure(self, states: int) -> int:
+        """Ajoute les positions atteintes en sautant des `*` (suite vide)."""
+        for i, (_, repeat) in enumerate(self.tokens):
+            if repeat and states >> i & 1:
+                states |= 1 << (i + 1)
+        return states
+
+    def step(self, states: int, bit: int) -> int:
+        key = (states, bit)
+        result = self._transitions.get(key)
+        if result is None:
+            result = 0
+            for i, (mask, repeat) in enumerate(self.tokens):
+                if states >> i & 1 and mask & bit:
+                    result |= 1 << (i if repeat else i + 1)
+            result = self._transitions[key] = self.closure(result) if result else 0
+        return result
+
+    def bounds(self, states: int) -> Tuple[int, int, int]:
+        """(lettres restantes min, max, masque des lettres certainement encore à lire)."""
+        result = self._bounds.get(states)
+        if result is None:
+            active = [i for i in range(len(self.tokens) + 1) if states >> i & 1]
+            required = ALL_LETTERS
+            for i in active:
+                required &= self._required[i]
+            result = self._bounds[states] = (min(self._min[i] for i in active),
+                                             max(self._max[i] for i in active), required)
+        return result
+
+
+class PatternQuery:
+    """Requête par motif compilée, réutilisable sur plusieurs lexiques."""
+
+    def __init__(self, pattern: str, min_length: Optional[int] = None,
+                 max_length: Optional[int] = None, excluded: str = '', required: str = ''):
+        excluded_mask = letters_mask(excluded)
+        self.tokens = [(mask & ~excluded_mask, repeat) for mask, repeat in parse_pattern(pattern)]
+        self.required = letters_mask(required)
+        fixed = sum(1 for _, repeat in self.tokens if not repeat)
+        has_repeat = any(repeat for _, repeat in self.tokens)
+        self.min_length = max(fixed, min_length or 0)
+        self.max_length = UNBOUNDED if has_repeat else fixed
+        if max_length is not None:
+            self.max_length = min(self.max_length, max_length)
+        self.anchor = self._choose_anchor()
+
+    @property
+    def key(self) -> Hashable:
+        """Forme canonique de la requête (clé de cache)."""
+        return (tuple(self.tokens), self.min_length, self.max_length, self.required)
+
+    def _choose_anchor(self) -> int:
+        """Dernière lettre de la plus longue suite de lettres imposées, -1 s'il n'y en a pas."""
+        best, best_run, run = -1, 0, 0
+        for i, (mask, repeat) in enumerate(self.tokens):
+            literal = not repeat and mask and not mask & (mask - 1)
+            run = run + 1 if literal else 0
+            if literal and run > best_run:
+                best, best_run = i, run
+        return best
+
+    def iter_words(self, gaddag, lexicons: int) -> Iterator[str]:
+        """Mots du lexique qui correspondent au motif, dans l'ordre du parcours."""
+        forward_start = gaddag.forward_state()
+        if forward_start is None:
+            return
+        min_length = max(self.min_length, gaddag.MIN_WORD_LENGTH)
+        max_length = min(self.max_length, gaddag.MAX_WORD_LENGTH)
+        if min_length > max_length:
+            return
+
+        # Sans rotations ou sans lettre imposée, lecture de gauche à droite
+        rotations = forward_start != gaddag.start_state()
+        if rotations and self.anchor >= 0:
+            backward = PatternAutomaton(self.tokens[self.anchor::-1])
+            forward = PatternAutomaton(self.tokens[self.anchor + 1:])
+            start, states = gaddag.start_state(), backward.start
+        else:
+            backward = None
+            forward = PatternAutomaton(self.tokens)
+            start, states = forward_start, forward.start
+        seen = set() if backward is not None and (backward.has_repeat or forward.has_repeat) else None
+        yield from self._traverse(gaddag, lexicons, start, states, backward, forward,
+                                  min_length, max_length, seen)
+
+    def _traverse(self, gaddag, lexicons: int, start, states: int,
+                  backward: Optional[PatternAutomaton], forward: PatternAutomaton,
+                  min_length: int, max_length: int, seen: Optional[set]) -> Iterator[str]:
+        delimiter = gaddag.DELIMITER
+        terminal_mask = gaddag.terminal_mask
+        annotation = gaddag.annotation if gaddag.annotated else None
+        required = self.required
+        forward_low, forward_high, forward_required = forward.bounds(forward.start)
+
+        def viable(target, automaton, states: int, depth: int, letters: int) -> bool:
+            """Faux si aucun mot du motif ne peut être complété depuis `target`."""
+            low, high, needed = automaton.bounds(states)
+            if automaton is backward:
+                low += forward_low
+                high = min(UNBOUNDED, high + forward_high)
+                needed |= forward_required
+            low = max(low, min_length - depth)
+            high = min(high, max_length - depth)
+            if low > high:
+                return False
+            if annotation is None:
+                return True
+            reach, target_low, target_high = annotation(target)
+            if max(low, target_low) > min(high, target_high):
+                return False
+            return not (needed | (required & ~letters)) & ~reach
+
+        def word(path: List[str], split: int) -> str:
+            if backward is None:
+                return ''.join(path)
+            return ''.join(reversed(path[:split])) + ''.join(path[split:])
+
+        automaton = backward or forward
+        if not automaton.start or not viable(start, automaton, states, 0, 0):
+            return
+        path: List[str] = []
+        # Pile de (transitions restantes, automate, états du motif, lettres lues,
+        # début de la lecture vers l'avant, lettre ajoutée au chemin ?)
+        stack = [(iter(gaddag.edges(start)), automaton, states, 0, -1, False)]
+        while stack:
+            transitions, automaton, states, letters, split, _ = stack[-1]
+            for char, target in transitions:
+                if char == delimiter:
+                    if automaton is not backward or not states & backward.final:
+                        continue
+                    next_automaton, next_states, next_letters, next_split = \
+                        forward, forward.start, letters, len(path)
+                    depth = len(path)
+                else:
+                    bit = 1 << (ord(char) - 65)
+                    next_states = automaton.step(states, bit)
+                    if not next_states:
+                        continue
+                    next_automaton, next_letters, next_split = automaton, letters | bit, split
+                    depth = len(path) + 1
+                if depth > max_length or not viable(target, next_automaton, next_states,
+                                                    depth, next_letters):
+                    continue
+                consumed = char != delimiter
+                if consumed:
+                    path.append(char)
+                if (next_automaton is forward and next_states & forward.final
+                        and depth >= min_length and terminal_mask(target) & lexicons
+                        and next_letters & required == required):
+                    result = word(path, next_split)
+                    if seen is None:
+                        yield result
+                    elif result not in seen:
+                        seen.add(result)
+                        yield result
+                stack.append((iter(gaddag.edges(target)), next_automaton, next_states,
+                              next_letters, next_split, consumed))
+                break
+            else:
+                if stack.pop()[5]:
+                    path.pop()
@@ -0,0 +1,116 @@
+"""
+Cache LRU des résultats de requêtes sur un lexique.
+
+Pendant la génération de grilles, les mêmes squelettes (par exemple
+{0: 'A', 3: 'E'} avec le même chevalet) sont demandés très souvent. Le cache
+mémorise les résultats sous une forme canonique de la requête : squelette
+normalisé et multiensemble trié des lettres disponibles. Sa taille est bornée
+en nombre d'entrées et en octets (estimation de la mémoire des listes de
+mots). Il se vide de lui-même lorsque le lexique est modifié
+(`GADDAG.version`).
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .gaddag import GADDAG
+from .pattern_query import PatternQuery
+
+# Estimation CPython : en-tête d'une chaîne ASCII, puis d'une liste et de ses pointeurs
+STRING_OVERHEAD = 49
+LIST_OVERHEAD = 56
+POINTER_SIZE = 8
+
+
+class QueryCache:
+    """Cache LRU borné placé devant les recherches d'un `GADDAG`."""
+
+    DEFAULT_MAX_ENTRIES = 10_000
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, gaddag: GADDAG, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.gaddag = gaddag
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, Tuple[List[str], int]]' = OrderedDict()
+        self._bytes = 0
+        self._version = gaddag.version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def entry_size(words: List[str]) -> int:
+        """Taille mémoire approximative d'une liste de mots."""
+        return LIST_OVERHEAD + sum(POINTER_SIZE + STRING_OVERHEAD + len(word) for word in words)
+
+    @staticmethod
+    def skeleton_key(skeleton: Dict[int, str], available_letters: Iterable[str]) -> Hashable:
+        """Forme canonique d'une requête squelette : positions triées et lettres comptées."""
+        letters = tuple(sorted((pos, GADDAG.normalize_word(letter))
+                               for pos, letter in skeleton.items()))
+        return ('squelette', letters, tuple(GADDAG.rack_counts(available_letters)))
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], List[str]]) -> List[str]:
+        """Résultat en cache pour `key`, sinon calculé par `compute` puis mémorisé."""
+        if self.gaddag.version != self._version:
+            self.invalidations += 1
+            self.clear()
+            self._version = self.gaddag.version
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return list(entry[0])
+
+        self.misses += 1
+        words = list(compute())
+        size = self.entry_size(words)
+        if size <= self.max_bytes and self.max_entries > 0:
+            self._entries[key] = (words, size)
+            self._bytes += size
+            self._evict()
+        return list(words)
+
+    def find_words_with_skeleton(self, skeleton: Dict[int, str],
+                                 available_letters: Iterable[str], lexicon=None) -> List[str]:
+        available_letters = list(available_letters)
+        # Les sélecteurs équivalents (nom, numéro) partagent la même entrée
+        key = self.skeleton_key(skeleton, available_letters) + (self.gaddag.lexicon_mask(lexicon),)
+        return self.get_or_compute(
+            key, lambda: self.gaddag.find_words_with_skeleton(skeleton, available_letters, lexicon))
+
+    def find_words_matching(self, pattern: str, min_length: Optional[int] = None,
+                            max_length: Optional[int] = None, excluded: str = '',
+                            required: str = '', lexicon=None) -> List[str]:
+        """Recherche par motif (cf. `GADDAG.find_words_matching`) ; `**` et `*` partagent une entrée."""
+        query = PatternQuery(pattern, min_length, max_length, excluded, required)
+        key = ('motif', query.key, self.gaddag.lexicon_mask(lexicon))
+        return self.get_or_compute(key, lambda: self.gaddag.find_words_matching(
+            pattern, min_length, max_length, excluded, required, lexicon))
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {'entries': len(self._entries), 'bytes': self._bytes, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions,
+                'invalidations': self.invalidations, 'hit_rate': self.hit_rate}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
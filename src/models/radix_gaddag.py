@@ -0,0 +1,296 @@
+"""
+GADDAG à arêtes compressées (arbre radix) stocké dans des tableaux plats.
+
+Les rotations du GADDAG créent de longues chaînes d'états à un seul
+successeur, par exemple la fin de chaque mot long après le délimiteur. Ici,
+chaque chaîne d'états non terminaux à successeur unique devient une seule
+arête étiquetée par une chaîne de caractères : seuls les états qui branchent
+ou terminent un mot sont matérialisés, et un test d'appartenance suit une
+arête par étiquette au lieu d'une transition par lettre.
+
+Le stockage reprend celui de `FlatGADDAG`, nœud par nœud (`_masks`,
+`_first_edge`, `_terminals`, annotations) et arête par arête
+(`_edge_targets`) ; chaque arête désigne son étiquette par une position et
+une longueur, réunies dans un seul entier, dans une réserve commune de
+caractères (`_labels`). Une étiquette qui est le suffixe d'une autre n'y est
+pas recopiée, ce qui compense les chaînes partagées par la minimisation.
+
+Un état est un entier : l'indice d'un nœud (>= 0), ou une position à
+l'intérieur d'une arête, le couple (arête, lettres déjà lues) codé en
+`-(arête * LABEL_SLOTS + lettres lues)`. Les primitives de parcours (`step`,
+`edges`) restent lettre à lettre sans allouer d'objet, si bien que toutes
+les recherches de `GADDAG` fonctionnent sans modification ; `walk` compare
+directement une tranche d'étiquette par arête.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .flat_gaddag import LETTER_CODES
+from .gaddag import DEAD_LENGTH, GADDAG, ReadOnlyGADDAG
+
+# Bits de la longueur d'une étiquette (un mot tourné, délimiteur compris, est plus court)
+LABEL_BITS = 5
+LABEL_SLOTS = 1 << LABEL_BITS
+
+
+def label_mask(label: str) -> int:
+    """Masque des lettres d'une étiquette (délimiteur exclu)."""
+    mask = 0
+    for char in label:
+        if char != GADDAG.DELIMITER:
+            mask |= 1 << (ord(char) - 65)
+    return mask
+
+
+def label_annotation(label: str, target: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Annotation exacte de l'état situé avant `label` (cf. GADDAG.combine_annotations)."""
+    reach, low, high = target
+    if low == DEAD_LENGTH:
+        return 0, DEAD_LENGTH, 0
+    letters = len(label) - label.count(GADDAG.DELIMITER)
+    return reach | label_mask(label), low + letters, high + letters
+
+
+class RadixGADDAG(ReadOnlyGADDAG):
+    """
+    Backend GADDAG en lecture seule à chaînes compressées.
+
+    Expose la même API que `GADDAG` ; se construit à partir d'un GADDAG
+    existant (à nœuds ou plat), de préférence minimisé.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.word_count = 0
+        self.version = 0
+        self.annotated = False
+        self.lexicon_names: List[str] = []
+        self._masks = array('I')          # premières lettres des arêtes sortantes, par nœud
+        self._terminals = array('B')      # lexiques qui acceptent le nœud (0 : non terminal)
+        self._first_edge = array('I', [0])  # début des arêtes du nœud (+ sentinelle)
+        self._edge_targets = array('I')   # nœud atteint au bout de chaque arête
+        self._edge_labels = array('I')    # position << LABEL_BITS | longueur, dans `_labels`
+        self._labels = ''                 # réserve commune des étiquettes (ASCII)
+        self._reach = array('I')          # annotations des nœuds (cf. GADDAG.annotate)
+        self._min_remaining = array('B')
+        self._max_remaining = array('B')
+
+    @classmethod
+    def from_gaddag(cls, gaddag: GADDAG) -> 'RadixGADDAG':
+        """Compresse les chaînes d'un GADDAG (à nœuds ou plat) en un parcours en largeur."""
+        radix = cls()
+        radix.word_count = gaddag.word_count
+        radix.lexicon_names = list(gaddag.lexicon_names)
+
+        root = gaddag.start_state()
+        index_of = {root: 0}
+        order = [root]
+        edges_of: List[List[Tuple[str, int]]] = []
+        for source in order:  # `order` s'allonge au fil du parcours
+            edges = []
+            for char, target in sorted(gaddag.edges(source), key=lambda edge: LETTER_CODES[edge[0]]):
+                label = [char]
+                # Absorbe les états internes d'une chaîne : non terminaux, un seul successeur
+                while not gaddag.terminal_mask(target):
+                    chain = list(gaddag.edges(target))
+                    if len(chain) != 1:
+                        break
+                    label.append(chain[0][0])
+                    target = chain[0][1]
+                if len(label) >= LABEL_SLOTS:
+                    raise ValueError(f"Étiquette trop longue: {''.join(label)}")
+                if target not in index_of:
+                    index_of[target] = len(order)
+                    order.append(target)
+                edges.append((''.join(label), index_of[target]))
+            edges_of.append(edges)
+            radix._terminals.append(int(gaddag.terminal_mask(source)))
+
+        # Réserve des étiquettes : les plus longues d'abord, chacun de leurs
+        # suffixes resservant aux étiquettes plus courtes
+        pool: Dict[str, int] = {}
+        labels: List[str] = []
+        size = 0
+        for text in sorted({text for edges in edges_of for text, _ in edges}, key=len, reverse=True):
+            if text not in pool:
+                labels.append(text)
+                for i in range(len(text)):
+                    pool.setdefault(text[i:], size + i)
+                size += len(text)
+        radix._labels = ''.join(labels)
+
+        for edges in edges_of:
+            mask = 0
+            for text, target in edges:
+                mask |= 1 << LETTER_CODES[text[0]]
+                radix._edge_targets.append(target)
+                radix._edge_labels.append(pool[text] << LABEL_BITS | len(text))
+            radix._masks.append(mask)
+            radix._first_edge.append(len(radix._edge_targets))
+        radix.annotate()
+        return radix
+
+    @classmethod
+    def from_word_list(cls, words: List[str], incremental: bool = True) -> 'RadixGADDAG':
+        gaddag = GADDAG.from_word_list(words, incremental=incremental)
+        if not incremental:
+            gaddag.semi_minimize()
+        return cls.from_gaddag(gaddag)
+
+    @classmethod
+    def from_sorted_words(cls, words: List[str],
+                          masks: Optional[Dict[str, int]] = None) -> 'RadixGADDAG':
+        return cls.from_gaddag(GADDAG.from_sorted_words(words, masks))
+
+    @classmethod
+    def from_lexicons(cls, lexicons: Dict[str, Iterable[str]]) -> 'RadixGADDAG':
+        return cls.from_gaddag(GADDAG.from_lexicons(lexicons))
+
+    def _label(self, edge: int, offset: int = 0) -> str:
+        """Lettres de l'étiquette de `edge` à partir de `offset`."""
+        packed = self._edge_labels[edge]
+        start = packed >> LABEL_BITS
+        return self._labels[start + offset:start + (packed & LABEL_SLOTS - 1)]
+
+    def _enter(self, edge: int) -> int:
+        """État atteint après la première lettre de l'arête."""
+        if self._edge_labels[edge] & LABEL_SLOTS - 1 == 1:
+            return self._edge_targets[edge]
+        return -(edge * LABEL_SLOTS + 1)
+
+    def start_state(self) -> int:
+        return 0
+
+    def step(self, state: int, char: str) -> Optional[int]:
+        code = LETTER_CODES.get(char)
+        if code is None:
+            return None
+        if state >= 0:
+            bit = 1 << code
+            mask = self._masks[state]
+            if not mask & bit:
+                return None
+            return self._enter(self._first_edge[state] + (mask & (bit - 1)).bit_count())
+        edge, offset = divmod(-state, LABEL_SLOTS)
+        packed = self._edge_labels[edge]
+        if self._labels[(packed >> LABEL_BITS) + offset] != char:
+            return None
+        if offset + 1 == packed & LABEL_SLOTS - 1:
+            return self._edge_targets[edge]
+        return state - 1  # une lettre de plus lue dans la même arête
+
+    def edges(self, state: int) -> List[Tuple[str, int]]:
+        if state >= 0:
+            labels, packed = self._labels, self._edge_labels
+            return [(labels[packed[edge] >> LABEL_BITS], self._enter(edge))
+                    for edge in range(self._first_edge[state], self._first_edge[state + 1])]
+        edge, offset = divmod(-state, LABEL_SLOTS)
+        char = self._labels[(self._edge_labels[edge] >> LABEL_BITS) + offset]
+        return [(char, self.step(state, char))]
+
+    def is_terminal_state(self, state: int) -> bool:
+        return state >= 0 and self._terminals[state] != 0
+
+    def terminal_mask(self, state: int) -> int:
+        # Les positions internes d'une arête ne terminent aucun mot
+        return self._terminals[state] if state >= 0 else 0
+
+    def annotation(self, state: int) -> Tuple[int, int, int]:
+        if state >= 0:
+            return self._reach[state], self._min_remaining[state], self._max_remaining[state]
+        edge, offset = divmod(-state, LABEL_SLOTS)
+        target = self._edge_targets[edge]
+        return label_annotation(self._label(edge, offset), self.annotation(target))
+
+    def walk(self, sequence: str, state: Optional[int] = None) -> Optional[int]:
+        # Une comparaison de tranche par arête au lieu d'un saut par lettre
+        labels, packed_labels = self._labels, self._edge_labels
+        masks, first_edge, targets = self._masks, self._first_edge, self._edge_targets
+        position, end = 0, len(sequence)
+        if state is None:
+            state = 0
+        elif state < 0:
+            # Termine d'abord l'arête commencée
+            edge, offset = divmod(-state, LABEL_SLOTS)
+            packed = packed_labels[edge]
+            position = (packed & LABEL_SLOTS - 1) - offset
+            if not labels.startswith(sequence[:position], (packed >> LABEL_BITS) + offset):
+                return None
+            if position > end:
+                return state - end
+            state = targets[edge]
+        while position < end:
+            code = LETTER_CODES.get(sequence[position])
+            mask = masks[state]
+            if code is None or not mask >> code & 1:
+                return None
+            edge = first_edge[state] + (mask & ((1 << code) - 1)).bit_count()
+            packed = packed_labels[edge]
+            length = packed & LABEL_SLOTS - 1
+            if length > 1:
+                # La première lettre est garantie par le masque
+                if not labels.startswith(sequence[position + 1:position + length],
+                                         (packed >> LABEL_BITS) + 1):
+                    return None
+                if position + length > end:
+                    return -(edge * LABEL_SLOTS + end - position)
+            position += length
+            state = targets[edge]
+        return state
+
+    def walk_hops(self, sequence: str, state: Optional[int] = None) -> int:
+        """Arêtes stockées suivies pour lire `sequence` : une par étiquette, non par lettre."""
+        hops = 0
+        if state is None:
+            state = 0
+        for char in sequence:
+            if state >= 0:
+                hops += 1
+            state = self.step(state, char)
+            if state is None:
+                break
+        return hops
+
+    def annotate(self) -> None:
+        """Annotations des seuls nœuds ; les positions internes les dérivent de leur cible."""
+        count = len(self._masks)
+        annotations: List[Optional[Tuple[int, int, int]]] = [None] * count
+        stack = [0]
+        while stack:
+            node = stack[-1]
+            if annotations[node] is not None:
+                stack.pop()
+                continue
+            edges = range(self._first_edge[node], self._first_edge[node + 1])
+            pending = [self._edge_targets[edge] for edge in edges
+                       if annotations[self._edge_targets[edge]] is None]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            children = []
+            for edge in edges:
+                label = self._label(edge)
+                children.append((label[0], label_annotation(label[1:],
+                                                             annotations[self._edge_targets[edge]])))
+            annotations[node] = self.combine_annotations(self._terminals[node], children)
+        self._reach = array('I', (annotation[0] for annotation in annotations))
+        self._min_remaining = array('B', (annotation[1] for annotation in annotations))
+        self._max_remaining = array('B', (annotation[2] for annotation in annotations))
+        self.annotated = True
+
+    def memory_usage(self) -> int:
+        """Taille en octets des tableaux des nœuds, des arêtes et de la réserve d'étiquettes."""
+        tables = (self._masks, self._terminals, self._first_edge, self._edge_targets,
+                  self._edge_labels, self._reach, self._min_remaining, self._max_remaining)
+        return sum(len(table) * table.itemsize for table in tables) + len(self._labels)
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            'word_count': self.word_count,
+            'node_count': len(self._masks),
+            'transition_count': len(self._edge_targets),
+            'label_length': sum(packed & LABEL_SLOTS - 1 for packed in self._edge_labels),
+            'label_pool_bytes': len(self._labels),
+        }
@@ -10,10 +10,11 @@ Principe: Ne placer QUE ce qui connecte.
 from dataclasses import dataclass
 from typing import List, Dict, Set, Tuple, Optional
 from ..models.board import Board
-from ..models.gaddag import GADDAG
+from ..models.gaddag import WordLexicon
 from ..models.graph import ScrabbleGraph
 from ..models.types import Direction
 from ..services.score_calculator import ScoreCalculator
+from ..utils.board_utils import BoardUtils
 
 
 # Configuration des poids pour la fonction de score unifiée
@@ -56,7 +57,7 @@ def get_occupied_cells(grille: Board) -> List[Tuple[int, int]]:
 def generer_placements_connexes(
     mot_candidat: str,
     grille: Board,
-    gaddag: GADDAG,
+    gaddag: WordLexicon,
     lettres_appui: Dict[str, Dict[str, int]]
 ) -> List[Placement]:
     """
@@ -65,13 +66,13 @@ def generer_placements_connexes(
     Génère tous les placements connexes possibles pour mot_candidat à partir
     des ancres (cellules occupées) de la grille.
     
-    Utilise le GADDAG de manière PROACTIVE pour générer des placements valides,
+    Utilise le lexique de manière PROACTIVE pour générer des placements valides,
     garantissant la connexité par construction.
     
     Args:
         mot_candidat: Le mot à placer
         grille: La grille actuelle
-        gaddag: Structure GADDAG pour validation
+        gaddag: Lexique pour la validation des mots (GADDAG ou DAWG)
         lettres_appui: Dictionnaire des lettres d'appui {mot: {lettre: position}}
     
     Returns:
@@ -126,7 +127,7 @@ def generer_placements_connexes(
     return placements_valides
 
 
-def est_placement_valide(placement: Placement, grille: Board, gaddag: GADDAG) -> bool:
+def est_placement_valide(placement: Placement, grille: Board, gaddag: WordLexicon) -> bool:
     """
     Valide qu'un placement respecte toutes les contraintes:
     1. Limites de la grille
@@ -136,7 +137,7 @@ def est_placement_valide(placement: Placement, grille: Board, gaddag: GADDAG) ->
     Args:
         placement: Le placement à valider
         grille: La grille actuelle
-        gaddag: Structure GADDAG pour validation des mots
+        gaddag: Lexique pour la validation des mots (GADDAG ou DAWG)
     
     Returns:
         True si le placement est valide, False sinon
@@ -144,6 +145,7 @@ def est_placement_valide(placement: Placement, grille: Board, gaddag: GADDAG) ->
     mot = placement.mot
     row, col = placement.position
     direction = placement.direction
+    cross_direction = Direction.VERTICAL if direction == Direction.HORIZONTAL else Direction.HORIZONTAL
     
     # Vérifier limites de la grille
     if direction == Direction.HORIZONTAL:
@@ -166,11 +168,11 @@ def est_placement_valide(placement: Placement, grille: Board, gaddag: GADDAG) ->
         
         # Vérifier les mots croisés formés perpendiculairement
         if not existing_letter:  # Nouvelle lettre placée
-            cross_word = get_cross_word(grille, current_row, current_col, direction, lettre)
-            if cross_word and len(cross_word) > 1:
-                # Un mot croisé est formé, il doit être valide
-                if not gaddag.contains(cross_word):
-                    return False
+            prefixe = BoardUtils.get_prefix(grille, current_row, current_col, cross_direction)
+            suffixe = BoardUtils.get_suffix(grille, current_row, current_col, cross_direction)
+            # Un mot croisé est formé : il doit figurer dans le lexique
+            if (prefixe or suffixe) and not gaddag.contains(prefixe + lettre + suffixe):
+                return False
     
     return True
 
@@ -517,7 +519,7 @@ def placer_mot(grille: Board, mot: str, placement: Placement, graphe: ScrabbleGr
 
 def CBIC_generer_grille(
     mots_a_reviser: List[str],
-    gaddag: GADDAG,
+    gaddag: WordLexicon,
     lettres_appui: Dict[str, Dict[str, int]],
     mot_central: str = "DATAIS"
 ) -> Tuple[Board, ScrabbleGraph, Set[str]]:
@@ -529,7 +531,7 @@ def CBIC_generer_grille(
     
     Args:
         mots_a_reviser: Liste des mots à placer sur la grille
-        gaddag: Structure GADDAG pour validation
+        gaddag: Lexique pour la validation des mots (GADDAG ou DAWG)
         lettres_appui: Dictionnaire des lettres d'appui {mot: {lettre: position}}
         mot_central: Mot de départ (par défaut "DATAIS")
     
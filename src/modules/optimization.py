@@ -523,9 +523,9 @@ def supprimer_mot(mot: str, grille: Board) -> None:
         row, col = pos
         for i in range(len(mot)):
             if col + i < grille.size and grille.get_letter(row, col + i) == mot[i]:
-                grille.grid[row][col + i] = None
+                grille.clear_letter(row, col + i)
             if row + i < grille.size and grille.get_letter(row + i, col) == mot[i]:
-                grille.grid[row + i][col] = None
+                grille.clear_letter(row + i, col)
 
 def detecter_zone_isolee(mot: str, grille: Board) -> bool:
     """Détecte si un mot est dans une zone isolée."""
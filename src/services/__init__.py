@@ -1,9 +1,11 @@
+from .cross_check_table import CrossCheckTable
 from .game_manager import GameManager
 from .move_generator import MoveGenerator
 from .score_calculator import ScoreCalculator
 from .word_validator import WordValidator
 
 __all__ = [
+    'CrossCheckTable',
     'GameManager',
     'MoveGenerator',
     'ScoreCalculator',
@@ -0,0 +1,107 @@
+from typing import List, Optional, Set, Tuple
+
+from ..models.board import Board
+from ..models.gaddag import GADDAG
+from ..models.types import Direction
+from ..utils.board_utils import BoardUtils
+from .score_calculator import ScoreCalculator
+
+STEPS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class CrossCheckTable:
+    """
+    Contrôles croisés de chaque case du plateau pour un lexique.
+
+    Pour un coup joué dans une direction, `masks[direction][row][col]` est le
+    masque des lettres (cf. `GADDAG.LETTER_BITS`) qui forment un mot valide
+    avec les lettres voisines dans l'autre direction ; toutes les lettres si
+    la case n'a pas de voisine, 0 si elle est occupée. `points` donne les
+    points des lettres déjà posées du mot croisé que formerait un jeton sur
+    la case (un joker posé ne vaut rien), None si elle n'en forme pas : le
+    score d'un mot croisé est alors `(points + valeur du jeton × lettre) × mot`.
+
+    La table suit les révisions du plateau (`Board.changes_since`) : après un
+    coup, seules les cases vides aux extrémités des lignes et colonnes
+    touchées sont recalculées. Elle est reconstruite entièrement si la grille
+    est remplacée ou si le lexique change (`GADDAG.version`).
+    """
+
+    def __init__(self, board: Board, gaddag: GADDAG, lexicon=None):
+        self.board = board
+        self.gaddag = gaddag
+        self.lexicon = lexicon
+        size = board.size
+        self.masks = {direction: [[0] * size for _ in range(size)] for direction in Direction}
+        self.points = {direction: [[None] * size for _ in range(size)] for direction in Direction}
+        self._grid = None
+        self._revision = -1
+        self._version = -1
+
+    @property
+    def anchors(self) -> Set[Tuple[int, int]]:
+        return self.board.anchors
+
+    def sync(self) -> None:
+        """Met la table à jour depuis la dernière synchronisation."""
+        board = self.board
+        if (board.grid is not self._grid or self.gaddag.version != self._version
+                or self._revision < 0):
+            self.rebuild()
+            return
+        if board.revision == self._revision:
+            return
+        for square in self._affected_squares(board.changes_since(self._revision)):
+            self._refresh_square(*square)
+        self._revision = board.revision
+
+    def rebuild(self) -> None:
+        """Recalcule toutes les cases."""
+        board = self.board
+        for row in range(board.size):
+            for col in range(board.size):
+                self._refresh_square(row, col)
+        self._grid = board.grid
+        self._revision = board.revision
+        self._version = self.gaddag.version
+
+    def _affected_squares(self, changed: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """Cases modifiées et premières cases vides au-delà des lettres qui les prolongent."""
+        board = self.board
+        affected = set(changed)
+        for row, col in changed:
+            for dr, dc in STEPS:
+                r, c = row + dr, col + dc
+                while board.get_letter(r, c):
+                    r, c = r + dr, c + dc
+                if board.is_valid_position(r, c):
+                    affected.add((r, c))
+        return affected
+
+    def _refresh_square(self, row: int, col: int) -> None:
+        board = self.board
+        occupied = bool(board.get_letter(row, col))
+        for direction in Direction:
+            if occupied:
+                self.masks[direction][row][col] = 0
+                self.points[direction][row][col] = None
+                continue
+            cross_direction = Direction.VERTICAL if direction == Direction.HORIZONTAL \
+                else Direction.HORIZONTAL
+            prefix = BoardUtils.get_prefix(board, row, col, cross_direction)
+            suffix = BoardUtils.get_suffix(board, row, col, cross_direction)
+            self.masks[direction][row][col] = self.gaddag.cross_check(prefix, suffix, self.lexicon)
+            self.points[direction][row][col] = self._tile_points(prefix + suffix) \
+                if prefix or suffix else None
+
+    @staticmethod
+    def _tile_points(tiles: str) -> int:
+        """Points des lettres déjà posées ; un joker (minuscule) ne vaut rien."""
+        return sum(ScoreCalculator.LETTER_VALUES.get(tile, 0) for tile in tiles)
+
+    def line(self, direction: Direction, index: int) -> Tuple[List[int], List[Optional[int]]]:
+        """Masques et points des mots croisés d'une ligne (`HORIZONTAL`) ou d'une colonne."""
+        masks, points = self.masks[direction], self.points[direction]
+        if direction == Direction.HORIZONTAL:
+            return masks[index], points[index]
+        return [row[index] for row in masks], [row[index] for row in points]
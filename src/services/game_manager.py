@@ -34,20 +34,9 @@ class GameManager:
         return score
 
     def suggest_moves(self, rack: str, limit: int = 5) -> List[Tuple[Move, int]]:
-        """Suggère les meilleurs coups possibles pour un rack donné."""
-        # Génère tous les coups possibles
-        moves = self.move_generator.generate_moves(rack)
-        
-        # Simule le score pour chaque coup
-        scored_moves = [
-            (move, self.score_calculator.simulate_move_score(move))
-            for move in moves
-        ]
-        
-        # Trie par score décroissant
-        scored_moves.sort(key=lambda x: x[1], reverse=True)
-        
-        return scored_moves[:limit]
+        """Suggère les meilleurs coups possibles pour un rack donné, triés par score décroissant."""
+        # Le générateur score les coups et ne garde que les `limit` meilleurs
+        return [(move, move.score) for move in self.move_generator.best_moves(rack, limit)]
 
     def undo_last_move(self) -> Optional[Tuple[Move, int]]:
         """Annule le dernier coup joué."""
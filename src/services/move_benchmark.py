@@ -0,0 +1,137 @@
+"""
+Passage à l'échelle de `MoveGenerator.generate_moves(workers=N)`.
+
+Le plateau est chargé par une partie simulée (meilleur coup à chaque tour,
+tirages d'un sac mélangé avec une graine fixe), puis tous les coups d'un
+chevalet avec jokers sont générés dans le processus courant et avec chaque
+nombre de processus demandé ; chaque résultat parallèle est comparé au
+résultat séquentiel. Le rapport JSON donne, par nombre de processus, la
+durée mesurée, l'accélération mesurée et l'accélération atteignable d'après
+le coût mesuré de chaque tâche (cf. `MoveGenerator._shards`), réparties des
+plus chargées aux moins chargées comme le fait le pool : l'écart entre les
+deux mesure ce que coûtent le pool, la sérialisation et les cœurs partagés.
+Les mesures n'ont de sens que si la machine dispose d'autant de cœurs
+(`cpu_count` dans le rapport).
+
+    python -m src.services.move_benchmark mots.txt --processus 1 2 4 8 16
+"""
+
+import contextlib
+import heapq
+import io
+import json
+import os
+import random
+import time
+from typing import Dict, List, Sequence
+
+from ..models.board import Board
+from ..models.gaddag import GADDAG
+from . import move_generator
+from .move_generator import MoveGenerator
+
+# Sac de la partie simulée : distribution française, `_` pour un joker
+TILE_BAG = ("A" * 9 + "B" * 2 + "C" * 2 + "D" * 3 + "E" * 15 + "F" * 2 + "G" * 2 + "H" * 2
+            + "I" * 8 + "JKQWXYZ" + "L" * 5 + "M" * 3 + "N" * 6 + "O" * 6 + "P" * 2
+            + "R" * 6 + "S" * 6 + "T" * 6 + "U" * 6 + "V" * 2 + "__")
+
+
+def crowded_board(gaddag: GADDAG, turns: int = 20, seed: int = 1) -> Board:
+    """Plateau après `turns` coups d'une partie où chaque tour joue le meilleur coup."""
+    board = Board()
+    generator = MoveGenerator(gaddag, board)
+    bag = list(TILE_BAG)
+    random.Random(seed).shuffle(bag)
+    rack: List[str] = []
+    with contextlib.redirect_stdout(io.StringIO()):  # Board.place_letter trace chaque pose
+        for _ in range(turns):
+            while len(rack) < 7 and bag:
+                rack.append(bag.pop())
+            best = generator.best_moves(''.join(rack), 1)
+            if not best:
+                break
+            move = best[0]
+            board.apply_move(move, move.score)
+            for letter in move.word:
+                tile = '_' if letter.islower() else letter
+                if tile in rack:
+                    rack.remove(tile)
+    return board
+
+
+def projected_speedup(costs: Sequence[float], workers: int, serial: float = 0.0) -> float:
+    """
+    Accélération atteignable avec `workers` processus pour des tâches de
+    coûts `costs` confiées, des plus chères aux moins chères, au premier
+    processus libre ; `serial` est le temps passé hors des tâches.
+    """
+    loads = [0.0] * max(1, workers)
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    total = sum(costs) + serial
+    return total / (max(loads) + serial) if total else 1.0
+
+
+def benchmark(gaddag: GADDAG, rack: str = "ERSTA__", workers: Sequence[int] = (1, 2, 4, 8),
+              turns: int = 20, seed: int = 1, repeat: int = 3) -> Dict[str, object]:
+    """Durées de `generate_moves` pour chaque nombre de processus, sur un plateau chargé."""
+    board = crowded_board(gaddag, turns, seed)
+    generator = MoveGenerator(gaddag, board)
+    generator.cross_checks.sync()
+
+    def best_time(count: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            moves = generator.generate_moves(rack, count)
+            timings.append(time.perf_counter() - started)
+            if moves != reference:
+                raise AssertionError(f"Résultat parallèle différent avec {count} processus")
+        return min(timings)
+
+    started = time.perf_counter()
+    reference = generator.generate_moves(rack)
+    sequential = min([time.perf_counter() - started] + [best_time(1)])
+
+    runs = []
+    for count in workers:
+        # Coût de chaque tâche de ce découpage, mesuré dans le processus courant
+        move_generator._init_worker(generator, rack)
+        costs = []
+        for shard in generator._shards(generator.gaddag.rack_counts(rack), count):
+            started = time.perf_counter()
+            move_generator._shard_moves(shard)
+            costs.append(time.perf_counter() - started)
+        seconds = best_time(count)
+        runs.append({
+            'workers': count,
+            'seconds': seconds,
+            'speedup': sequential / seconds,
+            'projected_speedup': projected_speedup(costs, count),
+            'shards': len(costs),
+            'largest_shard_seconds': max(costs, default=0.0),
+        })
+    return {
+        'cpu_count': os.cpu_count(),
+        'rack': rack,
+        'tiles_on_board': sum(1 for row in board.grid for letter in row if letter),
+        'anchors': len(board.anchors),
+        'moves': len(reference),
+        'sequential_seconds': sequential,
+        'runs': runs,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Passage à l'échelle de la génération de coups (JSON).")
+    parser.add_argument("source", help="Fichier texte, un mot par ligne")
+    parser.add_argument("--chevalet", default="ERSTA__", help="Chevalet, `_` pour un joker")
+    parser.add_argument("--processus", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--tours", type=int, default=20, help="Coups joués avant la mesure")
+    parser.add_argument("--graine", type=int, default=1)
+    args = parser.parse_args()
+    lexicon = GADDAG.from_sorted_words(GADDAG.prepare_words(GADDAG.read_word_list(args.source)))
+    print(json.dumps(benchmark(lexicon, args.chevalet, args.processus, args.tours, args.graine),
+                     indent=2))
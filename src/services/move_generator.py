@@ -1,246 +1,583 @@
-import string
-from typing import Dict, List, Set, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import multiprocessing
+import os
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from ..models.types import Direction, Move
+from .cross_check_table import CrossCheckTable
 from .score_calculator import ScoreCalculator
 from .word_validator import WordValidator
-from ..models.node import Node
-from ..models.gaddag import GADDAG
+from ..models.gaddag import ALL_LETTERS_MASK, BLANK_SLOT, DEAD_LENGTH, GADDAG, mask_letters
+from ..models.flat_gaddag import FlatGADDAG
+from ..models.lexicon_view import LexiconView
 from ..models.board import Board
-from ..models.rack import Rack
 from ..utils.board_utils import BoardUtils
 
+LETTER_VALUES = ScoreCalculator.LETTER_VALUES
+# En dessous de ce nombre d'ancres, le lancement d'un pool coûte plus qu'il ne rapporte
+PARALLEL_MIN_ANCHORS = 24
+# Tâches visées par processus : lignes et ancres chargées sont coupées pour équilibrer la charge
+SHARDS_PER_WORKER = 16
+
+
+class Reach(NamedTuple):
+    """
+    Cases couvertes par le prolongement d'un mot dans un sens, à partir
+    d'une case, selon le nombre k de jetons posés de ce côté.
+    """
+    board_points: List[int]                # lettres du plateau couvertes
+    letter_multipliers: List[List[int]]    # multiplicateurs de lettre, décroissants
+    word_multiplier: List[int]             # produit des multiplicateurs de mot
+    cross_points: List[int]                # mots croisés formés, hors jeton posé
+    cross_weight: List[int]                # poids du jeton posé dans ces mots croisés
+
+
+NO_REACH = Reach([0], [[]], [1], [0], [0])
+
+
+class BoardLine(NamedTuple):
+    """Une ligne ou une colonne du plateau vue par le générateur, case par case."""
+    direction: Direction
+    squares: List[Tuple[int, int]]
+    letters: List[Optional[str]]     # lettres posées, None si la case est vide
+    anchors: List[bool]
+    cross: List[int]                 # masques des contrôles croisés
+    cross_points: List[Optional[int]]  # points du mot croisé existant, None sans mot croisé
+    multipliers: List[Tuple[int, int]]  # (lettre, mot) encore disponibles
+    reaches: Dict[Tuple[int, int], Reach]  # (case, sens) -> Reach, cf. MoveGenerator._reach
+
+
+# Tâche du pool : (direction, ligne, ((ancre, masque des lettres posées sur l'ancre), ...))
+Shard = Tuple[Direction, int, Tuple[Tuple[int, int], ...]]
+# Pool : (contexte multiprocessing, initialisation des processus, ses arguments)
+PoolSetup = Tuple[multiprocessing.context.BaseContext, Callable[..., None], tuple]
+
+
 class MoveGenerator:
     """Générateur de coups possibles pour le Scrabble."""
     
-    def __init__(self, gaddag: GADDAG, board: Board):
+    def __init__(self, gaddag: GADDAG, board: Board, lexicon=None):
         self.gaddag = gaddag
         self.board = board
-        self.validator = WordValidator(board, gaddag)
+        self.lexicon = lexicon
+        self._lexicons = gaddag.lexicon_mask(lexicon)
+        # Une vue n'a que des états terminaux approchés : chaque mot est confirmé
+        self._accepts = gaddag.accepts if isinstance(gaddag, LexiconView) else None
+        self.validator = WordValidator(board, gaddag, lexicon)
         self.score_calculator = ScoreCalculator(board)
         self.board_utils = BoardUtils()
-        self._blank_letter = '_'  # Ajouter cette constante
+        self.cross_checks = CrossCheckTable(board, gaddag, lexicon)
 
-    def generate_moves(self, rack_str: str) -> List[Move]:  # Fix syntax error in type hint
-        """Génère tous les coups possibles pour un rack donné."""
-        moves: List[Move] = []
-        rack = Rack(rack_str)
-        
-        # Analyse le plateau pour trouver les contraintes
-        constraints = self._analyze_board()
-        
-        # Pour chaque point d'ancrage
-        for (row, col), directions in constraints.items():
-            # Pour chaque direction possible
-            for direction, valid_letters in directions.items():
-                dir_enum = Direction(direction)
-                
-                # Définit le contexte de recherche
-                prefix = self._get_prefix(row, col, dir_enum)
-                suffix = self._get_suffix(row, col, dir_enum)
-                
-                # Si on a un préfixe, vérifie s'il existe dans le GADDAG
-                if prefix:
-                    node = self.gaddag.root
-                    reversed_prefix = prefix[::-1]  # Il faut inverser le préfixe !
-                    for char in reversed_prefix:
-                        if not node.has_transition(char):
-                            break  # On devrait break ici, pas continue
-                        node = node.get_transition(char)
-                        
-                # Trouve les lettres possibles à cette position
-                available_letters = rack.get_possible_letters()
-                if valid_letters:
-                    available_letters &= valid_letters
-                
-                # Pour chaque lettre possible
-                for letter in available_letters:
-                    temp_rack = Rack(rack_str)
-                    temp_rack.remove_letters(letter)
-                    
-                    # Cherche les mots possibles avec cette lettre
-                    words = self._find_words(row, col, dir_enum, letter, temp_rack)
-                    
-                    # Ajoute les mouvements trouvés
-                    for word in words:
-                        # Calcule la position de départ du mot
-                        start_row = row
-                        start_col = col
-                        if dir_enum == Direction.HORIZONTAL:
-                            start_col -= len(prefix)
-                        else:
-                            start_row -= len(prefix)
-                            
-                        moves.append(Move(
-                            word=word,
-                            row=start_row,
-                            col=start_col,
-                            direction=dir_enum,
-                            score=self.score_calculator.calculate_move_score(Move(
-                                word=word,
-                                row=start_row,
-                                col=start_col,
-                                direction=dir_enum
-                            ))
-                        ))
-        
+    def generate_moves(self, rack_str: str, workers: Optional[int] = 1) -> List[Move]:
+        """
+        Génère tous les coups jouables avec le chevalet (cf. `iter_moves`).
+
+        Avec `workers` > 1 (None : un processus par cœur), les ancres sont
+        réparties sur un pool de processus, sauf si le plateau en compte
+        moins de `PARALLEL_MIN_ANCHORS` ou si les processus ne peuvent pas
+        partager le lexique (cf. `_pool_setup`). Le résultat est identique à
+        celui du calcul en processus courant, dans le même ordre.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers > 1:
+            self.cross_checks.sync()
+            if len(self.board.anchors) >= PARALLEL_MIN_ANCHORS:
+                setup = self._pool_setup(rack_str)
+                if setup is not None:
+                    return self._generate_parallel(rack_str, workers, setup)
+        return list(self.iter_moves(rack_str))
+
+    def _pool_setup(self, rack_str: str) -> Optional[PoolSetup]:
+        """
+        Contexte, initialisation et arguments des processus du pool, ou None
+        si le lexique ne peut pas y être partagé en lecture seule.
+
+        Avec `fork`, les processus héritent du générateur tel quel. Sinon
+        (`spawn` sous macOS et Windows), seul un `FlatGADDAG` ouvert depuis un
+        fichier se partage : chaque processus le projette à son tour
+        (`FlatGADDAG.open`) et reçoit une copie du plateau, dont il recalcule
+        les contrôles croisés. Un lexique en mémoire serait copié dans chaque
+        processus : le calcul reste alors dans le processus courant.
+        """
+        methods = multiprocessing.get_all_start_methods()
+        if 'fork' in methods:
+            return multiprocessing.get_context('fork'), _init_worker, (self, rack_str)
+        path = self.gaddag.path if isinstance(self.gaddag, FlatGADDAG) else None
+        if path is None:
+            return None
+        return (multiprocessing.get_context('spawn'), _open_worker,
+                (path, self.board, self.lexicon, rack_str))
+
+    def _generate_parallel(self, rack_str: str, workers: int, setup: PoolSetup) -> List[Move]:
+        """
+        Coups calculés par morceaux de ligne dans un pool de processus.
+
+        Les processus sont créés par `fork` quand le système le permet : ils
+        héritent du lexique (y compris projeté en mémoire, cf.
+        `FlatGADDAG.open`), du plateau et des contrôles croisés déjà à jour,
+        sans copie ni sérialisation, et ne les modifient pas (cf.
+        `_pool_setup` pour les autres modes de démarrage). Chaque tâche
+        couvre des ancres consécutives d'une ligne, une ancre chargée pouvant
+        être partagée entre plusieurs tâches selon la lettre qui y est posée
+        (cf. `_shards`) ; chaque processus renvoie des tuples (mot, case,
+        score), plus légers à sérialiser que des `Move`. Les résultats sont
+        replacés dans l'ordre du calcul séquentiel : la fusion est
+        déterministe. Chaque coup n'est produit que par l'ancre la plus à
+        gauche (ou la plus haute) qu'il couvre, et un jeton seul seulement à
+        l'horizontale : les tâches sont donc disjointes et leur concaténation
+        est sans doublon.
+        """
+        counts = self.gaddag.rack_counts(rack_str.upper())
+        if not any(counts):
+            return []
+        shards = self._shards(counts, workers)
+        workers = min(workers, len(shards))
+        by_load = sorted(range(len(shards)), key=lambda i: -len(shards[i][2]))
+        context, initializer, initargs = setup
+        results: List[List[Tuple[str, int, int]]] = [[] for _ in shards]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=initializer, initargs=initargs) as pool:
+            for i, found in zip(by_load, pool.map(_shard_moves, [shards[i] for i in by_load])):
+                results[i] = found
+        moves = []
+        for (direction, index, _), found in zip(shards, results):
+            for word, pos, score in found:
+                row, col = (index, pos) if direction == Direction.HORIZONTAL else (pos, index)
+                moves.append(Move(word=word, row=row, col=col, direction=direction, score=score))
         return moves
 
+    def _shards(self, counts: List[int], workers: int) -> List[Shard]:
+        """
+        Tâches (direction, ligne, ((ancre, masque), ...)) dans l'ordre du
+        calcul séquentiel. L'unité de travail est une lettre posée sur une
+        ancre : `iter_moves` épuise chaque lettre, dans l'ordre des arcs du
+        premier état, avant la suivante, si bien que des lettres consécutives
+        forment une tranche de son résultat. Les unités d'une ligne sont
+        regroupées par paquets pour viser `SHARDS_PER_WORKER` tâches par
+        processus ; le masque restreint les lettres admises sur l'ancre.
+        """
+        gaddag = self.gaddag
+        playable = ALL_LETTERS_MASK if counts[BLANK_SLOT] else sum(
+            1 << slot for slot in range(BLANK_SLOT) if counts[slot])
+        order = [1 << (ord(char) - 65) for char, _ in gaddag.edges(gaddag.start_state())
+                 if char != gaddag.DELIMITER]
+        masks = self.cross_checks.masks
+        by_line: Dict[Tuple[Direction, int], List[Tuple[int, int]]] = {}
+        for row, col in sorted(self.board.anchors):
+            for direction, index, pos in ((Direction.HORIZONTAL, row, col), (Direction.VERTICAL, col, row)):
+                allowed = masks[direction][row][col] & playable
+                by_line.setdefault((direction, index), []).extend(
+                    (pos, bit) for bit in order if bit & allowed)
+        total = sum(len(units) for units in by_line.values())
+        limit = max(1, -(-total // (workers * SHARDS_PER_WORKER)))
+        shards = []
+        for direction in Direction:
+            for index in range(self.board.size):
+                units = by_line.get((direction, index), [])
+                for start in range(0, len(units), limit):
+                    groups: List[Tuple[int, int]] = []
+                    for pos, bit in units[start:start + limit]:
+                        if groups and groups[-1][0] == pos:
+                            groups[-1] = (pos, groups[-1][1] | bit)
+                        else:
+                            groups.append((pos, bit))
+                    shards.append((direction, index, tuple(groups)))
+        return shards
+
+    def iter_moves(self, rack_str: str) -> Iterator[Move]:
+        """
+        Produit les coups jouables avec le chevalet (algorithme de Gordon),
+        ancre par ancre, sans les accumuler.
+
+        Chaque ligne et chaque colonne est parcourue depuis ses cases d'ancrage
+        (cases vides voisines d'une lettre, ou le centre sur un plateau vide) :
+        le GADDAG est lu vers la gauche depuis l'ancre, lettres du chevalet ou
+        du plateau, puis, après le délimiteur, vers la droite. Les lettres
+        posées sont filtrées par les contrôles croisés de leur case, si bien
+        que chaque coup produit est valide sans revalidation. Le chevalet est
+        un tableau de 27 compteurs (cf. `GADDAG.rack_counts`) décrémenté et
+        rétabli au fil du parcours ; un joker est noté en minuscule. Ancres et
+        contrôles croisés sont lus dans `self.cross_checks`, mis à jour
+        d'après les cases modifiées depuis l'appel précédent. Le score est
+        cumulé le long du parcours (mot principal, multiplicateur de mot, mots
+        croisés d'après les points précalculés de chaque case) : il est
+        définitif dès que le coup est produit. Le plateau ne doit pas changer
+        pendant l'itération.
+        """
+        counts = self.gaddag.rack_counts(rack_str.upper())
+        if not any(counts):
+            return
+        self.cross_checks.sync()
+        for direction in Direction:
+            for index in range(self.board.size):
+                line = self._line(direction, index)
+                anchors = [pos for pos, anchor in enumerate(line.anchors) if anchor]
+                if anchors:
+                    yield from self._generate_line(line, anchors, counts)
+
+    def best_moves(self, rack_str: str, limit: int = 5) -> List[Move]:
+        """
+        Les `limit` coups de meilleur score, du meilleur au moins bon.
+
+        Les ancres sont explorées par majorant de score décroissant (cf.
+        `_bound`) et les meilleurs coups gardés dans un tas de taille
+        `limit` : dès que le majorant d'une ancre ne dépasse plus le plus
+        faible score retenu, les ancres restantes sont abandonnées. Dans une
+        ancre, une fois le début du mot fixé, le mot est abandonné si son
+        score partiel, complété au mieux vers la droite par les lettres qui
+        peuvent encore le prolonger (annotations du lexique, cf.
+        `GADDAG.annotate`), ne peut pas battre ce score.
+        """
+        counts = self.gaddag.rack_counts(rack_str.upper())
+        if limit <= 0 or not any(counts):
+            return []
+        self.cross_checks.sync()
+        values = self._tile_values(counts)
+        candidates = []
+        for direction in Direction:
+            for index in range(self.board.size):
+                line = self._line(direction, index)
+                for pos, anchor in enumerate(line.anchors):
+                    if anchor:
+                        bound = self._anchor_bound(self._reach(line, pos, -1),
+                                                   self._reach(line, pos + 1, 1), values)
+                        candidates.append((-bound, direction.value, index, pos, line))
+        candidates.sort(key=lambda candidate: candidate[:4])
+
+        heap: List[Tuple[int, int, Move]] = []  # (score, -rang, coup) : le plus faible en tête
+
+        def floor() -> int:
+            return heap[0][0] if len(heap) == limit else -1
+
+        rank = 0
+        for negative_bound, _, _, pos, line in candidates:
+            if -negative_bound <= floor():
+                break
+            for move in self._generate_line(line, [pos], counts, floor):
+                rank += 1
+                if len(heap) < limit:
+                    heapq.heappush(heap, (move.score, -rank, move))
+                elif move.score > heap[0][0]:
+                    heapq.heapreplace(heap, (move.score, -rank, move))
+        return [move for _, _, move in sorted(heap, reverse=True)]
+
+    def _line_squares(self, direction: Direction, index: int) -> List[Tuple[int, int]]:
+        size = self.board.size
+        if direction == Direction.HORIZONTAL:
+            return [(index, pos) for pos in range(size)]
+        return [(pos, index) for pos in range(size)]
+
+    def _line(self, direction: Direction, index: int) -> BoardLine:
+        """Contraintes d'une ligne (`HORIZONTAL`) ou d'une colonne, case par case."""
+        squares = self._line_squares(direction, index)
+        letters = [self.board.get_letter(row, col) for row, col in squares]
+        anchor_squares = self.board.anchors
+        cross, cross_points = self.cross_checks.line(direction, index)
+        multipliers: List[Tuple[int, int]] = [
+            (1, 1) if letters[pos] else self.board.get_square_multipliers(row, col)
+            for pos, (row, col) in enumerate(squares)]
+        return BoardLine(direction, squares, letters, [square in anchor_squares for square in squares],
+                         cross, cross_points, multipliers, {})
+
+    @classmethod
+    def _tile_values(cls, counts: List[int]) -> List[int]:
+        """Points des jetons du chevalet, du plus cher au moins cher (joker : 0)."""
+        return sorted((LETTER_VALUES[chr(slot + 65)] for slot in range(BLANK_SLOT)
+                       for _ in range(counts[slot])), reverse=True) + [0] * counts[BLANK_SLOT]
+
+    @staticmethod
+    def _reach(line: BoardLine, start: int, step: int) -> Reach:
+        """Cases couvertes à partir de `start` dans le sens `step` (-1 vers la gauche, 1 vers la droite)."""
+        reach = line.reaches.get((start, step))
+        if reach is not None:
+            return reach
+        letters, size = line.letters, len(line.letters)
+        board_points, word_multiplier, cross_points, cross_weight = 0, 1, 0, 0
+        letter_multipliers: List[int] = []
+        reach = Reach([], [], [], [], [])
+        pos = start
+        while True:
+            # Lettres du plateau accolées, qui font partie du mot
+            while 0 <= pos < size and letters[pos]:
+                board_points += LETTER_VALUES.get(letters[pos], 0)
+                pos += step
+            reach.board_points.append(board_points)
+            reach.letter_multipliers.append(sorted(letter_multipliers, reverse=True))
+            reach.word_multiplier.append(word_multiplier)
+            reach.cross_points.append(cross_points)
+            reach.cross_weight.append(cross_weight)
+            if not 0 <= pos < size or len(letter_multipliers) == 7:
+                break
+            letter_multiplier, multiplier = line.multipliers[pos]
+            letter_multipliers.append(letter_multiplier)
+            word_multiplier *= multiplier
+            if line.cross_points[pos] is not None:
+                cross_points += line.cross_points[pos] * multiplier
+                cross_weight += letter_multiplier * multiplier
+            pos += step
+        line.reaches[(start, step)] = reach
+        return reach
+
+    @classmethod
+    def _bound(cls, main: int, word_multiplier: int, cross: int, left: Reach, right: Reach,
+               values: List[int], remaining: int, bingo: bool) -> int:
+        """
+        Majorant du score d'un coup dont le mot principal vaut déjà `main`
+        (multiplié par `word_multiplier`) et les mots croisés `cross`, qui
+        pose encore au plus `remaining` des jetons `values` (points
+        décroissants) à gauche (`left`) et à droite (`right`). Optimiste : les
+        deux côtés reçoivent chacun jusqu'à `remaining` jetons, les plus chers
+        sur les meilleures cases lettre et dans chaque mot croisé. Le bonus
+        est compté si `bingo` et s'il reste assez de cases pour tous les jetons.
+        """
+        left_max, right_max = len(left.board_points) - 1, len(right.board_points) - 1
+        # Chaque côté au maximum de ce qu'il peut recevoir : couvre toutes les répartitions
+        bound = cls._split_bound(main, word_multiplier, cross, left, right, values,
+                                 min(remaining, left_max), min(remaining, right_max))
+        if bingo and left_max + right_max >= len(values):
+            bound += ScoreCalculator.BINGO_BONUS
+        return bound
+
+    @classmethod
+    def _anchor_bound(cls, left: Reach, right: Reach, values: List[int]) -> int:
+        """
+        Majorant du score des coups d'une ancre : `left` part de l'ancre vers
+        la gauche, `right` de la case suivante. Plus serré que `_bound`, il
+        essaie chaque répartition des jetons entre les deux côtés.
+        """
+        left_max, right_max = len(left.board_points) - 1, len(right.board_points) - 1
+        tiles = min(len(values), left_max + right_max)
+        bound = max(cls._split_bound(0, 1, 0, left, right, values, k, tiles - k)
+                    for k in range(max(1, tiles - right_max), min(tiles, left_max) + 1))
+        if len(values) == 7 and tiles == 7:
+            bound += ScoreCalculator.BINGO_BONUS
+        return bound
+
+    @staticmethod
+    def _split_bound(main: int, word_multiplier: int, cross: int, left: Reach, right: Reach,
+                     values: List[int], k: int, j: int) -> int:
+        """Majorant avec `k` jetons à gauche et `j` à droite."""
+        letter_multipliers = left.letter_multipliers[k]
+        if j:
+            letter_multipliers = sorted(letter_multipliers + right.letter_multipliers[j], reverse=True)
+        return ((main + left.board_points[k] + right.board_points[j]
+                 + sum(value * multiplier for value, multiplier in zip(values, letter_multipliers)))
+                * word_multiplier * left.word_multiplier[k] * right.word_multiplier[j]
+                + cross + left.cross_points[k] + right.cross_points[j]
+                + (values[0] if values else 0) * (left.cross_weight[k] + right.cross_weight[j]))
+
+    def _generate_line(self, line: BoardLine, anchor_positions: List[int], counts: List[int],
+                       floor: Optional[Callable[[], int]] = None) -> Iterator[Move]:
+        """
+        Coups partant des ancres données d'une ligne ; `counts` est rétabli
+        entre deux ancres. Avec `floor` (score à dépasser), les débuts de mots
+        dont le majorant (cf. `_bound`) ne dépasse pas `floor` sont abandonnés.
+        """
+        gaddag = self.gaddag
+        direction, squares, letters, anchors = line.direction, line.squares, line.letters, line.anchors
+        cross, cross_points, multipliers = line.cross, line.cross_points, line.multipliers
+        size = len(squares)
+        delimiter = gaddag.DELIMITER
+        lexicons = self._lexicons
+        accepts = self._accepts
+        step, edges, terminal_mask = gaddag.step, gaddag.edges, gaddag.terminal_mask
+        word = [''] * size
+        placed: List[int] = []  # cases des jetons posés, dans l'ordre du parcours
+        moves: List[Move] = []
+        tiles = sum(counts)
+        annotation = gaddag.annotation if gaddag.annotated else None
+        # Score partiel du chemin : mot principal, son multiplicateur, mots croisés
+        main, word_multiplier, cross_score = 0, 1, 0
+
+        values = self._tile_values(counts)  # points des jetons restants, décroissants
+
+        def hopeless(target, pos: int) -> bool:
+            """
+            Vrai si aucun mot prolongeant vers la droite le chemin (dernière
+            case lue `pos`) ne peut dépasser `floor`.
+            """
+            threshold = floor()
+            if threshold < 0:
+                return False
+            remaining = len(values)
+            if annotation is not None:
+                reach, low, high = annotation(target)
+                if low == DEAD_LENGTH:
+                    return True
+                remaining = min(remaining, high)
+            right = self._reach(line, pos + 1, 1)
+            bound = self._bound(main, word_multiplier, cross_score, NO_REACH, right, values, remaining, False)
+            if bound > threshold:
+                return False
+            if tiles != 7 or bound + ScoreCalculator.BINGO_BONUS <= threshold:
+                return True
+            # Seul le bonus peut suffire : il faut poser tout le chevalet, donc
+            # que chaque lettre restante (hors jokers) figure encore dans les
+            # mots atteignables.
+            if annotation is not None and (high < len(values) or rack_mask() & ~reach):
+                return True
+            return self._bound(main, word_multiplier, cross_score, NO_REACH, right,
+                               values, remaining, True) <= threshold
+
+        def rack_mask() -> int:
+            return sum(1 << slot for slot in range(BLANK_SLOT) if counts[slot])
+
+        def record(start: int, end: int) -> None:
+            # Un jeton seul formant aussi un mot horizontal est déjà produit à l'horizontale
+            if len(placed) == 1 and direction == Direction.VERTICAL \
+                    and cross_points[placed[0]] is not None:
+                return
+            text = ''.join(word[start:end + 1])
+            if accepts is not None and not accepts(text.upper()):
+                return
+            row, col = squares[start]
+            score = main * word_multiplier + cross_score
+            if len(placed) == 7:
+                score += ScoreCalculator.BINGO_BONUS
+            moves.append(Move(word=text, row=row, col=col, direction=direction, score=score))
+
+        def place(pos: int, state, extend, *args) -> None:
+            """Pose sur la case vide `pos` chaque jeton admis puis prolonge avec `extend`."""
+            nonlocal main, word_multiplier, cross_score
+            mask = cross[pos]
+            letter_multiplier, multiplier = multipliers[pos]
+            crossing = cross_points[pos]
+            saved = main, word_multiplier, cross_score
+            for char, target in edges(state):
+                if char == delimiter:
+                    continue
+                slot = ord(char) - 65
+                if not mask >> slot & 1:
+                    continue
+                for tile_slot, tile in ((slot, char), (BLANK_SLOT, char.lower())):
+                    if not counts[tile_slot]:
+                        continue
+                    counts[tile_slot] -= 1
+                    word[pos] = tile
+                    placed.append(pos)
+                    points = 0 if tile_slot == BLANK_SLOT else LETTER_VALUES[char] * letter_multiplier
+                    main = saved[0] + points
+                    word_multiplier = saved[1] * multiplier
+                    if crossing is not None:
+                        cross_score = saved[2] + (crossing + points) * multiplier
+                    if floor is None:
+                        extend(pos, target, *args)
+                    else:
+                        value = 0 if tile_slot == BLANK_SLOT else LETTER_VALUES[char]
+                        values.remove(value)
+                        # Vers la gauche le majorant reste trop lâche pour payer son calcul
+                        if extend is go_left or not hopeless(target, pos):
+                            extend(pos, target, *args)
+                        values.append(value)
+                        values.sort(reverse=True)
+                    main, word_multiplier, cross_score = saved
+                    placed.pop()
+                    counts[tile_slot] += 1
+
+        def read_board(pos: int, state, extend, *args) -> None:
+            """Compte la lettre du plateau en `pos` (sans multiplicateur) puis prolonge."""
+            nonlocal main
+            points = LETTER_VALUES.get(letters[pos], 0)
+            main += points
+            extend(pos, state, *args)
+            main -= points
+
+        def go_left(pos: int, state) -> None:
+            """`state` a lu les cases de l'ancre jusqu'à `pos` incluse, vers la gauche."""
+            left = pos - 1
+            if left < 0 or not letters[left]:
+                # Le mot peut commencer en `pos` : on franchit le délimiteur
+                after = step(state, delimiter)
+                if after is not None:
+                    right = anchor + 1
+                    if (right >= size or not letters[right]) and terminal_mask(after) & lexicons:
+                        record(pos, anchor)
+                    if right < size:
+                        go_right(right, after, pos)
+            if left < 0:
+                return
+            if letters[left]:
+                target = step(state, letters[left].upper())
+                if target is not None:
+                    word[left] = letters[left]
+                    read_board(left, target, go_left)
+            elif not anchors[left]:
+                # Une ancre à gauche produit elle-même les coups qui la couvrent
+                place(left, state, go_left)
+
+        def go_right(pos: int, state, start: int) -> None:
+            """Lit la case `pos` à droite de la partie déjà formée du mot."""
+            if letters[pos]:
+                target = step(state, letters[pos].upper())
+                if target is not None:
+                    word[pos] = letters[pos]
+                    read_board(pos, target, went_right, start)
+            else:
+                place(pos, state, went_right, start)
+
+        def went_right(pos: int, state, start: int) -> None:
+            following = pos + 1
+            if (following >= size or not letters[following]) and terminal_mask(state) & lexicons:
+                record(start, pos)
+            if following < size:
+                go_right(following, state, start)
+
+        for anchor in anchor_positions:
+            place(anchor, gaddag.start_state(), go_left)
+            yield from moves
+            moves.clear()
+
     def _analyze_board(self) -> Dict[Tuple[int, int], Dict[str, Set[str]]]:
-        """Analyse le plateau pour trouver les points d'ancrage et leurs contraintes."""
+        """Points d'ancrage et, par direction, les lettres admises par les mots croisés."""
+        self.cross_checks.sync()
+        masks = self.cross_checks.masks
         constraints: Dict[Tuple[int, int], Dict[str, Set[str]]] = {}
-        
-        def add_constraint(row: int, col: int, direction: str, letters: Set[str]) -> None:
-            pos = (row, col)
-            if pos not in constraints:
-                constraints[pos] = {}
-            constraints[pos][direction] = letters
-
-        # On ne doit analyser que les points d'ancrage non-internes
-        for row in range(self.board.size):
-            for col in range(self.board.size):
-                if not self.board.get_letter(row, col) and not self._is_internal_anchor(row, col):
-                    adjacent = False
-                    
-                    for d in Direction:
-                        # Vérifie si il y a des lettres adjacentes dans la direction opposée
-                        if d == Direction.HORIZONTAL:
-                            has_cross = (row > 0 and self.board.get_letter(row-1, col)) or \
-                                      (row < self.board.size-1 and self.board.get_letter(row+1, col))
-                        else:
-                            has_cross = (col > 0 and self.board.get_letter(row, col-1)) or \
-                                       (col < self.board.size-1 and self.board.get_letter(row, col+1))
-                        
-                        if has_cross:
-                            adjacent = True
-                            valid_letters = self._get_valid_letters(row, col, d)
-                            if valid_letters:
-                                add_constraint(row, col, d.value, valid_letters)
-                    
-                    if adjacent:
-                        for d in Direction:
-                            if d.value not in constraints.get((row, col), {}):
-                                add_constraint(row, col, d.value, set(string.ascii_uppercase))
-        
+        for row, col in sorted(self.board.anchors):
+            letters = {direction.value: mask_letters(masks[direction][row][col])
+                       for direction in Direction}
+            constraints[(row, col)] = {direction: valid for direction, valid in letters.items()
+                                       if valid}
         return constraints
 
-    def _get_valid_letters(self, row: int, col: int, direction: Direction) -> Set[str]:
-        """Détermine les lettres valides pour une position donnée."""
-        # Commence avec toutes les lettres possibles
-        valid_letters = set(string.ascii_uppercase)
-        
-        # Obtient le préfixe et le suffixe
-        prefix = self._get_prefix(row, col, direction)
-        suffix = self._get_suffix(row, col, direction)
-        
-        if prefix or suffix:
-            node = self.gaddag.root
-            
-            # Navigue jusqu'au nœud approprié
-            if prefix:
-                reversed_prefix = prefix[::-1]
-                for char in reversed_prefix:
-                    if not node.has_transition(char):
-                        return set()
-                    node = node.get_transition(char)
-                    
-            # Ajoute le délimiteur
-            if not node.has_transition(self.gaddag.DELIMITER):
-                return set()
-            node = node.get_transition(self.gaddag.DELIMITER)
-            
-            # Vérifie le suffixe
-            if suffix:
-                temp_node = node
-                for char in suffix:
-                    if not temp_node.has_transition(char):
-                        return set()
-                    temp_node = temp_node.get_transition(char)
-            
-            # Retourne les lettres valides à cette position
-            return set(node.transitions.keys())
-            
-        return valid_letters
-
     def _get_prefix(self, row: int, col: int, direction: Direction) -> str:
         return self.board_utils.get_prefix(self.board, row, col, direction)
 
     def _get_suffix(self, row: int, col: int, direction: Direction) -> str:
         return self.board_utils.get_suffix(self.board, row, col, direction)
 
-    def _is_internal_anchor(self, row: int, col: int) -> bool:
-        """
-        Vérifie si une position est un point d'ancrage interne dans une séquence continue.
-        Selon l'algorithme GADDAG, on peut ignorer ces points pour optimiser la recherche.
-        """
-        # Vérifie horizontalement
-        has_left = col > 0 and self.board.get_letter(row, col-1)
-        has_right = col < self.board.size-1 and self.board.get_letter(row, col+1)
-        if has_left and has_right:
-            return True
-            
-        # Vérifie verticalement
-        has_up = row > 0 and self.board.get_letter(row-1, col)
-        has_down = row < self.board.size-1 and self.board.get_letter(row+1, col)
-        return has_up and has_down
-
-    def _find_words(self, row: int, col: int, direction: Direction, 
-                   letter: str, rack: Rack) -> List[str]:
-        """Trouve tous les mots possibles à partir d'une position et d'une lettre."""
-        words: List[str] = []
-        if self._is_internal_anchor(row, col):
-            return words
-
-        prefix = self._get_prefix(row, col, direction)
-        current_node = self.gaddag.root
-
-        # Navigation GADDAG
-        if prefix:
-            for char in prefix[::-1]:
-                if not current_node.has_transition(char):
-                    return words
-                current_node = current_node.get_transition(char)
-
-        if not current_node.has_transition(self.gaddag.DELIMITER):
-            return words
-        current_node = current_node.get_transition(self.gaddag.DELIMITER)
-
-        def explore_suffixes(node: Node, used_letters: str, remaining_rack: Rack) -> None:
-            if node.is_terminal:
-                word = prefix + letter + used_letters
-                # Utiliser directement le validateur pour tout vérifier
-                if self.validator.is_valid_move(word, row, col, direction):
-                    words.append(word)
-
-            # Lettres normales
-            for next_letter in remaining_rack.get_possible_letters():
-                if next_letter != self._blank_letter and node.has_transition(next_letter):
-                    temp_rack = Rack(str(remaining_rack))
-                    if temp_rack.remove_letters(next_letter):
-                        explore_suffixes(
-                            node.get_transition(next_letter),
-                            used_letters + next_letter,
-                            temp_rack
-                        )
-
-            # Gestion des blanks
-            if self._blank_letter in remaining_rack.get_possible_letters():
-                temp_rack = Rack(str(remaining_rack))
-                if temp_rack.remove_letters(self._blank_letter):
-                    for blank_letter in string.ascii_uppercase:
-                        if node.has_transition(blank_letter):
-                            explore_suffixes(
-                                node.get_transition(blank_letter),
-                                used_letters + blank_letter.lower(),  # blank en minuscule
-                                temp_rack
-                            )
-
-        # Premier appel avec la lettre d'ancrage
-        if current_node.has_transition(letter):
-            explore_suffixes(
-                current_node.get_transition(letter),
-                "",
-                Rack(str(rack))
-            )
-
-        return words
+
+# État d'un processus du pool de `MoveGenerator._generate_parallel`
+_worker_generator: Optional[MoveGenerator] = None
+_worker_counts: List[int] = []
+
+
+def _init_worker(generator: MoveGenerator, rack_str: str) -> None:
+    global _worker_generator, _worker_counts
+    _worker_generator = generator
+    _worker_counts = generator.gaddag.rack_counts(rack_str.upper())
+
+
+def _open_worker(path: str, board: Board, lexicon, rack_str: str) -> None:
+    """Initialisation sans `fork` : le lexique est projeté depuis son fichier."""
+    generator = MoveGenerator(FlatGADDAG.open(path), board, lexicon)
+    generator.cross_checks.sync()
+    _init_worker(generator, rack_str)
+
+
+def _shard_moves(shard: Shard) -> List[Tuple[str, int, int]]:
+    """(mot, première case, score) des coups d'une tâche, dans l'ordre de `iter_moves`."""
+    direction, index, groups = shard
+    generator = _worker_generator
+    line = generator._line(direction, index)
+    horizontal = direction == Direction.HORIZONTAL
+    found = []
+    for anchor, mask in groups:
+        restricted = line
+        if line.cross[anchor] & ~mask:
+            cross = list(line.cross)
+            cross[anchor] &= mask
+            restricted = line._replace(cross=cross, reaches={})
+        for move in generator._generate_line(restricted, [anchor], _worker_counts):
+            found.append((move.word, move.col if horizontal else move.row, move.score))
+    return found
@@ -23,29 +23,49 @@ class ScoreCalculator:
     def simulate_move_score(self, move: Move) -> int:
         """Simule le score d'un coup sans l'appliquer."""
         temp_multipliers = self.board.used_multipliers.copy()
-        temp_grid = self.board.grid.copy()  # Add this
+        # Cases du coup : rétablies sur place, la grille (suivie par les contrôles croisés) reste la même
+        covered = [(row, col, self.board.get_letter(row, col))
+                   for row, col in self._move_squares(move)]
         try:
             return self.calculate_move_score(move, simulate=True)
         finally:
             self.board.used_multipliers = temp_multipliers
-            self.board.grid = temp_grid  # Add this
+            for row, col, letter in covered:
+                if self.board.get_letter(row, col) != letter:
+                    if letter:
+                        self.board.place_letter(row, col, letter)
+                    else:
+                        self.board.clear_letter(row, col)
 
     def calculate_move_score(self, move: Move, simulate: bool = False) -> int:
         """Calcule le score d'un coup SANS l'appliquer."""
+        # Mots croisés d'abord : le mot principal consomme les multiplicateurs des cases posées
+        cross_score = self._calculate_crossing_words_score(move)
+
         # Calcul du score principal
         word_score = self._calculate_word_score(move.word, move.row, move.col, move.direction)
         
-        # Calcul des mots croisés
-        cross_score = self._calculate_crossing_words_score(move)
-        
-        # Bonus bingo
+        # Bonus bingo : 7 jetons posés (un joker s'écrit en minuscule)
         total_score = word_score + cross_score
-        if len(move.word) == 7:
+        if len(self._placed_squares(move)) == 7:
             total_score += self.BINGO_BONUS
             
         return total_score
 
-    def _calculate_word_score(self, word: str, row: int, col: int, direction: Direction) -> int:
+    @staticmethod
+    def _move_squares(move: Move) -> List[Tuple[int, int]]:
+        """Cases couvertes par le coup."""
+        return [(move.row + (i if move.direction == Direction.VERTICAL else 0),
+                 move.col + (i if move.direction == Direction.HORIZONTAL else 0))
+                for i in range(len(move.word))]
+
+    def _placed_squares(self, move: Move) -> List[Tuple[int, int, str]]:
+        """Cases vides couvertes par le coup, avec la lettre posée."""
+        return [(row, col, letter) for (row, col), letter in zip(self._move_squares(move), move.word)
+                if not self.board.get_letter(row, col)]
+
+    def _calculate_word_score(self, word: str, row: int, col: int, direction: Direction,
+                              consume: bool = True) -> int:
         """Calculate score for a single word."""
         print(f"\nCalcul score pour '{word}':")
         letter_score = 0
@@ -57,14 +77,15 @@ class ScoreCalculator:
             
             if not self.board.get_letter(current_row, current_col):
                 letter_mult, word_mult = self.board.get_square_multipliers(current_row, current_col)
-                letter_value = self.LETTER_VALUES[letter]
+                letter_value = self.LETTER_VALUES.get(letter, 0)  # joker (minuscule) : 0
                 letter_points = letter_value * letter_mult
                 letter_score += letter_points
                 word_multiplier *= word_mult
                 print(f"  Lettre '{letter}' ({letter_value}) en ({current_row},{current_col}): {letter_points} points (x{letter_mult} lettre, x{word_mult} mot)")
-                self.board.use_multiplier(current_row, current_col)
+                if consume:
+                    self.board.use_multiplier(current_row, current_col)
             else:
-                letter_value = self.LETTER_VALUES[letter]
+                letter_value = self.LETTER_VALUES.get(letter, 0)
                 letter_score += letter_value
                 print(f"  Lettre existante '{letter}' ({letter_value}) en ({current_row},{current_col})")
         
@@ -76,36 +97,23 @@ class ScoreCalculator:
         """Calcule le score total des mots croisés pour un coup."""
         print(f"\nCalcul des mots croisés pour {move.word}:")
         
-        # Place the letters temporarily
-        temp_grid = self.board.grid.copy()
-        for i, letter in enumerate(move.word):
-            current_row = move.row + (i if move.direction == Direction.VERTICAL else 0)
-            current_col = move.col + (i if move.direction == Direction.HORIZONTAL else 0)
-            self.board.grid[(current_row, current_col)] = letter
-
-        try:
-            cross_score = 0
-            for i, letter in enumerate(move.word):
-                current_row = move.row + (i if move.direction == Direction.VERTICAL else 0)
-                current_col = move.col + (i if move.direction == Direction.HORIZONTAL else 0)
-                
-                if not temp_grid.get((current_row, current_col)):  # Vérifier avec temp_grid
-                    cross_direction = Direction.VERTICAL if move.direction == Direction.HORIZONTAL else Direction.HORIZONTAL
-                    
-                    prefix = self.board_utils.get_prefix(self.board, current_row, current_col, cross_direction)
-                    suffix = self.board_utils.get_suffix(self.board, current_row, current_col, cross_direction)
-                    
-                    if prefix or suffix:
-                        cross_word = prefix + letter + suffix
-                        start_row = current_row - len(prefix) if cross_direction == Direction.VERTICAL else current_row
-                        start_col = current_col - len(prefix) if cross_direction == Direction.HORIZONTAL else current_col
-                        print(f"  Mot croisé trouvé: '{cross_word}' à ({start_row},{start_col})")
-                        
-                        word_score = self._calculate_word_score(cross_word, start_row, start_col, cross_direction)
-                        cross_score += word_score
-                        print(f"  Score du mot croisé '{cross_word}': {word_score}")
+        # Les autres lettres du coup sont dans l'axe du mot : la case vide suffit
+        cross_direction = Direction.VERTICAL if move.direction == Direction.HORIZONTAL else Direction.HORIZONTAL
+        cross_score = 0
+        for current_row, current_col, letter in self._placed_squares(move):
+            prefix = self.board_utils.get_prefix(self.board, current_row, current_col, cross_direction)
+            suffix = self.board_utils.get_suffix(self.board, current_row, current_col, cross_direction)
             
-            print(f"Score total des mots croisés: {cross_score}")
-            return cross_score
-        finally:
-            self.board.grid = temp_grid
+            if prefix or suffix:
+                cross_word = prefix + letter + suffix
+                start_row = current_row - len(prefix) if cross_direction == Direction.VERTICAL else current_row
+                start_col = current_col - len(prefix) if cross_direction == Direction.HORIZONTAL else current_col
+                print(f"  Mot croisé trouvé: '{cross_word}' à ({start_row},{start_col})")
+                
+                word_score = self._calculate_word_score(cross_word, start_row, start_col, cross_direction,
+                                                        consume=False)
+                cross_score += word_score
+                print(f"  Score du mot croisé '{cross_word}': {word_score}")
+        
+        print(f"Score total des mots croisés: {cross_score}")
+        return cross_score
@@ -1,22 +1,23 @@
 from typing import List, Set, Tuple
 from ..models.board import Board
-from ..models.gaddag import GADDAG
+from ..models.gaddag import WordLexicon
 from ..models.types import Direction
 from ..utils.board_utils import BoardUtils
 
 class WordValidator:
     """Valide les mots et les coups au Scrabble."""
     
-    def __init__(self, board: Board, gaddag: GADDAG):
+    def __init__(self, board: Board, gaddag: WordLexicon, lexicon=None):
         self.board = board
-        self.gaddag = gaddag
+        self.gaddag = gaddag  # appartenance seule : GADDAG ou DAWG
+        self.lexicon = lexicon  # sélecteur de lexiques (cf. GADDAG.lexicon_mask)
         self.board_utils = BoardUtils()
         
     def is_valid_word(self, word: str) -> bool:
         """Vérifie si un mot existe dans le dictionnaire."""
-        return self.gaddag.contains(word)
+        return self.gaddag.contains(word, self.lexicon)
         
-    def is_valid_move(self, word: str, row: int, col: int, direction: Direction, graphe) -> bool:
+    def is_valid_move(self, word: str, row: int, col: int, direction: Direction, graphe=None) -> bool:
         """
         Vérifie si un coup est valide localement (sans vérifier la connectivité globale).
         Vérifie uniquement :
@@ -42,7 +43,7 @@ class WordValidator:
             curr_col = col + (i if direction == Direction.HORIZONTAL else 0)
             
             existing = self.board.get_letter(curr_row, curr_col)
-            if existing and existing != word[i]:
+            if existing and existing.upper() != word[i].upper():
                 return False
         
         # 3. Vérifie les mots croisés formés
@@ -56,7 +57,7 @@ class WordValidator:
 
         return True
         
-    def _is_valid_cross_word(self, row: int, col: int, main_direction: Direction, letter: str, graphe) -> bool:
+    def _is_valid_cross_word(self, row: int, col: int, main_direction: Direction, letter: str, graphe=None) -> bool:
         """Vérifie si le placement d'une lettre forme des mots croisés valides."""
         cross_direction = Direction.VERTICAL if main_direction == Direction.HORIZONTAL else Direction.HORIZONTAL
         
@@ -66,12 +67,10 @@ class WordValidator:
         if not prefix and not suffix:
             return True
         
-        cross_word = prefix + letter + suffix
-        
         # Skip check if adjacent cell is part of an existing word
-        if graphe.is_cell_occupied(row, col):
+        if graphe is not None and graphe.is_cell_occupied(row, col):
             return True
 
-        return self.is_valid_word(cross_word)
+        return self.gaddag.contains(prefix + letter + suffix, self.lexicon)
 
     # Remove _is_valid_placement and _get_adjacent_cells as they're now handled by BoardUtils
@@ -0,0 +1,54 @@
+"""Test suite for the alphagram anagram index."""
+
+from src.models.alphagram_index import AlphagramIndex
+from src.models.gaddag import GADDAG
+
+WORDS = ["BACCARA", "CACABERA", "BACCARAS", "BACCARAT", "JACAMAR", "JACAMARS",
+         "MARACUJA", "CATALAN", "CATALANE", "CATALANS", "ANALECTA", "CHAT"]
+
+
+def test_readme_draw():
+    """AAABCCR gives BACCARA and its support letters, as in the README."""
+    index = AlphagramIndex.from_words(WORDS)
+    result = index.lookup("AAABCCR")
+    assert result.anagrams == ["BACCARA"]
+    assert result.extensions == {"E": ["CACABERA"], "S": ["BACCARAS"], "T": ["BACCARAT"]}
+    assert result.lines() == ["- BACCARA", "+ E CACABERA", "+ S BACCARAS", "+ T BACCARAT"]
+
+
+def test_several_words_per_support_letter():
+    """Every 8-letter word reachable with a given letter is listed, sorted."""
+    index = AlphagramIndex.from_words(WORDS)
+    result = index.lookup("aaaclnt")
+    assert result.anagrams == ["CATALAN"]
+    assert result.extensions["E"] == ["ANALECTA", "CATALANE"]
+    assert "AAACLNT" in index
+    assert index.lookup("AAACJMR").extensions["U"] == ["MARACUJA"]
+
+
+def test_built_from_gaddag():
+    """The index built from a GADDAG sees the same words, without duplicates."""
+    gaddag = GADDAG.from_word_list(WORDS + ["chat"], incremental=True)
+    index = AlphagramIndex.from_gaddag(gaddag)
+    assert index.word_count == len(WORDS)
+    assert index.anagrams("TACH") == ["CHAT"]
+    assert sorted(index.alphagrams(7)) == ["AAABCCR", "AAACJMR", "AAACLNT"]
+
+
+def test_lookup_probe_count_is_constant():
+    """A draw lookup is a handful of dictionary probes, whatever the index size."""
+
+    class CountingDict(dict):
+        probes = 0
+
+        def get(self, key, default=None):
+            CountingDict.probes += 1
+            return super().get(key, default)
+
+    for words in (WORDS, WORDS + [f"{word}S" for word in WORDS]):
+        index = AlphagramIndex.from_words(words)
+        index._words = CountingDict(index._words)
+        CountingDict.probes = 0
+        index.lookup("AAABCCR")
+        # Anagrammes, puis une lettre d'appui par lettre de l'alphabet
+        assert CountingDict.probes == 1 + 26
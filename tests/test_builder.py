@@ -0,0 +1,77 @@
+"""Test suite for the incremental minimal GADDAG construction."""
+
+import pytest
+from src.models.builder import IncrementalBuilder
+from src.models.gaddag import GADDAG
+
+WORDS = ["CHAT", "CHATS", "CHIEN", "CHIENS", "MAISON", "MAISONS", "JARDIN",
+         "TRAIN", "TROP", "TRAP", "TRIP", "ART", "PAR", "PARA", "LE", "LES",
+         "ANTICONSTITUTIO"]
+
+
+def test_same_language_as_semi_minimize():
+    """The incremental build accepts exactly the words of the classic build."""
+    classic = GADDAG.from_word_list(WORDS)
+    classic.semi_minimize()
+    incremental = GADDAG.from_word_list(WORDS, incremental=True)
+
+    assert incremental.word_count == classic.word_count
+    for word in WORDS + ["CHA", "CHATSS", "PA", "TRAINS", "XYZ"]:
+        assert incremental.contains(word) == classic.contains(word), word
+    for prefix in ["", "C", "TAHC", "eCH", "NIAR"]:
+        assert incremental.get_possible_letters(prefix) == classic.get_possible_letters(prefix)
+    assert incremental.find_words_with_skeleton({0: 'T', 4: 'N'}, {'R', 'A', 'I'}) == ["TRAIN"]
+
+
+def test_result_is_minimal_and_deterministic():
+    """The automaton is no larger than the semi-minimized one and order-independent."""
+    classic = GADDAG.from_word_list(WORDS)
+    classic.semi_minimize()
+    forward = GADDAG.from_word_list(WORDS, incremental=True)
+    backward = GADDAG.from_word_list(list(reversed(WORDS)) + ["chat"], incremental=True)
+
+    assert forward.get_statistics()['node_count'] <= classic.get_statistics()['node_count']
+    assert forward.get_statistics() == backward.get_statistics()
+
+
+def test_builder_rejects_unsorted_input():
+    """Sequences must come in lexicographic order; duplicates are ignored."""
+    builder = IncrementalBuilder()
+    builder.insert("AB")
+    builder.insert("AB")
+    builder.insert("AC")
+    with pytest.raises(ValueError):
+        builder.insert("AA")
+    assert builder.sequence_count == 2
+
+
+def test_updates_on_minimized_gaddag_stay_minimal():
+    """Adding and removing words gives the same automaton as a fresh build."""
+    gaddag = GADDAG.from_word_list(WORDS, incremental=True)
+    old_root = gaddag.root
+    assert gaddag.update(add=["CHATTE", "chat", "TRAINS"], remove=["TROP", "XYZ"]) == (2, 1)
+
+    expected = sorted(set(WORDS) - {"TROP"} | {"CHATTE", "TRAINS"})
+    fresh = GADDAG.from_word_list(expected, incremental=True)
+    assert list(gaddag.iter_words()) == expected
+    assert gaddag.word_count == len(expected)
+    assert gaddag.get_statistics() == fresh.get_statistics()
+    for sequence in ("e", "NIART", "TAHC"):
+        assert gaddag.annotation(gaddag.walk(sequence)) == fresh.annotation(fresh.walk(sequence))
+
+    # L'ancienne racine reste une version intacte du lexique
+    snapshot = GADDAG()
+    snapshot.root = old_root
+    assert snapshot.contains("TROP") and not snapshot.contains("CHATTE")
+
+    assert gaddag.remove_word("CHATTE") and not gaddag.remove_word("CHATTE")
+    assert not gaddag.contains("CHATTE") and gaddag.contains("CHAT")
+
+
+def test_add_word_after_semi_minimize_does_not_leak_words():
+    """Shared suffix states are copied before writing, so no other word appears."""
+    gaddag = GADDAG.from_word_list(["CHAT", "RAT"])
+    gaddag.semi_minimize()
+    gaddag.add_word("CHATS")
+    assert list(gaddag.iter_words()) == ["CHAT", "CHATS", "RAT"]
+    assert not gaddag.contains("RATS")
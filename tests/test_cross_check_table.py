@@ -0,0 +1,111 @@
+"""Test suite for the incrementally maintained cross-check and anchor tables."""
+
+from src.models.board import Board
+from src.models.gaddag import GADDAG, ALL_LETTERS_MASK, LETTER_BITS
+from src.models.types import Direction, Move
+from src.services.cross_check_table import CrossCheckTable
+
+WORDS = ["THE", "TA", "AT", "ART", "RAT", "TAR", "ES", "SE", "TES", "HE", "EH", "ETA"]
+
+
+def fresh_table(board: Board, gaddag: GADDAG) -> CrossCheckTable:
+    table = CrossCheckTable(board, gaddag)
+    table.rebuild()
+    return table
+
+
+def test_board_anchors():
+    """Anchors follow placements and removals; an empty board anchors on the centre."""
+    board = Board()
+    assert board.anchors == {(7, 7)}
+    board.place_letter(7, 7, "T")
+    assert board.anchors == {(6, 7), (8, 7), (7, 6), (7, 8)}
+    board.place_letter(7, 8, "A")
+    assert (7, 8) not in board.anchors and (6, 8) in board.anchors
+    start = board.revision
+    board.clear_letter(7, 8)
+    assert board.anchors == {(6, 7), (8, 7), (7, 6), (7, 8)}
+    assert board.changes_since(start) == {(7, 8)}
+
+    # Poses et retraits répétés : l'état suivi reste d'une case par case du plateau
+    for _ in range(1000):
+        board.place_letter(8, 7, "E")
+        board.clear_letter(8, 7)
+    assert board.changes_since(start) == {(7, 8), (8, 7)}
+    assert board.changes_since(board.revision - 1) == {(8, 7)}
+    assert board.changes_since(board.revision) == set()
+    assert len(board._changed_at) * len(board._changed_at[0]) == board.size ** 2
+
+
+def test_incremental_matches_rebuild():
+    """After moves and undos, only touched squares are refreshed and the table stays exact."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    board = Board()
+    table = CrossCheckTable(board, gaddag)
+    table.sync()
+    assert table.masks[Direction.HORIZONTAL][6][7] == ALL_LETTERS_MASK
+
+    moves = [Move("THE", 7, 7, Direction.HORIZONTAL), Move("ES", 8, 9, Direction.HORIZONTAL),
+             Move("AT", 5, 6, Direction.VERTICAL)]
+    for move in moves:
+        board.apply_move(move, 0)
+        table.sync()
+        reference = fresh_table(board, gaddag)
+        assert table.masks == reference.masks and table.points == reference.points
+
+    # Au-dessus du H : seul EH ; au-dessus du S : seul ES ; à droite du T de AT : TA
+    assert table.masks[Direction.HORIZONTAL][6][8] == LETTER_BITS['E']
+    assert table.masks[Direction.HORIZONTAL][7][10] == LETTER_BITS['E']
+    assert table.masks[Direction.VERTICAL][6][7] == LETTER_BITS['A']
+    assert table.points[Direction.VERTICAL][6][7] == 1 and table.points[Direction.VERTICAL][3][3] is None
+    assert table.masks[Direction.HORIZONTAL][7][7] == 0
+
+    # Points des mots croisés : ?H, ES? ; aucun sur une case occupée
+    assert table.points[Direction.HORIZONTAL][6][8] == 4
+    assert table.points[Direction.HORIZONTAL][9][9] == 2
+    assert table.points[Direction.HORIZONTAL][7][9] is None
+
+    board.undo_last_move()
+    table.sync()
+    reference = fresh_table(board, gaddag)
+    assert table.masks == reference.masks and table.points == reference.points
+
+
+def test_lexicon_update_rebuilds():
+    """A lexicon update invalidates every mask."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    board = Board()
+    board.place_letter(7, 7, "T")
+    table = CrossCheckTable(board, gaddag)
+    table.sync()
+    assert not table.masks[Direction.VERTICAL][7][8] & LETTER_BITS['O']
+    gaddag.update(add=["TO"])
+    table.sync()
+    assert table.masks[Direction.VERTICAL][7][8] & LETTER_BITS['O']
+
+
+def test_simulation_keeps_table_incremental(monkeypatch):
+    """Scoring candidates leaves the grid in place: later syncs only refresh touched squares."""
+    from src.services.score_calculator import ScoreCalculator
+
+    gaddag = GADDAG.from_word_list(WORDS)
+    board = Board()
+    board.apply_move(Move("THE", 7, 7, Direction.HORIZONTAL), 0)
+    table = CrossCheckTable(board, gaddag)
+    table.sync()
+    rebuilds = []
+    monkeypatch.setattr(table, "rebuild", lambda: rebuilds.append(board.revision))
+
+    calculator = ScoreCalculator(board)
+    grid = board.grid
+    assert calculator.simulate_move_score(Move("ES", 8, 9, Direction.HORIZONTAL)) > 0
+    assert board.grid is grid and board.get_letter(8, 9) is None
+    table.sync()
+    board.apply_move(Move("ES", 8, 9, Direction.HORIZONTAL), 0)
+    # Dernières modifications : lues sans parcourir le plateau
+    monkeypatch.setattr(board, "_changed_at", None)
+    assert board.changes_since(board.revision - 2) == {(8, 9), (8, 10)}
+    table.sync()
+    assert rebuilds == []
+    reference = fresh_table(board, gaddag)
+    assert table.masks == reference.masks and table.points == reference.points
@@ -0,0 +1,76 @@
+"""Test suite for the validation-only DAWG."""
+
+import pytest
+from src.models.dawg import DAWG
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.gaddag import GADDAG
+from src.models.board import Board
+from src.models.types import Direction
+from src.modules.cbic import Placement, est_placement_valide
+
+WORDS = ["CHAT", "CHATS", "CHIEN", "MAISON", "JARDIN", "TRAIN", "ART", "PAR",
+         "PARA", "LE", "LES", "TEST", "TE", "ES", "ST"]
+
+
+@pytest.fixture
+def gaddag():
+    return GADDAG.from_word_list(WORDS, incremental=True)
+
+
+def test_same_membership_as_gaddag(gaddag):
+    """The DAWG accepts exactly the words of its GADDAG."""
+    dawg = DAWG.from_gaddag(gaddag)
+    direct = DAWG.from_word_list(WORDS)
+    for word in WORDS + ["CHA", "TAHC", "PARAS", "château", "A", ""]:
+        assert dawg.contains(word) == gaddag.contains(word), word
+        assert direct.contains(word) == gaddag.contains(word), word
+    assert dawg.word_count == direct.word_count == len(WORDS)
+    assert list(dawg.iter_words()) == list(gaddag.iter_words()) == sorted(WORDS)
+
+
+def test_much_smaller_than_gaddag(gaddag):
+    """Without rotations the automaton is a fraction of the GADDAG."""
+    flat = FlatGADDAG.from_gaddag(gaddag)
+    dawg = DAWG.from_gaddag(gaddag)
+    assert dawg.memory_usage() * 3 < flat.memory_usage()
+
+
+def test_usable_for_cbic_validation():
+    """CBIC placement validation only needs membership tests."""
+    board = Board()
+    dawg = DAWG.from_word_list(WORDS)
+    for i, letter in enumerate("TEST"):
+        board.place_letter(7, 7 + i, letter)
+    placement = Placement("TE", (7, 10), Direction.VERTICAL, [], (7, 10), "T")
+    assert est_placement_valide(placement, board, dawg)
+
+
+def test_binary_roundtrip_keeps_kind(tmp_path):
+    """A DAWG file cannot be mistaken for a GADDAG file."""
+    path = str(tmp_path / "mots.dawg")
+    DAWG.from_word_list(WORDS).save(path)
+    mapped = DAWG.open(path)
+    assert mapped.contains("MAISON") and not mapped.contains("MAISONS")
+    mapped.close()
+    with pytest.raises(ValueError):
+        FlatGADDAG.open(path)
+
+
+def test_membership_only_interface():
+    """The DAWG is not a GADDAG stand-in: search methods are absent, validation works."""
+    from src.services.word_validator import WordValidator
+
+    dawg = DAWG.from_word_list(WORDS)
+    assert not isinstance(dawg, GADDAG)
+    for name in ("cross_check", "get_possible_letters", "find_words_with_skeleton",
+                 "find_words_matching", "add_word"):
+        assert not hasattr(dawg, name), name
+    board = Board()
+    for i, letter in enumerate("TEST"):
+        board.place_letter(7, 7 + i, letter)
+    validator = WordValidator(board, dawg)
+    assert validator.is_valid_move("TE", 7, 10, Direction.VERTICAL)
+    assert validator.is_valid_move("LE", 6, 8, Direction.VERTICAL)
+    # Mots croisés LE, ES, ST valides ; AE ne l'est pas
+    assert validator.is_valid_move("LES", 6, 8, Direction.HORIZONTAL)
+    assert not validator.is_valid_move("ART", 6, 8, Direction.HORIZONTAL)
@@ -0,0 +1,69 @@
+"""Test suite for the precomputed draw catalogue."""
+
+import pytest
+from src.models import draw_catalogue
+from src.models.alphagram_index import AlphagramIndex, DrawResult
+from src.models.draw_catalogue import DrawCatalogue, build_catalogue, compute_catalogue, write_catalogue
+from src.models.gaddag import GADDAG
+
+WORDS = ["BACCARA", "CACABERA", "BACCARAS", "BACCARAT", "JACAMAR", "JACAMARS",
+         "MARACUJA", "CATALAN", "CATALANE", "CATALANS", "ANALECTA", "CHAT",
+         "ABRICOTS"]
+
+
+def test_catalogue_matches_index(tmp_path, monkeypatch):
+    """Every draw read back from disk matches the on-demand alphagram index."""
+    monkeypatch.setattr(draw_catalogue, "SHARD_SIZE", 2)
+    path = str(tmp_path / "tirages.cat")
+    count = build_catalogue(GADDAG.from_word_list(WORDS), path, workers=2)
+    index = AlphagramIndex.from_words(WORDS)
+
+    catalogue = DrawCatalogue.open(path)
+    try:
+        assert len(catalogue) == count
+        assert list(catalogue) == sorted(catalogue)
+        for draw in catalogue:
+            expected = index.lookup(draw)
+            assert catalogue.lookup(draw) == expected
+            assert expected.anagrams or expected.extensions
+        # Tirage sans anagramme, mais avec un appui (ABRICOTS sans S)
+        assert catalogue.lookup("ABCIORT").extensions == {"S": ["ABRICOTS"]}
+        assert str(catalogue.lookup("racaabc")) == str(index.lookup("AAABCCR"))
+        assert catalogue.lookup("ZZZZZZZ") is None
+        assert "CHAT" not in catalogue
+    finally:
+        catalogue.close()
+
+
+def test_invalid_files(tmp_path):
+    """Unsorted input is rejected and corrupted files fail to open."""
+    path = str(tmp_path / "tirages.cat")
+    with pytest.raises(ValueError):
+        write_catalogue(path, iter([DrawResult("BCDEFGH"), DrawResult("ABCDEFG")]))
+    with pytest.raises(FileNotFoundError):
+        DrawCatalogue.open(path)
+
+    (tmp_path / "corrompu.cat").write_bytes(b"XXXX" + bytes(32))
+    with pytest.raises(ValueError):
+        DrawCatalogue.open(str(tmp_path / "corrompu.cat"))
+    assert list(tmp_path.iterdir()) == [tmp_path / "corrompu.cat"]
+
+
+def test_catalogue_is_streamed_in_order(monkeypatch):
+    """Draws come out sorted, shard after shard, whatever the number of workers."""
+    monkeypatch.setattr(draw_catalogue, "SHARD_SIZE", 2)
+    gaddag = GADDAG.from_word_list(WORDS)
+    results = compute_catalogue(gaddag, workers=1)
+    assert next(results).draw == "AAABCCE"  # CACABERA sans le R
+    sequential = [str(result) for result in compute_catalogue(gaddag, workers=1)]
+    draws = [text.split("\n")[0] for text in sequential]
+    assert draws == sorted(set(draws))
+    assert [str(result) for result in compute_catalogue(gaddag, workers=2)] == sequential
+
+
+def test_failed_write_keeps_original_error(tmp_path):
+    """A target in a missing directory reports the open failure, not the cleanup."""
+    path = str(tmp_path / "absent" / "tirages.cat")
+    with pytest.raises(FileNotFoundError) as error:
+        write_catalogue(path, iter([DrawResult("ABCDEFG")]))
+    assert error.value.__context__ is None
@@ -0,0 +1,135 @@
+"""Test suite for the flat array-backed GADDAG backend."""
+
+import os
+import pytest
+from src.models.gaddag import GADDAG, ReadOnlyLexiconError
+from src.models.flat_gaddag import FlatGADDAG
+
+WORDS = ["CHAT", "CHATS", "CHIEN", "MAISON", "JARDIN", "TRAIN", "TROP",
+         "TRAP", "TRIP", "STEP", "SHIP", "ART", "PAR", "PARA", "LE", "LES"]
+
+
+@pytest.fixture
+def gaddag():
+    """Node-based GADDAG used as reference."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    gaddag.semi_minimize()
+    return gaddag
+
+
+@pytest.fixture
+def flat(gaddag):
+    """Flat GADDAG compiled from the reference."""
+    return FlatGADDAG.from_gaddag(gaddag)
+
+
+def test_same_membership(gaddag, flat):
+    """Both backends accept exactly the same words."""
+    for word in WORDS + ["CHA", "CHATSS", "XYZ", "château", "A"]:
+        assert flat.contains(word) == gaddag.contains(word), word
+    assert flat.word_count == gaddag.word_count
+
+
+def test_same_possible_letters(gaddag, flat):
+    """Transitions listed from any prefix match the reference."""
+    for prefix in ["", "C", "TAHC", "e", "eCH", "NIAR", "ZZ"]:
+        assert flat.get_possible_letters(prefix) == gaddag.get_possible_letters(prefix)
+
+
+def test_same_skeleton_search(gaddag, flat):
+    """Skeleton queries return the same words on both backends."""
+    queries = [
+        ({0: 'T', 4: 'N'}, {'R', 'A', 'I'}),
+        ({0: 'T', 2: 'O'}, {'R', 'P'}),
+        ({0: 'C', 2: 'A'}, {'H', 'T', 'S'}),
+    ]
+    for skeleton, available in queries:
+        assert flat.find_words_with_skeleton(skeleton, available) == \
+            gaddag.find_words_with_skeleton(skeleton, available)
+
+
+def test_node_view_compatibility(flat):
+    """The root view exposes the Node interface used by legacy code."""
+    node = flat.root
+    assert node.has_transition('C')
+    node = node.get_transition('C')
+    assert node.has_transition(GADDAG.DELIMITER)
+    assert set(flat.root.transitions) == flat.get_possible_letters("")
+
+
+def test_statistics_and_read_only(gaddag, flat):
+    """The flat structure mirrors the node graph and refuses mutations."""
+    stats = flat.get_statistics()
+    reference = gaddag.get_statistics()
+    assert stats['node_count'] == reference['node_count']
+    assert stats['transition_count'] == reference['transition_count']
+    assert stats['memory_bytes'] > 0
+    with pytest.raises(ReadOnlyLexiconError):
+        flat.add_word("TABLE")
+    # Même erreur pour chaque modification, état commun initialisé comme pour GADDAG
+    for mutate in (lambda: flat.update(add=["TABLE"]), lambda: flat.remove_word("CHAT"),
+                   lambda: flat.root.add_transition("A")):
+        with pytest.raises(ReadOnlyLexiconError):
+            mutate()
+    assert flat.minimized is False and flat._register is None
+
+
+def test_from_dictionary_file():
+    """A whole word list compiles and answers queries."""
+    path = os.path.join(os.path.dirname(__file__), "..", "data", "test_dicts.txt")
+    gaddag = GADDAG()
+    loaded = gaddag.load_dictionary(path)
+    flat = FlatGADDAG.from_gaddag(gaddag)
+    assert loaded > 0
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            word = GADDAG.normalize_word(line.strip())
+            if gaddag.is_valid_word(word):
+                assert flat.contains(word)
+
+
+def test_save_and_open_roundtrip(flat, tmp_path):
+    """A compiled file is mapped back and answers like the in-memory copy."""
+    path = str(tmp_path / "lexique.gdg")
+    flat.save(path)
+    mapped = FlatGADDAG.open(path)
+    try:
+        assert mapped.word_count == flat.word_count
+        assert mapped.get_statistics()['node_count'] == flat.get_statistics()['node_count']
+        for word in WORDS + ["CHA", "XYZ"]:
+            assert mapped.contains(word) == flat.contains(word)
+        assert mapped.find_words_with_skeleton({0: 'T', 4: 'N'}, {'R', 'A', 'I'}) == ["TRAIN"]
+        assert mapped.annotated
+        assert all(mapped.annotation(state) == flat.annotation(state)
+                   for state in range(len(flat._masks)))
+    finally:
+        mapped.close()
+
+
+def test_open_rejects_invalid_files(flat, tmp_path):
+    """Foreign or truncated files are refused instead of being traversed."""
+    foreign = tmp_path / "foreign.gdg"
+    foreign.write_bytes(b"NOPE" + bytes(64))
+    with pytest.raises(ValueError):
+        FlatGADDAG.open(str(foreign))
+
+    path = tmp_path / "truncated.gdg"
+    flat.save(str(path))
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        FlatGADDAG.open(str(path))
+
+
+def test_multi_lexicon_roundtrip(tmp_path):
+    """Per-lexicon terminal bitsets and lexicon names survive compilation and save/open."""
+    from src.models.dawg import DAWG
+
+    lexicons = {"ods8": ["CHAT", "CHAR"], "junior": ["CHAT", "CHOU"]}
+    path = tmp_path / "multi.gdg"
+    FlatGADDAG.from_lexicons(lexicons).save(str(path))
+    for lexicon in (FlatGADDAG.open(str(path)), DAWG.from_lexicons(lexicons)):
+        assert lexicon.lexicon_names == ["ods8", "junior"]
+        assert lexicon.contains("CHOU", "junior") and not lexicon.contains("CHOU", "ods8")
+        assert list(lexicon.iter_words("ods8")) == ["CHAR", "CHAT"]
+        assert lexicon.contains("CHAR")
+    assert FlatGADDAG.open(str(path)).find_words_with_skeleton({3: "R"}, "CHA", "ods8") == ["CHAR"]
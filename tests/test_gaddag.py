@@ -182,4 +182,173 @@ def test_bridge_word_finding(gaddag):
         print(f"Skeleton: {skeleton}")  # Print the constructed skeleton
         print(f"Found: {found}")
         print(f"Expected: {expected}")
-        assert sorted(found) == sorted(expected)
\ No newline at end of file
+        assert sorted(found) == sorted(expected)
+
+
+def test_normalisation_fast_path_matches_full_rules():
+    """The ASCII / translation-table fast paths agree with the full NFKD rules."""
+    from src.models.gaddag import _normalize_slow
+
+    samples = ["chat", "CHAT", "l'été", "DÉJÀ", "Straße", "ﬁn", "naïve",
+               "l’arbre", "œuvre", "Æsop", "ÇÀ", "x²", ""]
+    for word in samples:
+        assert GADDAG.normalize_word(word) == _normalize_slow(word)
+    assert GADDAG.normalize_word("ex æquo") == "EXAEQUO"
+
+
+def test_contains_normalized_skips_normalization():
+    """contains_normalized answers for already-normalized words only."""
+    gaddag = GADDAG.from_word_list(["CHATEAU", "ETE"])
+    assert gaddag.contains("château")
+    assert gaddag.contains_normalized("CHATEAU")
+    assert not gaddag.contains_normalized("château")
+
+
+def test_skeleton_search_respects_rack_counts():
+    """Free letters are drawn from the rack as a multiset; blanks stand for any letter."""
+    from collections import Counter
+    from src.models.flat_gaddag import FlatGADDAG
+
+    words = ["TRAIN", "TRAINA", "TARTE", "TATER", "TETRA", "ETAT", "TE", "ARRETE",
+             "CARTE", "CARTES", "TRACE", "TRAITE", "TATA"]
+    lexicons = [GADDAG.from_word_list(words), FlatGADDAG.from_word_list(words)]
+
+    def expected(skeleton, rack):
+        found = []
+        for word in words:
+            if len(word) <= max(skeleton) or any(word[p] != l for p, l in skeleton.items()):
+                continue
+            free = Counter(c for i, c in enumerate(word) if i not in skeleton)
+            missing = sum((free - Counter(c for c in rack if c.isalpha())).values())
+            if missing <= sum(1 for c in rack if c in "_?*"):
+                found.append(word)
+        return sorted(found)
+
+    cases = [({0: 'T'}, "RAINA"), ({0: 'T'}, "RAIN"), ({1: 'A'}, "TTER"),
+             ({1: 'A'}, "TER"), ({0: 'T', 4: 'E'}, "ART"), ({2: 'R'}, "CATES?"),
+             ({0: 'T'}, "?"), ({3: 'T'}, "EEAR*"), ({0: 'T', 1: 'E'}, "")]
+    for skeleton, rack in cases:
+        for lexicon in lexicons:
+            assert lexicon.find_words_with_skeleton(skeleton, list(rack)) == expected(skeleton, rack)
+
+    gaddag = lexicons[0]
+    assert gaddag.find_words_with_skeleton({0: 'T'}, {'A', 'T'}) == []
+    assert gaddag.find_words_with_skeleton({0: 'T'}, ['A', 'T', 'A']) == ["TATA"]
+    assert gaddag.find_words_with_skeleton({0: 'T'}, "RAIN") == ["TRAIN"]
+    assert "TRAINA" not in gaddag.find_words_with_skeleton({0: 'T'}, "RAIN")
+    assert gaddag.find_words_with_skeleton({}, "TRAIN") == []
+    assert gaddag.find_words_with_skeleton({-1: 'T'}, "TRAIN") == []
+    assert next(gaddag.iter_words_with_skeleton({4: 'N'}, "TRAI")) == "TRAIN"
+
+
+def test_batch_skeleton_queries_match_single_queries():
+    """Batched queries return, per query index, the same words as one call each."""
+    gaddag = GADDAG.from_word_list(["TRAIN", "TRAINA", "TARTE", "TATER", "TETRA",
+                                    "TRACE", "TRAITE", "TATA", "CARTE"])
+    queries = [({0: 'T'}, "RAIN"), ({0: 'T'}, "RAINA"), ({0: 't'}, "AT?"),
+               ({1: 'A'}, "TER"), ({}, "TRAIN"), ({0: 'T'}, ""), ({2: 'R'}, "CATE")]
+    results = gaddag.find_words_with_skeletons(queries)
+    assert sorted(results) == list(range(len(queries)))
+    for index, (skeleton, rack) in enumerate(queries):
+        assert results[index] == gaddag.find_words_with_skeleton(skeleton, rack)
+    assert results[1] == ["TRAIN", "TRAINA"]
+
+
+def test_annotations_bound_remaining_words():
+    """Each state knows which letters and how many more lead to a word."""
+    from src.models.flat_gaddag import FlatGADDAG
+
+    words = ["CHAT", "CHATS", "CHIEN", "TE", "ETE", "TRAINS"]
+    gaddag = GADDAG.from_word_list(words, incremental=True)
+    assert gaddag.annotated
+    forward = gaddag.forward_state()
+    reach, low, high = gaddag.annotation(forward)
+    assert (low, high) == (2, 6)
+    assert reach == sum(1 << (ord(c) - 65) for c in set("CHATSIENR"))
+    reach, low, high = gaddag.annotation(gaddag.walk("CHAT", forward))
+    assert (reach, low, high) == (1 << (ord('S') - 65), 0, 1)
+    # Depuis la racine, le délimiteur n'est pas compté
+    assert gaddag.annotation(gaddag.start_state())[1:] == (2, 6)
+
+    flat = FlatGADDAG.from_gaddag(gaddag)
+    assert flat.annotation(flat.walk("eCHA")) == gaddag.annotation(gaddag.walk("eCHA"))
+
+    gaddag.add_word("CHATTE")
+    assert gaddag.annotated
+    assert gaddag.annotation(gaddag.walk("CHAT", gaddag.forward_state()))[1:] == (0, 2)
+    assert "CHATTE" in gaddag.find_words_with_skeleton({0: 'C'}, "HATTE")
+
+    trie = GADDAG.from_word_list(words)
+    trie.add_word("CHATTE")
+    assert not trie.annotated
+
+
+def test_pruned_skeleton_search_matches_exhaustive_search():
+    """Annotation-based pruning never drops a word."""
+    import random
+
+    rng = random.Random(7)
+    letters = "AEIRSTNLOC"
+    words = {''.join(rng.choice(letters) for _ in range(rng.randint(2, 10))) for _ in range(1500)}
+    gaddag = GADDAG.from_word_list(words, incremental=True)
+    for _ in range(150):
+        skeleton = {rng.randint(0, 11): rng.choice(letters) for _ in range(rng.randint(1, 3))}
+        rack = [rng.choice(letters + "?") for _ in range(rng.randint(0, 7))]
+        gaddag.annotated = True
+        pruned = gaddag.find_words_with_skeleton(skeleton, rack)
+        gaddag.annotated = False
+        assert pruned == gaddag.find_words_with_skeleton(skeleton, rack)
+
+
+def test_cross_check_masks():
+    """cross_check returns the letters completing prefix + X + suffix, on every backend."""
+    from src.models.dawg import DAWG
+    from src.models.flat_gaddag import FlatGADDAG
+    from src.models.gaddag import ALL_LETTERS_MASK, letter_bit, mask_letters
+
+    words = ["CHAT", "CHAR", "CHOC", "CHAI", "RAT", "RIT", "ART"]
+    gaddag = GADDAG.from_word_list(words)
+    # Le DAWG de validation n'a pas de contrôles croisés
+    assert not hasattr(DAWG.from_word_list(words), "cross_check")
+    for lexicon in (gaddag, FlatGADDAG.from_gaddag(gaddag)):
+        assert mask_letters(lexicon.cross_check("CHA", "")) == {"T", "R", "I"}
+        assert mask_letters(lexicon.cross_check("", "AT")) == {"R"}
+        assert mask_letters(lexicon.cross_check("R", "T")) == {"A", "I"}
+        assert mask_letters(lexicon.cross_check("C", "AT")) == {"H"}
+        assert lexicon.cross_check("XY", "Z") == 0
+        assert lexicon.cross_check("", "") == ALL_LETTERS_MASK
+        assert lexicon.cross_check("r", "t") & letter_bit("i")
+
+    assert gaddag.cross_check("RO", "") == 0
+    gaddag.add_word("ROI")
+    assert gaddag.cross_check("RO", "") == letter_bit("I")
+
+
+def test_multi_lexicon_selectors():
+    """One shared GADDAG answers per-lexicon membership, skeleton and cross-check queries."""
+    import pytest
+    from src.models.gaddag import mask_letters
+
+    gaddag = GADDAG.from_lexicons({"ods8": ["CHAT", "CHAR", "OK"], "junior": ["CHAT", "CHOU"]})
+    assert gaddag.word_count == 4
+    assert gaddag.contains("CHAT", "ods8") and gaddag.contains("CHAT", "junior")
+    assert gaddag.contains("CHAR", 0) and not gaddag.contains("CHAR", "junior")
+    assert gaddag.contains("CHOU") and gaddag.contains("chou", ["ods8", 1])
+    assert list(gaddag.iter_words("junior")) == ["CHAT", "CHOU"]
+    assert gaddag.find_words_with_skeleton({0: "C"}, "HATROU", "junior") == ["CHAT", "CHOU"]
+    assert gaddag.find_words_with_skeleton({0: "C"}, "HATROU") == ["CHAR", "CHAT", "CHOU"]
+    assert mask_letters(gaddag.cross_check("CHA", "", "ods8")) == {"T", "R"}
+    assert mask_letters(gaddag.cross_check("CHA", "", "junior")) == {"T"}
+    with pytest.raises(ValueError):
+        gaddag.contains("CHAT", "scrabble")
+
+    gaddag.update(add=["CHAR"], lexicon="junior")
+    gaddag.remove_word("OK", "ods8")
+    assert gaddag.contains("CHAR", "junior") and not gaddag.contains("OK")
+    assert gaddag.word_count == 3
+    assert mask_letters(gaddag.cross_check("CHA", "", "junior")) == {"T", "R"}
+    # Numéro valide pour le format mais sans lexique : refusé, pas ignoré
+    with pytest.raises(ValueError):
+        gaddag.update(add=["CHOU"], lexicon=2)
+    with pytest.raises(ValueError):
+        GADDAG.from_word_list(["CHAT"]).update(remove=["CHAT"], lexicon=[0, 1])
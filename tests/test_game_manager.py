@@ -107,10 +107,36 @@ def test_game_flow():
     print(f"\nPlateau final:\n{state['board']}")
     print(f"Score total: {state['total_score']}")
 
+def test_play_suggested_blank_move():
+    """Un coup suggéré avec joker (minuscule) se joue et garde son score."""
+    game = setup_test_environment()
+    game.place_move(Move("THE", 7, 7, Direction.HORIZONTAL))
+    total = game.board.get_total_score()
+
+    suggestions = game.suggest_moves("PR_", limit=50)
+    blank_moves = [(move, score) for move, score in suggestions
+                   if any(letter.islower() for letter in move.word)]
+    assert blank_moves, "Devrait proposer un coup avec joker"
+    move, suggested = blank_moves[0]
+    assert game.place_move(move) == suggested
+    assert game.board.get_total_score() == total + suggested
+    # Le joker reste en minuscule sur le plateau
+    step_row, step_col = (0, 1) if move.direction == Direction.HORIZONTAL else (1, 0)
+    placed = [game.board.get_letter(move.row + i * step_row, move.col + i * step_col)
+              for i in range(len(move.word))]
+    assert "".join(placed) == move.word
+
+    # Chaque coup suggéré est marqué comme par ScoreCalculator
+    game = setup_test_environment()
+    game.place_move(Move("THE", 7, 7, Direction.HORIZONTAL))
+    for move, score in game.suggest_moves("PAR_", limit=20):
+        assert game.score_calculator.simulate_move_score(move) == score, move
+
 if __name__ == "__main__":
     print("=== Tests du GameManager ===")
     test_place_move()
     test_suggest_moves()
     test_undo_move()
     test_game_flow()
+    test_play_suggested_blank_move()
     print("Tous les tests ont réussi !")
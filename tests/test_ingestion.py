@@ -0,0 +1,54 @@
+"""Test suite for the parallel word-list ingestion pipeline."""
+
+from src.models.gaddag import GADDAG
+from src.models.ingestion import build_lexicon, ingest_word_lists, merge_sorted, split_chunks
+
+WORDS = ["maison", "CHAT", "chien", "été", "A", "JARDIN", "chat", "l'arbre", "TRAIN"] * 5
+
+
+def write_list(tmp_path, name, words):
+    path = tmp_path / name
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_split_chunks_on_line_boundaries():
+    """Chunks cover the whole buffer and never cut a line."""
+    data = b"CHAT\nCHIEN\nMAISON\nJARDIN\n"
+    chunks = split_chunks(data, chunk_size=7)
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+    for start, end in chunks:
+        assert data[end - 1:end] == b"\n"
+
+
+def test_parallel_matches_sequential(tmp_path):
+    """Multi-process ingestion yields the same sorted unique words."""
+    path = write_list(tmp_path, "mots.txt", WORDS)
+    expected = sorted(set(GADDAG.read_word_list(path)))
+
+    (sequential,), report = ingest_word_lists([path], workers=1)
+    (parallel,), parallel_report = ingest_word_lists([path], workers=2, chunk_size=16)
+
+    assert sequential == parallel == expected
+    assert parallel_report.chunks > 1
+    assert [stage.name for stage in report.stages] == ["découpage", "normalisation", "fusion"]
+
+
+def test_several_lexicons_at_once(tmp_path):
+    """Several files share one pool and keep their own results."""
+    first = write_list(tmp_path, "a.txt", ["CHAT", "CHIEN"])
+    second = write_list(tmp_path, "b.txt", ["TRAIN", "CHAT", "TRAIN"])
+    (words_a, words_b), _ = ingest_word_lists([first, second], workers=2, chunk_size=4)
+    assert words_a == ["CHAT", "CHIEN"]
+    assert words_b == ["CHAT", "TRAIN"]
+
+
+def test_build_lexicon_reports_every_stage(tmp_path):
+    """The built lexicon contains the words and the report covers the build."""
+    path = write_list(tmp_path, "mots.txt", WORDS)
+    gaddag, report = build_lexicon(path, workers=1)
+    assert gaddag.contains("ETE") and gaddag.contains("LARBRE")
+    assert gaddag.word_count == 7
+    assert report.stages[-1].name == "construction"
+    assert "construction" in str(report)
+    assert merge_sorted([["A", "C"], ["B", "C"]]) == ["A", "B", "C"]
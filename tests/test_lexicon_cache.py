@@ -0,0 +1,89 @@
+"""Test suite for the content-hash keyed lexicon cache."""
+
+import os
+import pytest
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.lexicon_cache import LexiconCache
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Small word list on disk."""
+    path = tmp_path / "mots.txt"
+    path.write_text("CHAT\nCHIEN\nMAISON\nété\n", encoding="utf-8")
+    return str(path)
+
+
+def test_build_then_hit(source, tmp_path):
+    """The first call builds, the second one maps the cached file."""
+    cache = LexiconCache(str(tmp_path / "cache"))
+    first = cache.get_or_build(source)
+    second = cache.get_or_build(source)
+    assert isinstance(second, FlatGADDAG)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert second.contains("ETE") and second.contains("CHIEN")
+    assert second.word_count == first.word_count == 4
+    first.close()
+    second.close()
+
+
+def test_rebuild_on_source_or_rule_change(source, tmp_path, monkeypatch):
+    """Changing the word list or a build parameter yields a new key."""
+    cache = LexiconCache(str(tmp_path / "cache"))
+    key = cache.key_for(source)
+
+    with open(source, "a", encoding="utf-8") as f:
+        f.write("JARDIN\n")
+    assert cache.key_for(source) != key
+    rebuilt = cache.get_or_build(source)
+    assert rebuilt.contains("JARDIN")
+    rebuilt.close()
+
+    changed = cache.key_for(source)
+    monkeypatch.setattr("src.models.gaddag.GADDAG.MAX_WORD_LENGTH", 5)
+    assert cache.key_for(source) != changed
+
+
+def test_corrupted_entry_is_rebuilt(source, tmp_path):
+    """An unreadable cache entry is discarded and rebuilt."""
+    cache = LexiconCache(str(tmp_path / "cache"))
+    cache.get_or_build(source).close()
+    path = cache.path_for(cache.key_for(source))
+    with open(path, "wb") as f:
+        f.write(b"garbage")
+    assert cache.get(source) is None
+    assert cache.get_or_build(source).contains("CHAT")
+
+
+def test_entry_removed_concurrently_is_rebuilt(source, tmp_path, monkeypatch):
+    """A corrupted entry already deleted by another process only triggers a rebuild."""
+    cache = LexiconCache(str(tmp_path / "cache"))
+    cache.get_or_build(source).close()
+    path = cache.path_for(cache.key_for(source))
+    with open(path, "wb") as f:
+        f.write(b"garbage")
+    remove = os.remove
+
+    def concurrent_remove(target):
+        remove(target)
+        remove(target)
+
+    monkeypatch.setattr(os, "remove", concurrent_remove)
+    assert cache.get(source) is None
+    monkeypatch.setattr(os, "remove", remove)
+    rebuilt = cache.get_or_build(source)
+    assert rebuilt.contains("CHAT")
+    rebuilt.close()
+
+
+def test_eviction_keeps_most_recent(tmp_path):
+    """Old builds are evicted once the directory exceeds its size limit."""
+    cache = LexiconCache(str(tmp_path / "cache"), max_bytes=1)
+    paths = []
+    for i, word in enumerate(["CHAT", "CHIEN", "MAISON"]):
+        path = tmp_path / f"liste{i}.txt"
+        path.write_text(word + "\n", encoding="utf-8")
+        cache.get_or_build(str(path)).close()
+        paths.append(cache.path_for(cache.key_for(str(path))))
+    assert cache.entries() == [paths[-1]]
+    assert not os.path.exists(paths[0])
@@ -0,0 +1,48 @@
+"""Test suite for the lexicon statistics and memory report."""
+
+import json
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.gaddag import GADDAG
+from src.models.lexicon_stats import build_reports, collect_statistics, statistics_report
+from src.models.radix_gaddag import RadixGADDAG
+
+WORDS = ["CHAT", "CHATS", "CHIEN", "MAISON", "JARDIN", "TRAIN", "ART", "PAR", "PARA", "LE", "LES"]
+
+
+def test_counts_agree_across_backends():
+    """Letter-level counts do not depend on how the automaton is stored."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    reference = collect_statistics(gaddag)
+    assert reference['node_count'] == gaddag.get_statistics()['node_count']
+    assert reference['edge_count'] == gaddag.get_statistics()['transition_count']
+    assert sum(reference['fan_out'].values()) == sum(reference['depth'].values()) == \
+        reference['node_count']
+    assert reference['max_depth'] == max(len(word) for word in WORDS) + 1
+    for other in (FlatGADDAG.from_gaddag(gaddag), RadixGADDAG.from_gaddag(gaddag)):
+        assert collect_statistics(other) == reference
+
+
+def test_minimization_ratio():
+    """An unminimized GADDAG is its own prefix tree; the minimal one is much smaller."""
+    trie = collect_statistics(GADDAG.from_word_list(WORDS, incremental=False))
+    assert trie['node_count'] == trie['trie_node_count'] and trie['minimization_ratio'] == 1
+    minimal = collect_statistics(GADDAG.from_sorted_words(sorted(WORDS)))
+    assert minimal['trie_node_count'] == trie['trie_node_count']
+    assert minimal['minimization_ratio'] < 0.5
+
+
+def test_json_report(tmp_path):
+    """Reports are JSON-serialisable and carry memory and build figures per backend."""
+    source = tmp_path / "mots.txt"
+    source.write_text("\n".join(WORDS), encoding="utf-8")
+    reports = json.loads(json.dumps(build_reports(str(source), ["gaddag", "flat", "radix", "dawg"])))
+    assert [report['backend'] for report in reports] == ["GADDAG", "FlatGADDAG", "RadixGADDAG", "DAWG"]
+    for report in reports:
+        assert report['word_count'] == len(WORDS)
+        assert report['memory_bytes'] > 0 and report['build_seconds'] >= 0
+    gaddag, flat, radix = reports[0], reports[1], reports[2]
+    assert flat['memory_bytes'] < gaddag['memory_bytes']
+    assert radix['memory_bytes'] < gaddag['memory_bytes']
+    # Mêmes transitions lettre à lettre pour le GADDAG et sa version plate
+    assert flat['contains_hops'] == gaddag['contains_hops'] > radix['contains_hops']
+    assert statistics_report(GADDAG.from_word_list(WORDS))['build_seconds'] is None
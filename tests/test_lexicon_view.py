@@ -0,0 +1,80 @@
+"""Test suite for filtered lexicon views."""
+
+import pytest
+from src.models.board import Board
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.gaddag import GADDAG, ReadOnlyLexiconError, mask_letters
+from src.models.lexicon_view import LexiconView, word_numbering
+from src.models.types import Direction
+from src.modules.cbic import Placement, est_placement_valide
+from src.services.word_validator import WordValidator
+
+WORDS = ["CHAT", "CHATS", "CHIEN", "MAISON", "JARDIN", "TRAIN", "ART", "PAR",
+         "PARA", "LE", "LES", "TEST", "TE", "ES", "ST", "KIWI", "TES"]
+
+
+@pytest.fixture
+def gaddag():
+    return GADDAG.from_word_list(WORDS)
+
+
+def test_word_numbering_is_alphabetical_rank(gaddag):
+    """Ranks follow iter_words order on every backend; unknown words have no rank."""
+    for lexicon in (gaddag, FlatGADDAG.from_gaddag(gaddag)):
+        numbering = word_numbering(lexicon)
+        assert numbering.count == len(WORDS)
+        assert [numbering.rank(word) for word in lexicon.iter_words()] == list(range(len(WORDS)))
+        assert numbering.rank("CHA") is None and numbering.rank("ZZZ") is None
+
+
+def test_views_filter_queries(gaddag):
+    """Views restrict membership, enumeration, skeleton search and cross-checks."""
+    long_words = LexiconView.by_length(gaddag, 4, 5)
+    assert list(long_words.iter_words()) == sorted(w for w in WORDS if 4 <= len(w) <= 5)
+    assert long_words.contains("chat") and not long_words.contains("ART")
+    assert long_words.find_words_with_skeleton({0: "T"}, "ESTR") == ["TEST"]
+    assert mask_letters(long_words.cross_check("TE", "")) == set()
+    assert mask_letters(gaddag.cross_check("TE", "")) == {"S"}
+
+    personal = LexiconView.from_words(gaddag, ["chat", "kiwi", "absent"])
+    assert list(personal.iter_words()) == ["CHAT", "KIWI"]
+    common = long_words & LexiconView.excluding_letters(gaddag, "KW")
+    assert "KIWI" not in list(common.iter_words()) and common.contains("CHATS")
+    assert common.word_count == 6
+    with pytest.raises(ReadOnlyLexiconError):
+        common.add_word("CHIENS")
+
+
+def test_criteria_views_do_not_scan_words(gaddag, monkeypatch):
+    """Length and letter views are composed from shared bitsets, not by re-reading the lexicon."""
+    LexiconView.by_length(gaddag, 2)  # indexe une fois les longueurs et les lettres
+    monkeypatch.setattr(gaddag, "iter_words", lambda lexicon=None: pytest.fail("lexicon scanned"))
+    view = LexiconView.by_length(gaddag, 4, 5) & LexiconView.excluding_letters(gaddag, "KW")
+    assert view.word_count == 6
+    assert view.accepts("CHATS") and not view.accepts("KIWI") and not view.accepts("ART")
+    numbering = word_numbering(gaddag)
+    assert numbering.length_bits(2, 2) == sum(1 << numbering.rank(word) for word in WORDS if len(word) == 2)
+
+
+def test_views_plug_into_validation(gaddag):
+    """WordValidator and CBIC accept a view wherever a GADDAG is expected."""
+    board = Board()
+    for i, letter in enumerate("TEST"):
+        board.place_letter(7, 7 + i, letter)
+    # ES sous TE : forme les mots croisés TE et ES, de deux lettres
+    placement = Placement("ES", (8, 7), Direction.HORIZONTAL, [], (8, 7), "")
+    assert est_placement_valide(placement, board, gaddag)
+    assert not est_placement_valide(placement, board, LexiconView.by_length(gaddag, 3))
+
+    validator = WordValidator(board, LexiconView.excluding_letters(gaddag, "K"))
+    assert validator.is_valid_word("CHAT") and not validator.is_valid_word("KIWI")
+
+
+def test_views_follow_base_updates(gaddag):
+    """Ranks shift when the base lexicon changes; views recompute their bitset."""
+    view = LexiconView.by_length(gaddag, 5, 5)
+    assert view.word_count == 3
+    gaddag.add_word("ARBRE")
+    gaddag.update(remove=["CHIEN"])
+    assert list(view.iter_words()) == ["ARBRE", "CHATS", "TRAIN"]
+    assert view.contains("ARBRE") and not view.contains("CHIEN")
@@ -11,7 +11,14 @@ __all__ = [
     'test_anchor_points',
     'test_word_generation',
     'test_random_racks',
-    'test_generation_coups'
+    'test_generation_coups',
+    'test_gordon_matches_brute_force',
+    'test_gordon_scores',
+    'test_best_moves_match_full_generation',
+    'test_scores_follow_board_changes',
+    'test_parallel_generation_matches_sequential',
+    'test_parallel_generation_without_fork',
+    'test_generation_over_lexicon_view'
 ]
 
 def setup_test_board() -> Board:
@@ -109,7 +116,7 @@ def test_word_generation():
     generator = MoveGenerator(gaddag, board)
     test_cases = [
         ("ART", 1),   # Devrait trouver au moins ART
-        ("PARA", 2),  # Devrait trouver PAR et PARA
+        ("PARA", 1),  # ART sur le T ; PAR et PARA formeraient des mots croisés invalides
         ("XYZ", 0),   # Ne devrait rien trouver
     ]
     
@@ -184,6 +191,211 @@ def test_generation_coups(gaddag: GADDAG, board: Board, rack: str) -> None:
         for i, move in enumerate(moves[:5], 1):
             print(f"{i}. {move}")
 
+
+def brute_force_moves(gaddag: GADDAG, board: Board, words, rack: str):
+    """Énumère les coups par force brute : chaque mot, à chaque position, jetons ou jokers."""
+    from itertools import product
+
+    def cross_word(row, col, letter, direction):
+        dr, dc = (1, 0) if direction == Direction.HORIZONTAL else (0, 1)
+        before, after = "", ""
+        r, c = row - dr, col - dc
+        while board.get_letter(r, c):
+            before = board.get_letter(r, c) + before
+            r, c = r - dr, c - dc
+        r, c = row + dr, col + dc
+        while board.get_letter(r, c):
+            after += board.get_letter(r, c)
+            r, c = r + dr, c + dc
+        return before, after
+
+    found = set()
+    for word, direction, row, col in product(words, Direction, range(board.size), range(board.size)):
+        dr, dc = (0, 1) if direction == Direction.HORIZONTAL else (1, 0)
+        end_row, end_col = row + dr * (len(word) - 1), col + dc * (len(word) - 1)
+        if end_row >= board.size or end_col >= board.size:
+            continue
+        if board.get_letter(row - dr, col - dc) or board.get_letter(end_row + dr, end_col + dc):
+            continue
+        squares = [(row + dr * i, col + dc * i) for i in range(len(word))]
+        if any(board.get_letter(r, c) and board.get_letter(r, c) != letter
+               for (r, c), letter in zip(squares, word)):
+            continue
+        free = [i for i, (r, c) in enumerate(squares) if not board.get_letter(r, c)]
+        if not free:
+            continue
+        if board.is_empty():
+            if (board.center, board.center) not in squares:
+                continue
+        elif not any(board.is_adjacent_to_letter(*squares[i]) for i in free):
+            continue
+        crosses = [cross_word(*squares[i], word[i], direction) for i in free]
+        if not all(not (before or after) or gaddag.contains(before + word[i] + after)
+                   for i, (before, after) in zip(free, crosses)):
+            continue
+        # Un jeton seul qui forme aussi un mot horizontal n'est compté qu'à l'horizontale
+        if len(free) == 1 and direction == Direction.VERTICAL and any(crosses[0]):
+            continue
+        for blanks in product((False, True), repeat=len(free)):
+            played = list(word)
+            for i, blank in zip(free, blanks):
+                if blank:
+                    played[i] = word[i].lower()
+            tiles = Rack(rack)
+            if tiles.remove_letters(''.join('_' if played[i].islower() else played[i] for i in free)):
+                found.add((''.join(played), row, col, direction))
+    return found
+
+
+def test_gordon_matches_brute_force():
+    """Le générateur produit exactement les coups valides, chacun une seule fois."""
+    words = ["ART", "PAR", "THE", "SUR", "PARA", "TA", "AT", "RAT", "TAR", "ETA",
+             "HE", "EH", "ES", "SE", "TES", "HES", "ARE", "ERE", "TRES"]
+    gaddag = GADDAG.from_word_list(words)
+    board = setup_test_board()
+    for row, col, letter in [(6, 9, "S"), (8, 9, "S"), (9, 9, "E")]:
+        board.place_letter(row, col, letter)
+    generator = MoveGenerator(gaddag, board)
+    for rack in ["PARA_", "TRES", "AEHRST", ""]:
+        moves = generator.generate_moves(rack)
+        found = [(move.word, move.row, move.col, move.direction) for move in moves]
+        assert len(found) == len(set(found))
+        assert set(found) == brute_force_moves(gaddag, board, words, rack), rack
+
+    empty = MoveGenerator(gaddag, Board())
+    opening = {(move.word, move.row, move.col, move.direction) for move in empty.generate_moves("RAT")}
+    assert opening == brute_force_moves(gaddag, Board(), words, "RAT")
+    assert ("RAT", 7, 5, Direction.HORIZONTAL) in opening
+
+
+def test_gordon_scores():
+    """Score du mot principal, des mots croisés, jokers nuls et bonus de 50 points."""
+    gaddag = GADDAG.from_word_list(["THE", "TA", "AT", "PARA", "ARBRE", "ABRITER", "REBAT"])
+    board = setup_test_board()
+    moves = {(move.word, move.row, move.col, move.direction): move.score
+             for move in MoveGenerator(gaddag, board).generate_moves("PARA_")}
+    # PARA en G5 : R lettre double, A au-dessus du T forme AT
+    assert moves[("PARA", 6, 4, Direction.HORIZONTAL)] == 6 + 1 + 2
+    assert moves[("pARA", 6, 4, Direction.HORIZONTAL)] == 3 + 1 + 2
+
+    opening = MoveGenerator(gaddag, Board()).generate_moves("ABRITER")
+    scores = {(move.word, move.row, move.col, move.direction): move.score for move in opening}
+    # ABRITER en H2 : R en lettre double (H4), mot compte double (H8), bingo
+    assert scores[("ABRITER", 7, 1, Direction.HORIZONTAL)] == (1 + 3 + 2 + 1 + 1 + 1 + 1) * 2 + 50
+
+
+def test_best_moves_match_full_generation():
+    """Le top-K élagué par bornes donne les mêmes scores que le tri de tous les coups."""
+    words = ["ART", "PAR", "THE", "SUR", "PARA", "TA", "AT", "RAT", "TAR", "ETA",
+             "HE", "EH", "ES", "SE", "TES", "HES", "ARE", "ERE", "TRES", "TETRA", "TERRAS"]
+    gaddag = GADDAG.from_word_list(words)
+    board = setup_test_board()
+    generator = MoveGenerator(gaddag, board)
+    for rack in ["PARA_", "TRES", "AEHRST", "ZZ"]:
+        every = sorted((move.score for move in generator.iter_moves(rack)), reverse=True)
+        for limit in (1, 3, 10):
+            best = generator.best_moves(rack, limit)
+            assert [move.score for move in best] == every[:limit], (rack, limit)
+    assert generator.best_moves("AEHRST", 0) == []
+
+
+def test_scores_follow_board_changes():
+    """Après un coup, les scores utilisent les points des mots croisés mis à jour."""
+    words = ["THE", "TA", "AT", "ES", "SE", "TES", "HES", "ETA", "RAT", "ART", "TAR"]
+    gaddag = GADDAG.from_word_list(words)
+    board = setup_test_board()
+    generator = MoveGenerator(gaddag, board)
+    generator.generate_moves("AERST")
+    board.apply_move(Move("ES", 8, 9, Direction.HORIZONTAL), 0)
+    incremental = {(move.word, move.row, move.col, move.direction): move.score
+                   for move in generator.generate_moves("AERST")}
+    fresh = {(move.word, move.row, move.col, move.direction): move.score
+             for move in MoveGenerator(gaddag, board).generate_moves("AERST")}
+    assert incremental == fresh
+    # ES sous ES : le E forme SE avec le S posé au coup précédent
+    assert incremental[("ES", 9, 10, Direction.HORIZONTAL)] == 2 + 2
+
+
+def test_parallel_generation_matches_sequential(monkeypatch):
+    """Le calcul réparti par ancres rend les mêmes coups, dans le même ordre."""
+    from src.services import move_generator
+
+    words = ["ART", "PAR", "THE", "SUR", "PARA", "TA", "AT", "RAT", "TAR", "ETA",
+             "HE", "EH", "ES", "SE", "TES", "HES", "ARE", "ERE", "TRES", "TETRA", "TERRAS"]
+    gaddag = GADDAG.from_word_list(words)
+    board = setup_test_board()
+    generator = MoveGenerator(gaddag, board)
+    sequential = generator.generate_moves("TRES_A")
+    # Petit plateau : calcul dans le processus courant
+    assert generator.generate_moves("TRES_A", workers=2) == sequential
+    monkeypatch.setattr(move_generator, "PARALLEL_MIN_ANCHORS", 0)
+    assert generator.generate_moves("TRES_A", workers=2) == sequential
+    assert generator.generate_moves("", workers=2) == []
+    # Une ancre peut être partagée entre tâches : les tranches se recollent dans l'ordre
+    shards = generator._shards(gaddag.rack_counts("TRES_A"), 8)
+    anchors = [(direction, index, anchor) for direction, index, groups in shards
+               for anchor, _ in groups]
+    assert len(anchors) > len(set(anchors))
+    move_generator._init_worker(generator, "TRES_A")
+    found = [(word, direction, index, pos, score) for direction, index, groups in shards
+             for word, pos, score in move_generator._shard_moves((direction, index, groups))]
+    assert found == [(move.word, move.direction,
+                      move.row if move.direction == Direction.HORIZONTAL else move.col,
+                      move.col if move.direction == Direction.HORIZONTAL else move.row, move.score)
+                     for move in sequential]
+
+
+def test_parallel_generation_without_fork(monkeypatch, tmp_path):
+    """Without fork, workers map a compiled lexicon file; an in-memory lexicon stays sequential."""
+    from src.models.flat_gaddag import FlatGADDAG
+    from src.services import move_generator
+
+    words = ["ART", "PAR", "THE", "SUR", "PARA", "TA", "AT", "RAT", "TAR", "ETA",
+             "HE", "EH", "ES", "SE", "TES", "HES", "ARE", "ERE", "TRES", "TETRA", "TERRAS"]
+    gaddag = GADDAG.from_word_list(words)
+    board = setup_test_board()
+    monkeypatch.setattr(move_generator, "PARALLEL_MIN_ANCHORS", 0)
+    monkeypatch.setattr(move_generator.multiprocessing, "get_all_start_methods",
+                        lambda: ["spawn", "forkserver"])
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("pool créé pour un lexique en mémoire")
+
+    generator = MoveGenerator(gaddag, board)
+    sequential = generator.generate_moves("TRES_A")
+    with monkeypatch.context() as patch:
+        patch.setattr(move_generator, "ProcessPoolExecutor", no_pool)
+        assert generator.generate_moves("TRES_A", workers=2) == sequential
+
+    path = str(tmp_path / "mots.gdg")
+    FlatGADDAG.from_gaddag(gaddag).save(path)
+    flat = FlatGADDAG.open(path)
+    try:
+        generator = MoveGenerator(flat, board)
+        assert generator._pool_setup("TRES_A")[0].get_start_method() == "spawn"
+        assert generator.generate_moves("TRES_A", workers=2) == generator.generate_moves("TRES_A")
+    finally:
+        flat.close()
+
+
+def test_generation_over_lexicon_view():
+    """Sur une vue, seuls les mots acceptés par la vue sont produits."""
+    from src.models.lexicon_view import LexiconView
+
+    gaddag = GADDAG.from_word_list(["ART", "AT", "RAT", "TA", "TAR", "RATS", "STAR", "ARTS", "TARS"])
+    view = LexiconView(gaddag, lambda word: len(word) == 4)
+    moves = MoveGenerator(view, Board()).generate_moves("ARTS")
+    assert moves and all(len(move.word) == 4 and view.accepts(move.word.upper()) for move in moves)
+    assert {move.word for move in moves} == {"RATS", "STAR", "ARTS", "TARS"}
+    # Jetons et jokers : mêmes mots que sur un lexique construit avec les seuls mots de 4 lettres
+    rebuilt = GADDAG.from_word_list(["RATS", "STAR", "ARTS", "TARS"])
+    board = Board()
+    board.place_letter(7, 7, "T")
+    assert ({(m.word, m.row, m.col, m.direction, m.score)
+             for m in MoveGenerator(view, board).generate_moves("AR_S")}
+            == {(m.word, m.row, m.col, m.direction, m.score)
+                for m in MoveGenerator(rebuilt, board).generate_moves("AR_S")})
+
 if __name__ == "__main__":
     print("=== Tests du générateur de coups ===")
     test_cross_words()
@@ -191,3 +403,8 @@ if __name__ == "__main__":
     test_word_generation()
     test_score_calculation()
     test_random_racks()
+    test_gordon_matches_brute_force()
+    test_gordon_scores()
+    test_best_moves_match_full_generation()
+    test_scores_follow_board_changes()
+    test_generation_over_lexicon_view()
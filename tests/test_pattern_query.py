@@ -0,0 +1,67 @@
+"""Test suite for wildcard pattern queries."""
+
+import re
+import pytest
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.gaddag import GADDAG
+from src.models.lexicon_view import LexiconView
+from src.models.pattern_query import PatternQuery
+from src.models.query_cache import QueryCache
+from src.models.radix_gaddag import RadixGADDAG
+
+WORDS = ["BAGUETTE", "BALLOT", "BANQUET", "BASALT", "BRAVER", "CAFARD", "CALER", "CAREME",
+         "CIRQUE", "COQ", "FAKIR", "FAQIR", "GAVER", "LAVER", "PAYER", "QAT", "QI", "RAVIER",
+         "SAKI", "TAPER", "VAGUE", "WAPITI"]
+
+PATTERNS = ["?A?ER*", "BA*T", "*Q*", "C*", "[^AEIOU]A*", "*[QK]I*", "???", "*", "*E*E*"]
+
+
+@pytest.fixture(scope="module")
+def backends():
+    gaddag = GADDAG.from_word_list(WORDS)
+    return [gaddag, FlatGADDAG.from_gaddag(gaddag), RadixGADDAG.from_gaddag(gaddag)]
+
+
+def expected(pattern, min_length=0, max_length=99, excluded="", required=""):
+    regex = re.compile(pattern.replace("?", ".").replace("*", ".*") + "$")
+    return sorted(word for word in WORDS if regex.match(word)
+                  and min_length <= len(word) <= max_length
+                  and not set(excluded) & set(word) and set(required) <= set(word))
+
+
+def test_matches_regex_on_every_backend(backends):
+    """Anchored and forward GADDAG traversals agree with a full scan."""
+    for lexicon in backends:
+        for pattern in PATTERNS:
+            assert lexicon.find_words_matching(pattern) == expected(pattern), pattern
+        assert lexicon.find_words_matching("BA*T", 7, 7) == ["BANQUET"]
+        assert lexicon.find_words_matching("*Q*", excluded="U") == expected("*Q*", excluded="U")
+        assert lexicon.find_words_matching("*", required="QA") == ["BANQUET", "FAQIR", "QAT"]
+        assert lexicon.find_words_matching("[a-c]*r", max_length=5) == ["CALER"]
+
+
+def test_streams_each_word_once(backends):
+    """Results are produced lazily and once, even when * allows several alignments."""
+    stream = backends[0].iter_words_matching("*A*")
+    assert next(stream) in WORDS
+    words = [next(stream)] + list(stream)
+    assert len(words) + 1 == len(expected("*A*")) and len(set(words)) == len(words)
+
+
+def test_invalid_patterns():
+    """Malformed patterns are rejected with ValueError."""
+    for pattern in ["", "A[BC", "A-B", "[]", "[Z-A]", "A1"]:
+        with pytest.raises(ValueError):
+            PatternQuery(pattern)
+    assert PatternQuery("A**B").key == PatternQuery("a*b").key
+
+
+def test_views_and_cache(backends):
+    """Pattern queries respect lexicon views and are memoised by QueryCache."""
+    gaddag = backends[0]
+    view = LexiconView.by_length(gaddag, 2, 3)
+    assert view.find_words_matching("*Q*") == ["COQ", "QAT", "QI"]
+    cache = QueryCache(gaddag)
+    assert cache.find_words_matching("*Q*", excluded="U") == expected("*Q*", excluded="U")
+    assert cache.find_words_matching("**Q**", excluded="u") == expected("*Q*", excluded="U")
+    assert cache.hits == 1 and cache.misses == 1
@@ -0,0 +1,50 @@
+"""Test suite for the LRU query cache."""
+
+from src.models.gaddag import GADDAG
+from src.models.query_cache import QueryCache
+
+WORDS = ["ARBRE", "AIMEE", "ANGE", "ALTERE", "TRAIN", "TRAME"]
+
+
+def test_canonical_keys_hit_the_cache():
+    """Equivalent queries (letter order, case) share one entry."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    cache = QueryCache(gaddag)
+    expected = gaddag.find_words_with_skeleton({0: 'A', 3: 'E'}, "NGE")
+    assert cache.find_words_with_skeleton({0: 'A', 3: 'E'}, "NGE") == expected
+    assert cache.find_words_with_skeleton({3: 'e', 0: 'a'}, ["G", "E", "N"]) == expected
+    assert cache.find_words_with_skeleton({0: 'A', 3: 'E'}, "NGEE") == expected
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.hit_rate == 1 / 3
+
+    cache.find_words_with_skeleton({0: 'A'}, "NGE").append("MUTATION")
+    assert "MUTATION" not in cache.find_words_with_skeleton({0: 'A'}, "NGE")
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Least recently used entries are dropped first, by count or by size."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    cache = QueryCache(gaddag, max_entries=2)
+    cache.find_words_with_skeleton({0: 'A'}, "RBRE")
+    cache.find_words_with_skeleton({0: 'T'}, "RAIN")
+    cache.find_words_with_skeleton({0: 'A'}, "RBRE")
+    cache.find_words_with_skeleton({0: 'T'}, "RAME")
+    assert cache.evictions == 1 and len(cache) == 2
+    cache.find_words_with_skeleton({0: 'A'}, "RBRE")
+    assert cache.hits == 2
+
+    small = QueryCache(gaddag, max_bytes=QueryCache.entry_size(["TRAIN"]))
+    small.find_words_with_skeleton({0: 'T'}, "RAIN")
+    small.find_words_with_skeleton({0: 'T'}, "RAME")
+    assert len(small) == 1 and small.evictions == 1
+    assert small.stats()['bytes'] <= small.max_bytes
+
+
+def test_invalidated_when_lexicon_changes():
+    """Adding a word clears stale results."""
+    gaddag = GADDAG.from_word_list(WORDS)
+    cache = QueryCache(gaddag)
+    assert cache.find_words_with_skeleton({0: 'T'}, "RAIE") == []
+    gaddag.add_word("TRIAE")
+    assert cache.find_words_with_skeleton({0: 'T'}, "RAIE") == ["TRIAE"]
+    assert cache.invalidations == 1 and cache.hits == 0
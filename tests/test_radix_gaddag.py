@@ -0,0 +1,73 @@
+"""Test suite for the path-compressed (radix) GADDAG backend."""
+
+import pytest
+from src.models.gaddag import GADDAG, ReadOnlyLexiconError
+from src.models.flat_gaddag import FlatGADDAG
+from src.models.radix_gaddag import RadixGADDAG
+
+WORDS = ["CHAT", "CHATS", "CHIEN", "MAISON", "JARDIN", "TRAIN", "TROP",
+         "TRAP", "TRIP", "STEP", "SHIP", "ART", "PAR", "PARA", "LE", "LES",
+         "CONSTITUTION"]
+
+
+@pytest.fixture
+def gaddag():
+    """Minimal node-based GADDAG used as reference."""
+    return GADDAG.from_word_list(WORDS, incremental=True)
+
+
+@pytest.fixture
+def radix(gaddag):
+    return RadixGADDAG.from_gaddag(gaddag)
+
+
+def test_same_queries_as_gaddag(gaddag, radix):
+    """Membership, enumeration, skeleton search and cross-checks match the reference."""
+    for word in WORDS + ["CHA", "CHATSS", "CONSTITUTIONS", "château", "A"]:
+        assert radix.contains(word) == gaddag.contains(word), word
+    assert list(radix.iter_words()) == sorted(WORDS)
+    for skeleton, available in [({0: 'T', 4: 'N'}, "RAI"), ({0: 'C', 2: 'A'}, "HTS?"),
+                                ({8: 'T'}, "CONSIUTION??")]:
+        assert radix.find_words_with_skeleton(skeleton, available) == \
+            gaddag.find_words_with_skeleton(skeleton, available)
+    for prefix, suffix in [("CHA", ""), ("", "RT"), ("CONSTITUTIO", "")]:
+        assert radix.cross_check(prefix, suffix) == gaddag.cross_check(prefix, suffix)
+
+
+def test_chains_are_collapsed(gaddag, radix):
+    """Unary chains become labelled edges; walks may stop inside an edge."""
+    stats = radix.get_statistics()
+    reference = gaddag.get_statistics()
+    assert stats['node_count'] < reference['node_count'] // 2
+    # Un suffixe partagé est lu par chaque arête qui y mène, mais stocké une fois
+    assert stats['transition_count'] < reference['transition_count'] <= stats['label_length']
+    assert stats['label_pool_bytes'] < stats['label_length']
+
+    state = radix.walk("CONSTI", radix.forward_state())
+    # Position à l'intérieur d'une arête : un entier négatif, aucun objet alloué
+    assert isinstance(state, int) and state < 0 and not radix.is_terminal_state(state)
+    assert radix.walk("TUT", state) == radix.step(radix.step(radix.step(state, "T"), "U"), "T")
+    assert radix.get_possible_letters("eCONSTI") == {"T"}
+    assert radix.is_terminal_state(radix.walk("TUTION", state))
+    assert radix.annotation(state)[1:] == (6, 6)
+
+
+def test_compiles_to_flat_and_read_only(gaddag, radix):
+    """Flat compilation expands edges back to one state per letter."""
+    flat = FlatGADDAG.from_gaddag(radix)
+    # Les chaînes partagées par la minimisation sont dépliées arête par arête
+    assert flat.get_statistics()['node_count'] >= gaddag.get_statistics()['node_count']
+    assert list(flat.iter_words()) == sorted(WORDS)
+    with pytest.raises(ReadOnlyLexiconError):
+        radix.add_word("TABLE")
+
+
+def test_memory_and_hops_against_flat(gaddag, radix):
+    """Labels are stored flat: radix is smaller than the node GADDAG and needs fewer hops than flat."""
+    flat = FlatGADDAG.from_gaddag(gaddag)
+    assert radix.memory_usage() < gaddag.memory_usage()
+    assert radix.memory_usage() < 2 * flat.memory_usage()
+    sequence = GADDAG.DELIMITER + "CONSTITUTION"
+    assert flat.walk_hops(sequence) == gaddag.walk_hops(sequence) == len(sequence)
+    assert radix.walk_hops(sequence) < len(sequence) // 2
+    assert sum(map(radix.walk_hops, WORDS)) < sum(map(flat.walk_hops, WORDS))